@@ -0,0 +1,175 @@
+#!/usr/bin/python3
+"""ASGI entry point of the API, serving the same /api/v1 routes as app.py
+
+    uvicorn api.v1.asgi:application
+
+The event loop reads every request body and writes every response, so
+that slow clients only cost a connection, not a thread: the views run on
+a pool of HBNB_API_THREADS (32) threads once the whole body has arrived,
+and hand back their whole response. Only streamed responses (?stream=1)
+keep their thread until the client has read them.
+
+A request body over HBNB_API_MAX_BODY bytes (32 MiB) gets 413 Payload Too
+Large, as soon as its Content-Length or the bytes received so far tell.
+
+storage is the awaitable AsyncStorage of models.storage, running on the
+same pool, for code written against the event loop.
+"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import io
+import json
+import os
+import sys
+from api.v1.app import app
+import models
+from models.engine.aio import AsyncStorage
+
+executor = ThreadPoolExecutor(int(os.getenv("HBNB_API_THREADS", "32")),
+                              thread_name_prefix="hbnb-api")
+storage = AsyncStorage(models.storage, executor)
+MAX_BODY = int(os.getenv("HBNB_API_MAX_BODY", str(32 * 1024 * 1024)))
+
+
+def build_environ(scope, body):
+    """returns the WSGI environ of the HTTP request of scope and body"""
+    root = scope.get("root_path", "")
+    path = scope["path"]
+    if root and path.startswith(root):
+        path = path[len(root):]
+    server = scope.get("server") or ("localhost", 80)
+    environ = {
+        "REQUEST_METHOD": scope["method"],
+        "SCRIPT_NAME": root.encode("utf-8").decode("latin-1"),
+        "PATH_INFO": path.encode("utf-8").decode("latin-1"),
+        "QUERY_STRING": scope.get("query_string", b"").decode("latin-1"),
+        "SERVER_NAME": str(server[0]),
+        "SERVER_PORT": str(server[1] or 80),
+        "SERVER_PROTOCOL": "HTTP/" + scope.get("http_version", "1.1"),
+        "wsgi.version": (1, 0),
+        "wsgi.url_scheme": scope.get("scheme", "http"),
+        "wsgi.input": io.BytesIO(body),
+        "wsgi.input_terminated": True,
+        "wsgi.errors": sys.stderr,
+        "wsgi.multithread": True,
+        "wsgi.multiprocess": False,
+        "wsgi.run_once": False,
+    }
+    if scope.get("client"):
+        environ["REMOTE_ADDR"] = scope["client"][0]
+        environ["REMOTE_PORT"] = str(scope["client"][1])
+    for name, value in scope.get("headers", []):
+        name = name.decode("latin-1").upper().replace("-", "_")
+        if name not in ("CONTENT_TYPE", "CONTENT_LENGTH"):
+            name = "HTTP_" + name
+        value = value.decode("latin-1")
+        if name in environ:
+            value = environ[name] + "," + value
+        environ[name] = value
+    # the whole body is here, also when it came chunked without a length
+    environ["CONTENT_LENGTH"] = str(len(body))
+    return environ
+
+
+def respond(environ, send, loop):
+    """runs the WSGI app on environ, on a thread of the pool
+
+    Returns the response start message and body of a response with a
+    Content-Length; any other one is streamed from this thread through
+    send on the event loop loop, and None returned.
+    """
+    started = {}
+
+    def start_response(status, headers, exc_info=None):
+        """records the status and headers of the response"""
+        started["status"] = int(status.split(" ", 1)[0])
+        started["headers"] = [(name.lower().encode("latin-1"),
+                               value.encode("latin-1"))
+                              for name, value in headers]
+    result = app(environ, start_response)
+    try:
+        start = dict(started, type="http.response.start")
+        if any(name == b"content-length" for name, value in start["headers"]):
+            return start, b"".join(result)
+        asyncio.run_coroutine_threadsafe(send(start), loop).result()
+        for chunk in result:
+            if chunk:
+                asyncio.run_coroutine_threadsafe(send({
+                    "type": "http.response.body", "body": chunk,
+                    "more_body": True}), loop).result()
+        asyncio.run_coroutine_threadsafe(send({
+            "type": "http.response.body", "body": b""}), loop).result()
+        return None
+    finally:
+        if hasattr(result, "close"):
+            result.close()
+
+
+def content_length(scope):
+    """returns the Content-Length of the request of scope, None if absent
+    or invalid"""
+    for name, value in scope.get("headers", []):
+        if name.lower() == b"content-length":
+            try:
+                return int(value)
+            except ValueError:
+                return None
+    return None
+
+
+async def too_large(send):
+    """answers 413 Payload Too Large"""
+    body = json.dumps({"error": "Payload Too Large"}).encode()
+    await send({"type": "http.response.start", "status": 413,
+                "headers": [(b"content-type", b"application/json"),
+                            (b"content-length", str(len(body)).encode())]})
+    await send({"type": "http.response.body", "body": body})
+
+
+async def lifespan(receive, send):
+    """answers the startup and shutdown of the server"""
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            executor.shutdown(wait=False)
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+
+async def application(scope, receive, send):
+    """the ASGI application"""
+    if scope["type"] == "lifespan":
+        return await lifespan(receive, send)
+    if scope["type"] != "http":
+        return
+    length = content_length(scope)
+    if length is not None and length > MAX_BODY:
+        return await too_large(send)
+    body = []
+    size = 0
+    while True:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            return
+        chunk = message.get("body", b"")
+        size += len(chunk)
+        if size > MAX_BODY:
+            return await too_large(send)
+        body.append(chunk)
+        if not message.get("more_body"):
+            break
+    loop = asyncio.get_running_loop()
+    response = await loop.run_in_executor(
+        executor, respond, build_environ(scope, b"".join(body)), send, loop)
+    if response is not None:
+        start, body = response
+        await send(start)
+        await send({"type": "http.response.body", "body": body})
+
+
+if __name__ == "__main__":
+    import uvicorn
+    uvicorn.run(application, host=os.getenv("HBNB_API_HOST", "0.0.0.0"),
+                port=int(os.getenv("HBNB_API_PORT", "5000")))
@@ -0,0 +1,216 @@
+#!/usr/bin/python3
+"""Production entry point of the API: a preforking WSGI server
+
+    python3 -m api.v1.prefork [--workers N] [--host HOST] [--port PORT]
+
+The master loads models.storage and builds its indexes once, then forks
+the workers: they share its memory copy-on-write instead of each loading
+the storage again, and accept connections from the same listening
+socket, one request at a time each. For many slow clients, see asgi.py.
+
+SIGHUP reloads gracefully: the master reloads the storage, forks a new
+set of workers, and the old ones exit once done with their request.
+SIGTERM and SIGINT stop the workers the same way, then the master. A
+worker that dies is replaced.
+
+Every worker holds its own copy of a file storage from then on, and only
+sees what another one saved when it reloads the JSON file after its next
+request, so several workers suit a read-mostly file storage; writes from
+all of them belong in the database. For the same reason, the entity tags
+of a file storage are each worker's own: a tag one worker gave never
+matches on another, and clients just get the full response again. A
+worker writes the saves still in their commit window before it exits.
+
+HBNB_API_HOST and HBNB_API_PORT are read as by app.py, HBNB_API_WORKERS
+sets the number of workers, by default the number of CPUs available.
+"""
+import argparse
+import gc
+import os
+import select
+import signal
+import socket
+import threading
+import traceback
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer
+from api.v1.app import app
+import models
+from models.amenity import Amenity
+from models.city import City
+from models.place import Place
+from models.review import Review
+from models.state import State
+from models.user import User
+
+
+class RequestHandler(WSGIRequestHandler):
+    """request handler of the workers, logging requests if access_log"""
+    access_log = False
+
+    def log_request(self, code="-", size="-"):
+        """logs the request if access_log is set"""
+        if self.access_log:
+            super().log_request(code, size)
+
+
+def cpu_count():
+    """returns the number of CPUs this process may run on"""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def warm():
+    """loads the storage and its lazy indexes, then keeps the garbage
+    collector off the loaded objects, so that their pages stay shared"""
+    gc.unfreeze()
+    models.storage.reload()
+    for cls in (Amenity, City, Place, Review, State, User):
+        models.storage.page(cls, 1)
+    models.storage.close()
+    gc.collect()
+    gc.freeze()
+
+
+class Master:
+    """forks and supervises the workers serving app on one socket"""
+
+    def __init__(self, host, port, workers):
+        """prepares to serve on host:port with workers workers"""
+        self.host = host
+        self.port = port
+        self.count = workers
+        self.workers = set()
+        self.retiring = set()
+        self.signals = []
+
+    def run(self):
+        """serves until SIGTERM or SIGINT"""
+        self.listener = socket.create_server((self.host, self.port),
+                                             backlog=1024)
+        self.wakeup, wakeup = os.pipe()
+        os.set_blocking(wakeup, False)
+        signal.set_wakeup_fd(wakeup)
+        for sig in (signal.SIGHUP, signal.SIGTERM, signal.SIGINT,
+                    signal.SIGCHLD):
+            signal.signal(sig, self.__signal)
+        warm()
+        self.__spawn()
+        while True:
+            select.select([self.wakeup], [], [])
+            os.read(self.wakeup, 512)
+            signals, self.signals = self.signals, []
+            self.__reap()
+            if signal.SIGTERM in signals or signal.SIGINT in signals:
+                break
+            if signal.SIGHUP in signals:
+                self.__reload()
+            self.__spawn()
+        self.__stop()
+
+    def __signal(self, signum, frame):
+        """records signum for the main loop, woken up by set_wakeup_fd"""
+        self.signals.append(signum)
+
+    def __spawn(self):
+        """forks workers until there are count of them"""
+        while len(self.workers) < self.count:
+            pid = os.fork()
+            if pid == 0:
+                code = 1
+                try:
+                    self.__work()
+                    code = 0
+                except BaseException:
+                    traceback.print_exc()
+                finally:
+                    os._exit(code)
+            self.workers.add(pid)
+
+    def __reap(self):
+        """forgets the workers that exited"""
+        while self.workers or self.retiring:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if pid == 0:
+                return
+            self.workers.discard(pid)
+            self.retiring.discard(pid)
+
+    def __reload(self):
+        """reloads the storage, then replaces the workers"""
+        warm()
+        for pid in self.workers:
+            os.kill(pid, signal.SIGTERM)
+        self.retiring |= self.workers
+        self.workers = set()
+
+    def __stop(self):
+        """lets every worker finish its request, then waits for them"""
+        for pid in self.workers | self.retiring:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        for pid in self.workers | self.retiring:
+            try:
+                os.waitpid(pid, 0)
+            except ChildProcessError:
+                pass
+        self.listener.close()
+
+    def __work(self):
+        """serves requests in a forked worker until SIGTERM or SIGINT"""
+        signal.set_wakeup_fd(-1)
+        os.close(self.wakeup)
+        signal.signal(signal.SIGHUP, signal.SIG_IGN)
+        signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+        if models.storage_t == "db":
+            models.storage.dispose(close=False)
+        server = WSGIServer(self.listener.getsockname(), RequestHandler,
+                            bind_and_activate=False)
+        server.socket.close()
+        server.socket = self.listener
+        server.server_name = socket.getfqdn(self.host)
+        server.server_port = self.listener.getsockname()[1]
+        server.setup_environ()
+        server.set_app(app)
+
+        def stop(signum, frame):
+            """stops accepting connections once the current one is done"""
+            threading.Thread(target=server.shutdown).start()
+        signal.signal(signal.SIGTERM, stop)
+        signal.signal(signal.SIGINT, stop)
+        try:
+            server.serve_forever()
+        finally:
+            # os._exit() would lose the saves waiting for their commit
+            # window, whose timer thread it does not wait for; a forced
+            # reload writes them, and only them
+            if models.storage_t == "db":
+                models.storage.close()
+            else:
+                models.storage.reload(force=True)
+
+
+def main():
+    """parses the options and runs the master"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default=os.getenv("HBNB_API_HOST",
+                                                    "0.0.0.0"))
+    parser.add_argument("--port", type=int,
+                        default=int(os.getenv("HBNB_API_PORT", "5000")))
+    parser.add_argument("--workers", type=int,
+                        default=int(os.getenv("HBNB_API_WORKERS", "0")) or
+                        cpu_count())
+    parser.add_argument("--access-log", action="store_true",
+                        help="log every request on stderr")
+    args = parser.parse_args()
+    RequestHandler.access_log = args.access_log
+    Master(args.host, args.port, args.workers).run()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,20 +1,31 @@
 #!/usr/bin/python3
 """View for Amenity objects that handles default API actions."""
 from api.v1.views import app_views
+from api.v1.views.caching import conditional, entity_tag
+from api.v1.views.pagination import page_request, page_response
+from api.v1.views.streaming import stream_request, stream_response
 from flask import jsonify, abort, make_response, request
 from models import storage
 from models.amenity import Amenity
 
 
 @app_views.route("/amenities", methods=["GET"], strict_slashes=False)
+@conditional(lambda: entity_tag(Amenity), cache=True)
 def get_amenities():
     """Retrieves the list of all Amenity objects."""
+    page = page_request()
+    if page is not None:
+        limit, after = page
+        return page_response(storage.page(Amenity, limit + 1, after), limit)
+    if stream_request():
+        return stream_response(storage.stream(Amenity))
     d_amenities = storage.all(Amenity)
     return jsonify([obj.to_dict() for obj in d_amenities.values()])
 
 
 @app_views.route("/amenities/<amenity_id>", methods=["GET"],
                  strict_slashes=False)
+@conditional(lambda amenity_id: entity_tag(storage.get(Amenity, amenity_id)))
 def get_amenity(amenity_id):
     """Retrieves an Amenity object."""
     amenity = storage.get(Amenity, amenity_id)
@@ -62,5 +73,5 @@ def put_amenity(amenity_id):
     for key, value in data.items():
         if key not in {"id", "created_at", "updated_at"}:
             setattr(amenity, key, value)
-    storage.save()
+    amenity.save()
     return make_response(jsonify(amenity.to_dict()), 200)
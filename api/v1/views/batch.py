@@ -0,0 +1,204 @@
+#!/usr/bin/python3
+"""Batch endpoint applying many creates, updates and deletes at once"""
+
+from api.v1.views import app_views
+from datetime import datetime, timezone
+from flask import abort, jsonify, request
+from models import storage, storage_t
+from models.amenity import Amenity
+from models.city import City
+from models.place import Place
+from models.review import Review
+from models.state import State
+from models.user import User
+
+MAX_ITEMS = 100000
+
+classes = {"Amenity": Amenity, "City": City, "Place": Place,
+           "Review": Review, "State": State, "User": User}
+
+# class name -> attributes a create must have, in the order they are checked
+required = {"Amenity": ("name",),
+            "City": ("state_id", "name"),
+            "Place": ("city_id", "user_id", "name"),
+            "Review": ("place_id", "user_id", "text"),
+            "State": ("name",),
+            "User": ("email", "password")}
+
+# class name -> {attribute: class name of the object it refers to}
+parents = {"City": {"state_id": "State"},
+           "Place": {"city_id": "City", "user_id": "User"},
+           "Review": {"place_id": "Place", "user_id": "User"}}
+
+# class name -> attributes an update leaves alone
+ignored = {"City": {"state_id"},
+           "Place": {"city_id", "user_id"},
+           "Review": {"place_id", "user_id"},
+           "User": {"email"}}
+
+# attributes that must be strings, besides the ids of parents
+strings = {"id", "password"}
+
+
+class BatchError(Exception):
+    """Raised when an item of a batch cannot be applied"""
+
+    def __init__(self, status, error):
+        """remembers the HTTP status and message of the item"""
+        super().__init__(error)
+        self.status = status
+        self.error = error
+
+
+def _lookup(name, obj_id, batch):
+    """returns the object name.obj_id as the batch leaves it, or None"""
+    key = "{}.{}".format(name, obj_id)
+    if key not in batch:
+        batch[key] = storage.get(classes[name], obj_id)
+    return batch[key]
+
+
+def _settable(cls, attr):
+    """tells if attr is an attribute of cls an item may set: not private,
+    and neither a method, property nor relationship of the class"""
+    if attr.startswith("_"):
+        return False
+    if not hasattr(cls, attr):
+        return True
+    if storage_t == "db":
+        return attr in cls.__table__.columns
+    value = getattr(cls, attr)
+    return not isinstance(value, property) and not callable(value)
+
+
+def _fits(column, attr, value):
+    """raises a BatchError if the database would refuse value in column"""
+    if value is None:
+        if not column.nullable:
+            raise BatchError(400, "{} cannot be null".format(attr))
+        return
+    kind = column.type.python_type
+    if kind is float:
+        kind = (int, float)
+    if not isinstance(value, kind) or \
+            (isinstance(value, bool) and kind is not bool):
+        raise BatchError(400, "Invalid {}".format(attr))
+    length = getattr(column.type, "length", None)
+    # the password column holds its hash, of a fixed length
+    if length and attr != "password" and len(value) > length:
+        raise BatchError(400, "{} is too long".format(attr))
+
+
+def _check(name, data, skip):
+    """raises a BatchError if data sets, besides the attributes of skip,
+    one that would fail or break the object once the batch is applied"""
+    cls = classes[name]
+    for attr, value in data.items():
+        if attr in skip:
+            continue
+        if not _settable(cls, attr):
+            raise BatchError(400, "Cannot set {}".format(attr))
+        if (attr in strings or attr in parents.get(name, {})) and \
+                not isinstance(value, str):
+            raise BatchError(400, "{} is not a string".format(attr))
+        if storage_t == "db" and attr in cls.__table__.columns:
+            _fits(cls.__table__.columns[attr], attr, value)
+
+
+def _prepare(item, batch):
+    """validates one item against storage and the items before it
+
+    Returns (op, key, obj, data) and records the outcome in batch, which maps
+    the keys looked up so far to their object, or None if deleted or absent.
+    """
+    if not isinstance(item, dict):
+        raise BatchError(400, "Not a JSON object")
+    op = item.get("op")
+    name = item.get("class")
+    data = item.get("data", {})
+    if op not in ("create", "update", "delete"):
+        raise BatchError(400, "Unknown op")
+    if name not in classes:
+        raise BatchError(400, "Unknown class")
+    if not isinstance(data, dict):
+        raise BatchError(400, "Not a JSON")
+    if op == "create":
+        for attr in required[name]:
+            if attr not in data:
+                raise BatchError(400, "Missing {}".format(attr))
+        _check(name, data, {"__class__", "created_at", "updated_at"})
+        for attr, parent in parents.get(name, {}).items():
+            if _lookup(parent, data[attr], batch) is None:
+                raise BatchError(404, "Not found")
+        obj = classes[name](**{attr: value for attr, value in data.items()
+                               if attr not in ("created_at", "updated_at")})
+        key = "{}.{}".format(name, obj.id)
+        if "id" in data and _lookup(name, obj.id, batch) is not None:
+            raise BatchError(400, "Duplicate id")
+    else:
+        if "id" not in item:
+            raise BatchError(400, "Missing id")
+        if not isinstance(item["id"], str):
+            raise BatchError(400, "id is not a string")
+        if op == "update":
+            _check(name, data, ignored.get(name, set()) |
+                   {"id", "created_at", "updated_at"})
+        obj = _lookup(name, item["id"], batch)
+        if obj is None:
+            raise BatchError(404, "Not found")
+        key = "{}.{}".format(name, obj.id)
+    batch[key] = None if op == "delete" else obj
+    return op, key, obj, data
+
+
+@app_views.route('/batch', methods=['POST'], strict_slashes=False)
+def post_batch():
+    """Applies a JSON array of operations, all or none of them
+
+    Each item is {"op": "create"|"update"|"delete", "class": <class name>,
+    "id": <id, for update and delete>, "data": {<attributes>}}. Items may
+    refer to objects created earlier in the same batch. Every item is
+    validated, its values against the columns in DB mode, before any is
+    applied, then storage is saved once.
+    """
+    items = request.get_json(force=True, silent=True)
+    if not isinstance(items, list):
+        abort(400, description="Not a JSON array")
+    if len(items) > MAX_ITEMS:
+        abort(413)
+    batch = {}
+    prepared = []
+    results = []
+    for item in items:
+        try:
+            prepared.append(_prepare(item, batch))
+            results.append({"status": 200})
+        except BatchError as e:
+            prepared.append(None)
+            results.append({"status": e.status, "error": e.error})
+    if None in prepared:
+        return jsonify(results), 400
+    # objects both created and deleted by the batch never reach storage,
+    # whereas a stored object deleted before its id is reused does leave it
+    created = {id(obj) for op, key, obj, data in prepared if op == "create"}
+    now = datetime.now(timezone.utc)
+    results = []
+    for op, key, obj, data in prepared:
+        if op == "delete":
+            if id(obj) not in created:
+                storage.delete(obj)
+            results.append({"status": 200})
+            continue
+        if op == "update":
+            skip = ignored.get(type(obj).__name__, set())
+            for attr, value in data.items():
+                if attr not in skip and attr not in ("id", "created_at",
+                                                     "updated_at"):
+                    setattr(obj, attr, value)
+            obj.updated_at = now
+        if batch[key] is not None:
+            storage.new(obj)
+        results.append({"status": 201 if op == "create" else 200,
+                        "object": obj.to_dict()})
+    storage.save()
+    return jsonify(results), 200
@@ -0,0 +1,178 @@
+#!/usr/bin/python3
+"""Conditional GET and response caching for the views
+
+A view decorated with conditional() gets an entity tag computed from what
+its response depends on: the storage.generation() of the classes of the
+objects it shows and of the classes it lists, a version every change to
+one of their objects increments. A client sending a matching
+If-None-Match gets 304 Not Modified before the view runs, so that nothing
+is loaded or serialised for it.
+
+With cache=True, the response itself is also kept under its entity tag.
+Since the tag changes as soon as storage adds, updates or deletes an
+object of a class the response depends on, an entry is never served once
+stale; it is simply no longer asked for. The in-process LRU pushes it out
+as newer responses come in; in Redis it expires HBNB_API_CACHE_TTL
+seconds after it was stored (an hour by default, 0 keeps it until Redis
+evicts it under its own maxmemory policy).
+
+HBNB_API_MAX_AGE sets how many seconds clients and proxies may reuse a
+response without asking again; by default they revalidate every time.
+HBNB_API_CACHE_SIZE sets how many responses the in-process LRU keeps (0
+disables it), HBNB_API_CACHE_URL a redis:// URL to share them between
+processes instead, if the redis package is installed.
+"""
+from functools import wraps
+import hashlib
+import json
+from flask import current_app, make_response, request
+from models import storage
+from models.engine.cache import ObjectCache
+from os import getenv
+import threading
+
+MAX_AGE = int(getenv("HBNB_API_MAX_AGE", "0"))
+CACHE_TTL = int(getenv("HBNB_API_CACHE_TTL", "3600"))
+
+
+class RedisCache:
+    """response cache in a Redis server, shared by the API processes"""
+
+    def __init__(self, url, prefix="hbnb:response:", ttl=CACHE_TTL,
+                 timeout=0.5):
+        """connects to the server at url; entries expire after ttl seconds
+        (never if 0), and a server not answering within timeout seconds
+        counts as a miss rather than holding the request up"""
+        import redis
+        self.client = redis.Redis.from_url(url, socket_timeout=timeout,
+                                           socket_connect_timeout=timeout)
+        self.ttl = ttl or None
+        self.errors = redis.RedisError
+        self.url = url
+        self.prefix = prefix
+        self.hits = 0
+        self.misses = 0
+        self.__lock = threading.Lock()
+
+    def get(self, key):
+        """returns the value cached for key, or None, also when the server
+        cannot be reached"""
+        try:
+            value = self.client.get(self.prefix + key)
+        except self.errors:
+            value = None
+        with self.__lock:
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return json.loads(value)
+
+    def put(self, key, value):
+        """caches value for key until it expires or the server evicts it"""
+        try:
+            self.client.set(self.prefix + key, json.dumps(value),
+                            ex=self.ttl)
+        except self.errors:
+            pass
+
+    def status(self):
+        """returns the counters of the cache"""
+        return {"url": self.url, "hits": self.hits, "misses": self.misses}
+
+
+def response_cache():
+    """returns the response cache the environment asks for"""
+    url = getenv("HBNB_API_CACHE_URL")
+    if url:
+        try:
+            return RedisCache(url)
+        except ImportError:
+            pass
+    return ObjectCache(int(getenv("HBNB_API_CACHE_SIZE", "256")))
+
+
+responses = response_cache()
+
+
+def cache_status():
+    """returns the counters of the response cache and its hit ratio"""
+    status = responses.status()
+    status["backend"] = type(responses).__name__
+    lookups = status["hits"] + status["misses"]
+    status["hit_ratio"] = status["hits"] / lookups if lookups else 0.0
+    return status
+
+
+def entity_tag(*parts):
+    """returns the entity tag of a response depending on parts: classes,
+    for their generation, objects, for the generation of their class, or
+    strings; None if a part is None, e.g. an object storage.get() did not
+    find"""
+    if None in parts:
+        return None
+    clss = [part for part in parts if isinstance(part, type)]
+    for part in parts:
+        if not isinstance(part, (type, str)) and type(part) not in clss:
+            clss.append(type(part))
+    parts = [part if isinstance(part, str) else
+             "{}.{}".format(type(part).__name__, part.id)
+             for part in parts if not isinstance(part, type)]
+    if clss:
+        parts.append("{}:{}".format(",".join(cls.__name__ for cls in clss),
+                                    storage.generation(*clss)))
+    digest = hashlib.blake2b((request.host + request.full_path).encode(),
+                             digest_size=16)
+    for part in parts:
+        digest.update(b"\0" + part.encode())
+    return digest.hexdigest()
+
+
+def cache_control(private=False):
+    """returns the Cache-Control header value of the views"""
+    scope = "private" if private else "public"
+    if MAX_AGE:
+        return "{}, max-age={}".format(scope, MAX_AGE)
+    return "{}, no-cache".format(scope)
+
+
+def conditional(tag_of, private=False, cache=False):
+    """decorates a view with conditional GET, and with response caching if
+    cache is True
+
+    tag_of is called with the view arguments and returns the entity_tag()
+    of the response, or None when it cannot tell (e.g. the object does not
+    exist), in which case the view answers as usual, untagged.
+    """
+    def decorator(view):
+        """returns view answering 304 when the client has its response"""
+        @wraps(view)
+        def wrapper(**kwargs):
+            """computes the tag before deciding to run the view"""
+            tag = tag_of(**kwargs)
+            if tag is None:
+                return view(**kwargs)
+            if tag in request.if_none_match:
+                response = make_response("", 304)
+            else:
+                entry = responses.get(tag) if cache else None
+                if entry is not None:
+                    body, mimetype, headers = entry
+                    response = current_app.response_class(
+                        body, mimetype=mimetype, headers=headers)
+                else:
+                    response = make_response(view(**kwargs))
+                    if response.status_code != 200:
+                        return response
+                    if cache and not response.is_streamed:
+                        responses.put(tag, (
+                            response.get_data(as_text=True),
+                            response.mimetype,
+                            [(name, value) for name, value
+                             in response.headers.items() if name not in
+                             ("Content-Type", "Content-Length")]))
+            response.set_etag(tag)
+            response.headers["Cache-Control"] = cache_control(private)
+            return response
+        return wrapper
+    return decorator
@@ -3,6 +3,9 @@
 API actions for City objects"""
 from flask import jsonify, abort, request
 from api.v1.views import app_views
+from api.v1.views.caching import conditional, entity_tag
+from api.v1.views.pagination import page_request, page_response
+from api.v1.views.streaming import stream_request, stream_response
 from models import storage
 from models.city import City
 from models.state import State
@@ -10,18 +13,26 @@ from models.state import State
 
 @app_views.route('/states/<state_id>/cities', methods=['GET'],
                  strict_slashes=False)
+@conditional(lambda state_id: entity_tag(City, storage.get(State, state_id)))
 def get_cities_by_state(state_id):
     """Retrieves the list of all City objects of a given State"""
     state = storage.get(State, state_id)
     if state is None:
         abort(404)
-    # Instead of relying on state.cities, iterate over all City objects
-    cities = [city.to_dict() for city in storage.all(
-        City).values() if city.state_id == state_id]
+    page = page_request()
+    if page is not None:
+        limit, after = page
+        return page_response(storage.page(City, limit + 1, after,
+                                          state_id=state_id), limit)
+    if stream_request():
+        return stream_response(storage.stream(City, state_id=state_id))
+    state = storage.get(State, state_id, eager=("cities",))
+    cities = [city.to_dict() for city in state.cities]
     return jsonify(cities)
 
 
 @app_views.route('/cities/<city_id>', methods=['GET'], strict_slashes=False)
+@conditional(lambda city_id: entity_tag(storage.get(City, city_id)))
 def get_city(city_id):
     """Retrieves a City object by its ID"""
     city = storage.get(City, city_id)
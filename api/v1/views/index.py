@@ -2,8 +2,10 @@
 """Index module to set up status and stats routes"""
 
 from api.v1.views import app_views
-from flask import jsonify
-from models import storage
+from api.v1.views.caching import cache_status, conditional, entity_tag
+from flask import abort, jsonify
+import json
+from models import storage, storage_t
 from models.amenity import Amenity
 from models.city import City
 from models.place import Place
@@ -18,10 +20,39 @@ def get_status():
     return jsonify({"status": "OK"})
 
 
-@app_views.route('/stats', methods=['GET'], strict_slashes=False)
-def get_stats():
-    """Retrieve the number of each object by type"""
-    counts = {
+@app_views.route('/status/pool', methods=['GET'], strict_slashes=False)
+def get_pool_status():
+    """Returns the database connection pool counters and state"""
+    if storage_t != "db":
+        abort(404)
+    return jsonify(storage.pool_status())
+
+
+@app_views.route('/status/cache', methods=['GET'], strict_slashes=False)
+def get_cache_status():
+    """Returns the object cache counters and size"""
+    if storage_t != "db":
+        abort(404)
+    return jsonify(storage.cache_status())
+
+
+@app_views.route('/status/events', methods=['GET'], strict_slashes=False)
+def get_events_status():
+    """Returns the change event counters of the storage engine"""
+    return jsonify(storage.event_status())
+
+
+@app_views.route('/status/responses', methods=['GET'],
+                 strict_slashes=False)
+def get_responses_status():
+    """Retrieve the counters and hit ratio of the response cache"""
+    return jsonify(cache_status())
+
+
+def stats():
+    """returns the number of each object by type, from the counts storage
+    keeps rather than from the tables"""
+    return {
         "amenities": storage.count(Amenity),
         "cities": storage.count(City),
         "places": storage.count(Place),
@@ -29,4 +60,11 @@ def get_stats():
         "states": storage.count(State),
         "users": storage.count(User)
     }
-    return jsonify(counts)
+
+
+@app_views.route('/stats', methods=['GET'], strict_slashes=False)
+@conditional(lambda: entity_tag(json.dumps(stats(), sort_keys=True)),
+             cache=True)
+def get_stats():
+    """Retrieve the number of each object by type"""
+    return jsonify(stats())
@@ -0,0 +1,85 @@
+#!/usr/bin/python3
+"""Cursor pagination of the collection views: ?limit=<n>&after=<cursor>
+
+A page holds objects ordered by id. Its response is the usual JSON list,
+with the opaque cursor of the next page, if any, in the X-Next-Cursor
+header and in a Link: <...>; rel="next" header. Search results ranked by
+relevance or distance keep their order instead: their cursor holds the
+position in the ranked list of the last object of the page, and its id.
+"""
+from base64 import b64decode, urlsafe_b64encode
+import binascii
+from flask import abort, jsonify, request
+from urllib.parse import urlencode
+
+DEFAULT_LIMIT = 100
+MAX_LIMIT = 1000
+
+
+def page_request():
+    """returns the (limit, after id) asked for, None for the whole list"""
+    if "limit" not in request.args and "after" not in request.args:
+        return None
+    try:
+        limit = int(request.args.get("limit", DEFAULT_LIMIT))
+    except ValueError:
+        abort(400, description="Invalid limit")
+    if limit < 1:
+        abort(400, description="Invalid limit")
+    after = request.args.get("after")
+    if after is not None:
+        try:
+            after = b64decode(after, altchars=b"-_", validate=True).decode()
+        except (binascii.Error, ValueError):
+            abort(400, description="Invalid cursor")
+    return min(limit, MAX_LIMIT), after
+
+
+def paginate(objs, limit, after=None):
+    """returns the objects of a list that storage.page() would return"""
+    objs = sorted(objs, key=lambda obj: obj.id)
+    if after is not None:
+        objs = [obj for obj in objs if obj.id > after]
+    return objs[:limit]
+
+
+def ranked_start(objs, after=None):
+    """returns the position in the ranked list objs of the object after
+    the cursor of a previous page: the position the cursor holds, unless
+    objects moved since and the id it holds is found elsewhere"""
+    if after is None:
+        return 0
+    position, sep, after_id = after.partition(":")
+    try:
+        position = int(position)
+    except ValueError:
+        abort(400, description="Invalid cursor")
+    if not sep or position < 1:
+        abort(400, description="Invalid cursor")
+    if position <= len(objs) and objs[position - 1].id == after_id:
+        return position
+    for i, obj in enumerate(objs):
+        if obj.id == after_id:
+            return i + 1
+    return min(position, len(objs))
+
+
+def page_response(objs, limit, start=None):
+    """returns the JSON list of the first limit objects of objs, with the
+    cursor of the next page if objs holds more (ask storage for limit + 1)
+
+    start is the position of objs in a ranked list, None for objects
+    ordered by id.
+    """
+    response = jsonify([obj.to_dict() for obj in objs[:limit]])
+    if len(objs) > limit:
+        cursor = objs[limit - 1].id
+        if start is not None:
+            cursor = "{}:{}".format(start + limit, cursor)
+        cursor = urlsafe_b64encode(cursor.encode()).decode()
+        args = request.args.to_dict()
+        args.update(limit=limit, after=cursor)
+        response.headers["X-Next-Cursor"] = cursor
+        response.headers["Link"] = '<{}?{}>; rel="next"'.format(
+            request.base_url, urlencode(args))
+    return response
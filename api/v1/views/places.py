@@ -2,23 +2,36 @@
 """Place objects that handles all default RESTFul API actions"""
 
 from api.v1.views import app_views
+from api.v1.views.caching import conditional, entity_tag
+from api.v1.views.pagination import page_request, page_response
+from api.v1.views.pagination import paginate, ranked_start
+from api.v1.views.streaming import stream_request, stream_response
 from models import storage
+from models.engine.geo import coordinates
+from models.engine.search import search_places
 from models.place import Place
 from models.city import City
 from models.user import User
-from models.state import State
-from models.amenity import Amenity
 from flask import abort, request, jsonify
 
 
 @app_views.route(
     "/cities/<city_id>/places", strict_slashes=False, methods=["GET"]
 )
+@conditional(lambda city_id: entity_tag(Place, storage.get(City, city_id)))
 def places(city_id):
     """Retrieves the list of Place objects of a City"""
     city = storage.get(City, city_id)
     if city is None:
         abort(404)
+    page = page_request()
+    if page is not None:
+        limit, after = page
+        return page_response(storage.page(Place, limit + 1, after,
+                                          city_id=city_id), limit)
+    if stream_request():
+        return stream_response(storage.stream(Place, city_id=city_id))
+    city = storage.get(City, city_id, eager=("places",))
     places_list = []
     for place in city.places:
         places_list.append(place.to_dict())
@@ -28,6 +41,7 @@ def places(city_id):
 @app_views.route(
     "/places/<place_id>", strict_slashes=False, methods=["GET"]
 )
+@conditional(lambda place_id: entity_tag(storage.get(Place, place_id)))
 def get_place(place_id):
     """Retrieves a Place object by its ID"""
     place = storage.get(Place, place_id)
@@ -96,6 +110,68 @@ def update_place(place_id):
     return jsonify(place.to_dict()), 200
 
 
+# attributes /places_search accepts ranges of
+numeric = ("number_rooms", "number_bathrooms", "max_guest", "price_by_night",
+           "latitude", "longitude")
+
+
+def _ranges(ranges):
+    """returns the ranges of a search request as attribute -> (low, high)"""
+    if not isinstance(ranges, dict):
+        abort(400, description="Invalid ranges")
+    checked = {}
+    for attr, bounds in ranges.items():
+        if attr not in numeric or not isinstance(bounds, list) or \
+                len(bounds) != 2:
+            abort(400, description="Invalid ranges")
+        for bound in bounds:
+            if bound is not None and not _number(bound):
+                abort(400, description="Invalid ranges")
+        checked[attr] = tuple(bounds)
+    return checked
+
+
+def _number(value):
+    """tells if a JSON value is a number"""
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _near(near):
+    """returns the near criterion of a search request as (lat, lng,
+    radius_km), None if absent"""
+    if near is None:
+        return None
+    fields = ("lat", "lng", "radius_km")
+    if not isinstance(near, dict) or \
+            not all(_number(near.get(field)) for field in fields) or \
+            coordinates(near["lat"], near["lng"]) is None or \
+            near["radius_km"] < 0:
+        abort(400, description="Invalid near")
+    return tuple(near[field] for field in fields)
+
+
+def _query(q):
+    """returns the q criterion of a search request, None if absent"""
+    if q is not None and not isinstance(q, str):
+        abort(400, description="Invalid q")
+    return q
+
+
+def _bbox(bbox):
+    """returns the bbox criterion of a search request as (south, west,
+    north, east), None if absent"""
+    if bbox is None:
+        return None
+    sides = ("south", "west", "north", "east")
+    if not isinstance(bbox, dict) or \
+            not all(_number(bbox.get(side)) for side in sides) or \
+            coordinates(bbox["south"], bbox["west"]) is None or \
+            coordinates(bbox["north"], bbox["east"]) is None or \
+            bbox["south"] > bbox["north"]:
+        abort(400, description="Invalid bbox")
+    return tuple(bbox[side] for side in sides)
+
+
 @app_views.route(
     "/places_search", methods=["POST"], strict_slashes=False
 )
@@ -106,45 +182,30 @@ def places_search():
       - states: list of State ids
       - cities: list of City ids
       - amenities: list of Amenity ids
+      - ranges: numeric attribute -> [min, max], either one null for no
+        bound, e.g. {"price_by_night": [50, 100], "max_guest": [4, null]}
+      - near: {"lat", "lng", "radius_km"}, places within radius_km
+      - bbox: {"south", "west", "north", "east"}, places in the box, which
+        crosses the antimeridian when west > east
+      - q: words, places whose name or description holds any of them
+    With q, places come the most relevant first. Otherwise, with near or
+    bbox, they come nearest first to the point or to the centre of the box.
     """
     req = request.get_json(force=True, silent=True)
     if req is None:
         abort(400, description="Not a JSON")
-    states = req.get("states", [])
-    cities = req.get("cities", [])
-    amenities = req.get("amenities", [])
-    if not states and not cities and not amenities:
-        all_places = storage.all(Place).values()
-        return jsonify([p.to_dict() for p in all_places])
-    city_ids = set()
-    if states:
-        for state_id in states:
-            state = storage.get(State, state_id)
-            if state:
-                for city in storage.all(City).values():
-                    if city.state_id == state_id:
-                        city_ids.add(city.id)
-    if cities:
-        for city_id in cities:
-            city = storage.get(City, city_id)
-            if city:
-                city_ids.add(city.id)
-    if city_ids:
-        places_candidates = [
-            place for place in storage.all(Place).values()
-            if place.city_id in city_ids
-        ]
-    else:
-        places_candidates = list(storage.all(Place).values())
-    if amenities:
-        amenity_ids = set(amenities)
-        filtered_places = []
-        for place in places_candidates:
-            if hasattr(place, "amenities"):
-                place_amen_ids = {amenity.id for amenity in place.amenities}
-            else:
-                place_amen_ids = set(place.amenity_ids)
-            if amenity_ids.issubset(place_amen_ids):
-                filtered_places.append(place)
-        places_candidates = filtered_places
-    return jsonify([place.to_dict() for place in places_candidates])
+    near, bbox, q = (_near(req.get("near")), _bbox(req.get("bbox")),
+                     _query(req.get("q")))
+    places = search_places(req.get("states", []), req.get("cities", []),
+                           req.get("amenities", []),
+                           _ranges(req.get("ranges", {})), near, bbox, q)
+    page = page_request()
+    if page is not None:
+        limit, after = page
+        if near is None and bbox is None and q is None:
+            return page_response(paginate(places, limit + 1, after), limit)
+        start = ranked_start(places, after)
+        return page_response(places[start:start + limit + 1], limit, start)
+    if stream_request():
+        return stream_response(places)
+    return jsonify([place.to_dict() for place in places])
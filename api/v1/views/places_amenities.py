@@ -4,8 +4,9 @@ for a Place.
 """
 
 from api.v1.views import app_views
+from api.v1.views.caching import conditional, entity_tag
 from flask import abort, jsonify, request
-from models import storage
+from models import storage, storage_t
 from models.place import Place
 from models.amenity import Amenity
 
@@ -13,23 +14,20 @@ from models.amenity import Amenity
 @app_views.route(
     "/places/<place_id>/amenities", methods=["GET"], strict_slashes=False
 )
+@conditional(lambda place_id: entity_tag(Amenity,
+                                         storage.get(Place, place_id)),
+             cache=True)
 def get_place_amenities(place_id):
     """
     Retrieves the list of all Amenity objects of a Place.
     If the place_id is not linked to any Place object, raise a 404 error.
     """
-    place = storage.get(Place, place_id)
+    place = storage.get(Place, place_id, eager=("amenities",))
     if not place:
         abort(404)
     amenities_list = []
-    if hasattr(place, "amenities"):
-        for amenity in place.amenities:
-            amenities_list.append(amenity.to_dict())
-    else:
-        for amenity_id in place.amenity_ids:
-            amenity = storage.get(Amenity, amenity_id)
-            if amenity:
-                amenities_list.append(amenity.to_dict())
+    for amenity in place.amenities:
+        amenities_list.append(amenity.to_dict())
     return jsonify(amenities_list)
 
 
@@ -51,14 +49,14 @@ def delete_place_amenity(place_id, amenity_id):
     amenity = storage.get(Amenity, amenity_id)
     if not amenity:
         abort(404)
-    if hasattr(place, "amenities"):
+    if storage_t == "db":
         if amenity not in place.amenities:
             abort(404)
         place.amenities.remove(amenity)
     else:
         if amenity_id not in place.amenity_ids:
             abort(404)
-        place.amenity_ids.remove(amenity_id)
+        place.amenity_ids = [i for i in place.amenity_ids if i != amenity_id]
     place.save()
     return jsonify({}), 200
 
@@ -84,13 +82,13 @@ def link_place_amenity(place_id, amenity_id):
     amenity = storage.get(Amenity, amenity_id)
     if not amenity:
         abort(404)
-    if hasattr(place, "amenities"):
+    if storage_t == "db":
         if amenity in place.amenities:
             return jsonify(amenity.to_dict()), 200
         place.amenities.append(amenity)
     else:
         if amenity_id in place.amenity_ids:
             return jsonify(amenity.to_dict()), 200
-        place.amenity_ids.append(amenity_id)
+        place.amenity_ids = place.amenity_ids + [amenity_id]
     place.save()
     return jsonify(amenity.to_dict()), 201
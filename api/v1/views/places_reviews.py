@@ -2,6 +2,9 @@
 """State objects that handles all default RESTFul API actions"""
 
 from api.v1.views import app_views
+from api.v1.views.caching import conditional, entity_tag
+from api.v1.views.pagination import page_request, page_response, ranked_start
+from api.v1.views.streaming import stream_request, stream_response
 from models import storage
 from models.place import Place
 from models.city import City
@@ -12,12 +15,22 @@ from flask import abort, request, jsonify
 
 @app_views.route("places/<place_id>/reviews", strict_slashes=False,
                  methods=["GET"])
+@conditional(lambda place_id: entity_tag(Review,
+                                         storage.get(Place, place_id)))
 def reviews(place_id):
     """show reviews"""
     reviews_list = []
     place = storage.get(Place, place_id)
     if place is None:
         abort(404)
+    page = page_request()
+    if page is not None:
+        limit, after = page
+        return page_response(storage.page(Review, limit + 1, after,
+                                          place_id=place_id), limit)
+    if stream_request():
+        return stream_response(storage.stream(Review, place_id=place_id))
+    place = storage.get(Place, place_id, eager=("reviews",))
     reviews = place.reviews
     for review in reviews:
         reviews_list.append(review.to_dict())
@@ -25,6 +38,7 @@ def reviews(place_id):
 
 
 @app_views.route("/reviews/<review_id>", strict_slashes=False, methods=["GET"])
+@conditional(lambda review_id: entity_tag(storage.get(Review, review_id)))
 def get_review(review_id):
     """Retrieves a review object"""
     review = storage.get(Review, review_id)
@@ -80,3 +94,22 @@ def update_review(review_id):
 
     review.save()
     return jsonify(review.to_dict()), 200
+
+
+@app_views.route("/reviews_search", strict_slashes=False, methods=["GET"])
+@conditional(lambda: entity_tag(Review))
+def reviews_search():
+    """Retrieves the reviews whose text holds any word of ?q=, the most
+    relevant first"""
+    q = request.args.get("q")
+    if q is None:
+        abort(400, "Missing q")
+    reviews = storage.search(Review, q)
+    page = page_request()
+    if page is not None:
+        limit, after = page
+        start = ranked_start(reviews, after)
+        return page_response(reviews[start:start + limit + 1], limit, start)
+    if stream_request():
+        return stream_response(reviews)
+    return jsonify([review.to_dict() for review in reviews])
@@ -3,18 +3,29 @@
 API actions for State objects"""
 from flask import jsonify, abort, request
 from api.v1.views import app_views
+from api.v1.views.caching import conditional, entity_tag
+from api.v1.views.pagination import page_request, page_response
+from api.v1.views.streaming import stream_request, stream_response
 from models import storage
 from models.state import State
 
 
 @app_views.route('/states', methods=['GET'], strict_slashes=False)
+@conditional(lambda: entity_tag(State), cache=True)
 def get_states():
     """Retrieves the list of all State objects"""
+    page = page_request()
+    if page is not None:
+        limit, after = page
+        return page_response(storage.page(State, limit + 1, after), limit)
+    if stream_request():
+        return stream_response(storage.stream(State))
     states = storage.all(State).values()
     return jsonify([state.to_dict() for state in states])
 
 
 @app_views.route('/states/<state_id>', methods=['GET'], strict_slashes=False)
+@conditional(lambda state_id: entity_tag(storage.get(State, state_id)))
 def get_state(state_id):
     """Retrieves a specific State object by ID"""
     state = storage.get(State, state_id)
@@ -0,0 +1,37 @@
+#!/usr/bin/python3
+"""Streamed JSON lists for the collection views: ?stream=1
+
+The list is written out a few objects at a time as they come from the
+storage iterator, so a worker never holds the whole collection or its
+JSON text in memory.
+"""
+from flask import Response, current_app, request, stream_with_context
+
+CHUNK = 100
+
+
+def stream_request():
+    """tells if the client asked for the list to be streamed"""
+    return request.args.get("stream", "").lower() in ("1", "true", "yes")
+
+
+def stream_response(objs):
+    """returns a response streaming the JSON list of the objects of the
+    iterable objs"""
+    dumps = current_app.json.dumps
+
+    def generate():
+        """yields the JSON list text CHUNK objects at a time"""
+        chunk = []
+        separator = "["
+        for obj in objs:
+            chunk.append(separator + dumps(obj.to_dict()))
+            separator = ","
+            if len(chunk) == CHUNK:
+                yield "".join(chunk)
+                chunk = []
+        chunk.append("[]\n" if separator == "[" else "]\n")
+        yield "".join(chunk)
+
+    return Response(stream_with_context(generate()),
+                    mimetype="application/json")
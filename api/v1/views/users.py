@@ -2,6 +2,9 @@
 """State objects that handles all default RESTFul API actions"""
 
 from api.v1.views import app_views
+from api.v1.views.caching import conditional, entity_tag
+from api.v1.views.pagination import page_request, page_response
+from api.v1.views.streaming import stream_request, stream_response
 from models import storage
 from models.user import User
 from flask import abort, request, jsonify
@@ -10,10 +13,18 @@ from flask import abort, request, jsonify
 @app_views.route("/users", strict_slashes=False, methods=["GET"])
 @app_views.route("/users/<user_id>", strict_slashes=False,
                  methods=["GET"])
+@conditional(lambda user_id=None: entity_tag(
+    User if user_id is None else storage.get(User, user_id)), private=True)
 def user(user_id=None):
     """show user and user with id"""
     users = []
     if user_id is None:
+        page = page_request()
+        if page is not None:
+            limit, after = page
+            return page_response(storage.page(User, limit + 1, after), limit)
+        if stream_request():
+            return stream_response(storage.stream(User))
         all_objs = storage.all(User).values()
         for val in all_objs:
             users.append(val.to_dict())
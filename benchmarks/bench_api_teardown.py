@@ -0,0 +1,48 @@
+#!/usr/bin/python3
+"""
+Measures API requests/sec with the per-request storage.close() teardown
+re-reading file.json every time (before) or only when it changed (after)
+
+usage: python3 -m benchmarks.bench_api_teardown [objects] [requests]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from api.v1.app import app
+from models import storage
+from models.engine.file_storage import FileStorage
+from models.state import State
+
+
+def throughput(client, requests):
+    """returns GET /api/v1/stats requests per second"""
+    start = time.perf_counter()
+    for _ in range(requests):
+        client.get("/api/v1/stats")
+    return requests / (time.perf_counter() - start)
+
+
+def main(size, requests):
+    """seeds a scratch file.json with size objects and runs both modes"""
+    path = os.path.join(tempfile.mkdtemp(), "file.json")
+    FileStorage._FileStorage__file_path = path
+    FileStorage._FileStorage__objects = {}
+    for i in range(size):
+        storage.new(State(name="State {}".format(i)))
+    storage.save()
+    client = app.test_client()
+    storage.close = lambda: storage.reload(force=True)
+    before = throughput(client, requests)
+    del storage.close
+    after = throughput(client, requests)
+    os.remove(path)
+    print("{} objects, {} requests".format(size, requests))
+    print("  reload every request  {:10.1f} req/s".format(before))
+    print("  reload on change      {:10.1f} req/s".format(after))
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    main(*(args + [10000, 200][len(args):]))
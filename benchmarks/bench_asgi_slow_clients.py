@@ -0,0 +1,147 @@
+#!/usr/bin/python3
+"""
+Benchmarks POST /api/v1/places_search with slow clients connected, on the
+threaded Flask server (api.v1.app) and on the ASGI one (api.v1.asgi)
+
+usage: python3 -m benchmarks.bench_asgi_slow_clients [slow clients]
+
+Each slow client sends its request body one byte every 50 ms. Meanwhile
+fast clients send the same search back to back; their median and worst
+latency, and the number of threads of the server, are printed. The
+servers run on a scratch file storage of 1000 places. The ASGI server
+needs uvicorn.
+"""
+
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+servers = {"flask threaded": [sys.executable, "-m", "api.v1.app"],
+           "asgi (uvicorn)": [sys.executable, "-m", "uvicorn",
+                              "--log-level", "warning",
+                              "api.v1.asgi:application"]}
+BODY = json.dumps({"ranges": {"max_guest": [2, 4]}}).encode()
+
+
+def fill(path):
+    """writes a file storage of 1000 places to path"""
+    from models.engine.file_storage import FileStorage
+    from models.city import City
+    from models.place import Place
+    from models.state import State
+    from models.user import User
+    FileStorage._FileStorage__file_path = path
+    FileStorage._FileStorage__objects = {}
+    storage = FileStorage()
+    state = State(name="Bench")
+    city = City(name="Bench", state_id=state.id)
+    user = User(email="bench@hbnb.io", password="bench")
+    for obj in (state, city, user):
+        storage.new(obj)
+    for i in range(1000):
+        storage.new(Place(name="Place {}".format(i), city_id=city.id,
+                          user_id=user.id, max_guest=i % 8))
+    storage.save()
+
+
+def request(port, body):
+    """returns the bytes of a places_search request header"""
+    return ("POST /api/v1/places_search HTTP/1.1\r\n"
+            "Host: 127.0.0.1:{}\r\nContent-Type: application/json\r\n"
+            "Content-Length: {}\r\nConnection: close\r\n\r\n").format(
+                port, len(body)).encode()
+
+
+async def slow(port, stop):
+    """sends a search one byte at a time until stop is set"""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(request(port, BODY))
+    for byte in BODY:
+        if stop.is_set():
+            break
+        writer.write(bytes([byte]))
+        await writer.drain()
+        await asyncio.sleep(0.05)
+    writer.close()
+
+
+async def fast(port):
+    """returns the seconds a search takes"""
+    started = time.perf_counter()
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(request(port, BODY) + BODY)
+    await writer.drain()
+    await reader.read()
+    writer.close()
+    return time.perf_counter() - started
+
+
+def threads(pid):
+    """returns the number of threads of the process pid"""
+    with open("/proc/{}/status".format(pid)) as f:
+        for line in f:
+            if line.startswith("Threads:"):
+                return int(line.split()[1])
+    return 0
+
+
+async def measure(port, pid, count):
+    """returns the fast latencies and server threads with count slow
+    clients connected"""
+    stop = asyncio.Event()
+    slows = [asyncio.ensure_future(slow(port, stop)) for i in range(count)]
+    await asyncio.sleep(0.5)
+    latencies = []
+    for i in range(50):
+        latencies.append(await fast(port))
+    busy = threads(pid)
+    stop.set()
+    await asyncio.gather(*slows, return_exceptions=True)
+    return latencies, busy
+
+
+def wait(port):
+    """waits until a server listens on port"""
+    for i in range(100):
+        try:
+            asyncio.run(fast(port))
+            return
+        except OSError:
+            time.sleep(0.1)
+
+
+def main(count):
+    """prints the latencies of both servers"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "file.json")
+        fill(path)
+        print("{} slow clients, 1000 places".format(count))
+        for port, (label, command) in enumerate(servers.items(), 5301):
+            env = dict(os.environ, PYTHONPATH=root, HBNB_API_PORT=str(port),
+                       HBNB_TYPE_STORAGE="")
+            if "uvicorn" in command:
+                command = command + ["--port", str(port)]
+            server = subprocess.Popen(command, cwd=tmp, env=env,
+                                      stdout=subprocess.DEVNULL,
+                                      stderr=subprocess.DEVNULL)
+            try:
+                wait(port)
+                latencies, busy = asyncio.run(measure(port, server.pid,
+                                                      count))
+            finally:
+                server.terminate()
+                server.wait()
+            print("  {:<15} median {:8.2f} ms   worst {:8.2f} ms   "
+                  "{:>5} threads".format(
+                      label, statistics.median(latencies) * 1000,
+                      max(latencies) * 1000, busy))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
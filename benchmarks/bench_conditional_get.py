@@ -0,0 +1,55 @@
+#!/usr/bin/python3
+"""
+Measures GET /api/v1/states requests/sec for clients without a cached
+copy, with the response cache off (the list is serialised) and on, and for
+clients with one (If-None-Match, 304)
+
+usage: python3 -m benchmarks.bench_conditional_get [objects] [requests]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from api.v1.app import app
+from api.v1.views import caching
+from models import storage
+from models.engine.cache import ObjectCache
+from models.engine.file_storage import FileStorage
+from models.state import State
+
+
+def throughput(client, requests, headers):
+    """returns GET /api/v1/states requests per second"""
+    start = time.perf_counter()
+    for _ in range(requests):
+        client.get("/api/v1/states", headers=headers)
+    return requests / (time.perf_counter() - start)
+
+
+def main(size, requests):
+    """seeds a scratch file.json with size states and runs both cases"""
+    path = os.path.join(tempfile.mkdtemp(), "file.json")
+    FileStorage._FileStorage__file_path = path
+    FileStorage._FileStorage__objects = {}
+    for i in range(size):
+        storage.new(State(name="State {}".format(i)))
+    storage.save()
+    client = app.test_client()
+    tag = client.get("/api/v1/states").headers["ETag"]
+    responses = caching.responses
+    caching.responses = ObjectCache(0)
+    full = throughput(client, requests, {})
+    caching.responses = responses
+    hit = throughput(client, requests, {})
+    cached = throughput(client, requests, {"If-None-Match": tag})
+    os.remove(path)
+    print("{} states, {} requests".format(size, requests))
+    print("  200, serialised       {:10.1f} req/s".format(full))
+    print("  200, response cache   {:10.1f} req/s".format(hit))
+    print("  304, If-None-Match    {:10.1f} req/s".format(cached))
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    main(*(args + [10000, 200][len(args):]))
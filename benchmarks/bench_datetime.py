@@ -0,0 +1,75 @@
+#!/usr/bin/python3
+"""
+Benchmarks the datetime handling of BaseModel: parse_time() and
+format_time() against strptime() and strftime(), to_dict() throughput and
+FileStorage.reload() of a file.json
+
+usage: python3 -m benchmarks.bench_datetime [size ...]
+"""
+
+from datetime import datetime, timezone
+import os
+import sys
+import tempfile
+import timeit
+from models.base_model import format_time, parse_time, time
+from models.engine.file_storage import FileStorage
+from models.place import Place
+from models.review import Review
+from models.state import State
+
+models_mix = (Review, Review, Place, State)
+
+
+def best(stmt, number):
+    """returns the best time in seconds of stmt over a few repeats"""
+    return min(timeit.repeat(stmt, number=number, repeat=3)) / number
+
+
+def strftime_to_dict(obj):
+    """to_dict() as done with strftime()"""
+    new_dict = obj.__dict__.copy()
+    new_dict["created_at"] = new_dict["created_at"].strftime(time)
+    new_dict["updated_at"] = new_dict["updated_at"].strftime(time)
+    new_dict["__class__"] = obj.__class__.__name__
+    return new_dict
+
+
+def run(size):
+    """times to_dict() and reload() of size objects"""
+    now = datetime.now(timezone.utc)
+    string = now.strftime(time)
+    print("{:>9} objects".format(size))
+    print("  parse   strptime {:8.0f} ns  parse_time  {:8.0f} ns".format(
+        best(lambda: datetime.strptime(string, time), 100000) * 1e9,
+        best(lambda: parse_time(string), 100000) * 1e9))
+    print("  format  strftime {:8.0f} ns  format_time {:8.0f} ns".format(
+        best(lambda: now.strftime(time), 100000) * 1e9,
+        best(lambda: format_time(now), 100000) * 1e9))
+    objs = [models_mix[i % len(models_mix)]() for i in range(size)]
+    print("  to_dict strftime {:8.0f}/s   format_time {:8.0f}/s".format(
+        size / best(lambda: [strftime_to_dict(obj) for obj in objs], 1),
+        size / best(lambda: [obj.to_dict() for obj in objs], 1)))
+    saved = FileStorage._FileStorage__file_path
+    path = os.path.join(tempfile.mkdtemp(), "file.json")
+    FileStorage._FileStorage__file_path = path
+    FileStorage._FileStorage__objects = {}
+    storage = FileStorage()
+    for obj in objs:
+        storage.new(obj)
+    storage.flush()
+
+    def reload():
+        """reloads the whole file into empty storage"""
+        FileStorage._FileStorage__objects = {}
+        storage.reload(force=True)
+
+    print("  reload  {:8.3f} s, {:.0f} objects/s".format(
+        best(reload, 1), size / best(reload, 1)))
+    os.remove(path)
+    FileStorage._FileStorage__file_path = saved
+
+
+if __name__ == "__main__":
+    for arg in sys.argv[1:] or ["100000"]:
+        run(int(arg))
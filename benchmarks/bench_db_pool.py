@@ -0,0 +1,52 @@
+#!/usr/bin/python3
+"""
+Load-tests the DBStorage connection pool settings on a local SQLite file
+
+The HBNB_DB_POOL_* variables are read as DBStorage reads them.
+usage: python3 -m benchmarks.bench_db_pool [threads] [queries per thread]
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+from models.engine.db_storage import PoolMetrics, pool_options
+from sqlalchemy import create_engine, exc, text
+from sqlalchemy.pool import QueuePool
+
+
+def main(threads, queries):
+    """runs threads x queries short transactions through the pool"""
+    path = os.path.join(tempfile.mkdtemp(), "pool.db")
+    engine = create_engine("sqlite:///" + path, poolclass=QueuePool,
+                           **pool_options())
+    metrics = PoolMetrics(engine)
+    timeouts = []
+
+    def work():
+        """checks a connection out and back in for every query"""
+        for _ in range(queries):
+            try:
+                with engine.connect() as conn:
+                    conn.execute(text("SELECT 1"))
+            except exc.TimeoutError:
+                timeouts.append(1)
+
+    workers = [threading.Thread(target=work) for _ in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - start
+    engine.dispose()
+    os.remove(path)
+    print("{} threads x {} queries: {:.0f} queries/s, {} timeouts".format(
+        threads, queries, threads * queries / elapsed, len(timeouts)))
+    print(metrics.status())
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    main(*(args + [32, 500][len(args):]))
@@ -0,0 +1,66 @@
+#!/usr/bin/python3
+"""
+Benchmarks FileStorage.all(cls) and count(cls) against a full scan
+
+usage: python3 -m benchmarks.bench_file_storage_index [size ...]
+"""
+
+import sys
+import timeit
+from models.amenity import Amenity
+from models.city import City
+from models.engine.file_storage import FileStorage
+from models.place import Place
+from models.review import Review
+from models.state import State
+from models.user import User
+
+models_mix = (Review, Review, Review, Place, Place, User, City, Amenity,
+              State)
+
+
+def scan_all(objects, cls):
+    """class filter as done before the per-class index"""
+    new_dict = {}
+    for key, value in objects.items():
+        if cls == value.__class__ or cls == value.__class__.__name__:
+            new_dict[key] = value
+    return new_dict
+
+
+def scan_count(objects, cls):
+    """count as done before the per-class index"""
+    return len([obj for obj in objects.values() if isinstance(obj, cls)])
+
+
+def best(stmt, number):
+    """returns the best time in ms of stmt over a few repeats"""
+    return min(timeit.repeat(stmt, number=number, repeat=3)) / number * 1000
+
+
+def run(size):
+    """fills a fresh FileStorage with size objects and times lookups"""
+    FileStorage._FileStorage__objects = {}
+    storage = FileStorage()
+    for i in range(size):
+        storage.new(models_mix[i % len(models_mix)]())
+    objects = storage.all()
+    number = max(1, 100000 // size)
+    print("{:>9} objects  ({} State)".format(size, storage.count(State)))
+    print("  all(State)    scan {:10.3f} ms   index {:10.3f} ms".format(
+        best(lambda: scan_all(objects, State), number),
+        best(lambda: storage.all(State), number)))
+    print("  count(State)  scan {:10.3f} ms   index {:10.3f} ms".format(
+        best(lambda: scan_count(objects, State), number),
+        best(lambda: storage.count(State), number * 1000)))
+    print("  /stats (x6)   scan {:10.3f} ms   index {:10.3f} ms".format(
+        best(lambda: [scan_count(objects, c) for c in models_mix[3:]],
+             number),
+        best(lambda: [storage.count(c) for c in models_mix[3:]],
+             number * 1000)))
+
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10000, 100000, 1000000]
+    for size in sizes:
+        run(size)
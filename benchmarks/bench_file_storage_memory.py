@@ -0,0 +1,78 @@
+#!/usr/bin/python3
+"""
+Measures the memory FileStorage.reload() keeps per object, with and
+without HBNB_FILE_COMPACT
+
+usage: python3 -m benchmarks.bench_file_storage_memory [reviews ...]
+"""
+
+import gc
+import os
+import random
+import sys
+import tempfile
+import tracemalloc
+from models.city import City
+from models.engine.file_storage import FileStorage
+from models.place import Place
+from models.review import Review
+from models.user import User
+
+
+def reset():
+    """empties FileStorage and its indexes"""
+    FileStorage._FileStorage__objects = {}
+    FileStorage._FileStorage__by_class = {}
+    FileStorage._FileStorage__refs = {}
+    FileStorage._FileStorage__indexed = (None, 0)
+    gc.collect()
+
+
+def measure(storage, compact):
+    """returns the bytes per object allocated by reloading the file"""
+    reset()
+    FileStorage._FileStorage__compact = compact
+    tracemalloc.start()
+    storage.reload(force=True)
+    storage.count(Review)
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size / storage.count()
+
+
+def run(size):
+    """writes size reviews of size / 10 places to a file and reloads it"""
+    random.seed(size)
+    users = [User(email="{}@hbnb.io".format(i), password="pwd")
+             for i in range(max(1, size // 40))]
+    cities = [City(name=str(i), state_id="0" * 36)
+              for i in range(max(1, size // 400))]
+    places = [Place(name=str(i), city_id=random.choice(cities).id,
+                    user_id=random.choice(users).id)
+              for i in range(max(1, size // 10))]
+    reviews = [Review(text="Would stay again {}".format(i),
+                      place_id=random.choice(places).id,
+                      user_id=random.choice(users).id)
+               for i in range(size)]
+    saved = FileStorage._FileStorage__file_path
+    path = os.path.join(tempfile.mkdtemp(), "file.json")
+    FileStorage._FileStorage__file_path = path
+    reset()
+    storage = FileStorage()
+    for obj in users + cities + places + reviews:
+        obj.updated_at = obj.created_at
+        storage.new(obj)
+    storage.flush()
+    del users, cities, places, reviews
+    total = storage.count()
+    print("{:>9} objects  default {:5.0f} B/object  compact {:5.0f} "
+          "B/object".format(total, measure(storage, False),
+                            measure(storage, True)))
+    os.remove(path)
+    FileStorage._FileStorage__file_path = saved
+
+
+if __name__ == "__main__":
+    for arg in sys.argv[1:] or ["200000"]:
+        run(int(arg))
@@ -0,0 +1,59 @@
+#!/usr/bin/python3
+"""
+Benchmarks spatial queries over places: a scan computing the distance of
+every place against FileStorage.near() and within() over the grid index
+
+usage: python3 -m benchmarks.bench_place_geo [size ...]
+"""
+
+import random
+import sys
+import timeit
+from models.engine import geo
+from models.engine.file_storage import FileStorage
+from models.place import Place
+
+
+def best(stmt, number):
+    """returns the best time in seconds of stmt over a few repeats"""
+    return min(timeit.repeat(stmt, number=number, repeat=3)) / number
+
+
+def scan(storage, lat, lng, radius_km):
+    """the places within radius_km of a point, nearest first, by distance
+    from every place"""
+    found = []
+    for place in storage.all(Place).values():
+        d = geo.distance(lat, lng, place.latitude, place.longitude)
+        if d <= radius_km:
+            found.append((d, place))
+    found.sort(key=lambda item: item[0])
+    return [place for d, place in found]
+
+
+def run(size):
+    """times a 25 km radius and a city-sized box over size places spread
+    over continental United States"""
+    FileStorage._FileStorage__objects = {}
+    storage = FileStorage()
+    rand = random.Random(size)
+    for i in range(size):
+        storage.new(Place(latitude=rand.uniform(25, 49),
+                          longitude=rand.uniform(-125, -67)))
+    storage.count(Place)
+    found = storage.near(Place, 37.77, -122.42, 25)
+    assert found == scan(storage, 37.77, -122.42, 25)
+    print("{:>9} places, {} found".format(size, len(found)))
+    print("  scan            {:8.2f} ms".format(
+        best(lambda: scan(storage, 37.77, -122.42, 25), 1) * 1e3))
+    print("  near()          {:8.3f} ms".format(
+        best(lambda: storage.near(Place, 37.77, -122.42, 25), 10) * 1e3))
+    print("  within()        {:8.3f} ms".format(
+        best(lambda: storage.within(Place, 37.6, -122.6, 37.9, -122.3),
+             10) * 1e3))
+    FileStorage._FileStorage__objects = {}
+
+
+if __name__ == "__main__":
+    for arg in sys.argv[1:] or ["10000", "100000", "1000000"]:
+        run(int(arg))
@@ -0,0 +1,57 @@
+#!/usr/bin/python3
+"""
+Benchmarks range queries over Place numeric attributes: a scan comparing
+the attributes of every place against FileStorage.where() over columns,
+with NumPy masks and with the array fallback
+
+usage: python3 -m benchmarks.bench_place_ranges [size ...]
+"""
+
+import random
+import sys
+import timeit
+from unittest import mock
+from models.engine import columns
+from models.engine.file_storage import FileStorage
+from models.place import Place
+
+
+def best(stmt, number):
+    """returns the best time in seconds of stmt over a few repeats"""
+    return min(timeit.repeat(stmt, number=number, repeat=3)) / number
+
+
+def scan(storage, low, high, guests):
+    """the places priced low to high for guests, compared one by one"""
+    return [place for place in storage.all(Place).values()
+            if low <= place.price_by_night <= high and
+            place.max_guest >= guests]
+
+
+def run(size):
+    """times a price range and minimum guests query over size places"""
+    FileStorage._FileStorage__objects = {}
+    storage = FileStorage()
+    rand = random.Random(size)
+    for i in range(size):
+        storage.new(Place(price_by_night=rand.randrange(20, 500),
+                          max_guest=rand.randrange(1, 10)))
+    storage.count(Place)
+    ranges = {"price_by_night": (50, 100), "max_guest": (6, None)}
+    found = len(scan(storage, 50, 100, 6))
+    assert found == len(storage.where(Place, **ranges))
+    print("{:>9} places, {} found".format(size, found))
+    print("  scan            {:8.2f} ms".format(
+        best(lambda: scan(storage, 50, 100, 6), 3) * 1e3))
+    if columns.numpy is not None:
+        print("  where() numpy   {:8.2f} ms".format(
+            best(lambda: storage.where(Place, **ranges), 3) * 1e3))
+    with mock.patch.object(columns, "numpy", None):
+        print("  where() arrays  {:8.2f} ms".format(
+            best(lambda: storage.where(Place, **ranges), 3) * 1e3))
+    FileStorage._FileStorage__objects = {}
+
+
+if __name__ == "__main__":
+    for arg in sys.argv[1:] or ["10000", "100000", "1000000"]:
+        run(int(arg))
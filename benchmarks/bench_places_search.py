@@ -0,0 +1,91 @@
+#!/usr/bin/python3
+"""
+Benchmarks search_places against the full scans /places_search used to do
+
+usage: python3 -m benchmarks.bench_places_search [places]
+"""
+
+import random
+import sys
+import time
+from models import storage
+from models.amenity import Amenity
+from models.city import City
+from models.engine.file_storage import FileStorage
+from models.engine.search import search_places
+from models.place import Place
+from models.state import State
+
+
+def scan_places(states, cities, amenities):
+    """the places_search view before the indexed engine"""
+    if not states and not cities and not amenities:
+        return list(storage.all(Place).values())
+    city_ids = set()
+    for state_id in states:
+        if storage.get(State, state_id):
+            for city in storage.all(City).values():
+                if city.state_id == state_id:
+                    city_ids.add(city.id)
+    for city_id in cities:
+        if storage.get(City, city_id):
+            city_ids.add(city_id)
+    if city_ids:
+        candidates = [place for place in storage.all(Place).values()
+                      if place.city_id in city_ids]
+    else:
+        candidates = list(storage.all(Place).values())
+    if amenities:
+        wanted = set(amenities)
+        candidates = [place for place in candidates
+                      if wanted.issubset(place.amenity_ids)]
+    return candidates
+
+
+def timed(func, *args):
+    """returns the best wall time in ms of func(*args) and its result"""
+    best = None
+    for _ in range(3):
+        start = time.perf_counter()
+        result = func(*args)
+        elapsed = (time.perf_counter() - start) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main(size):
+    """builds size places over 50 states, 1000 cities and 50 amenities"""
+    rand = random.Random(0)
+    FileStorage._FileStorage__objects = {}
+    states = [State(name="S{}".format(i)) for i in range(50)]
+    cities = [City(name="C{}".format(i), state_id=states[i % 50].id)
+              for i in range(1000)]
+    amenities = [Amenity(name="A{}".format(i)) for i in range(50)]
+    for obj in states + cities + amenities:
+        storage.new(obj)
+    start = time.perf_counter()
+    for i in range(size):
+        storage.new(Place(name="P{}".format(i),
+                          city_id=rand.choice(cities).id,
+                          amenity_ids=[a.id for a in
+                                       rand.sample(amenities, 5)]))
+    print("{} places built in {:.1f} s".format(
+        size, time.perf_counter() - start))
+    queries = {
+        "1 state": ([states[0].id], [], []),
+        "3 cities": ([], [c.id for c in cities[:3]], []),
+        "1 state, 2 amenities": ([states[1].id], [],
+                                 [amenities[0].id, amenities[1].id]),
+        "3 amenities": ([], [], [a.id for a in amenities[:3]]),
+        "1 amenity, 1 city": ([], [cities[5].id], [amenities[2].id]),
+    }
+    for label, query in queries.items():
+        before, expected = timed(scan_places, *query)
+        after, found = timed(search_places, *query)
+        assert {p.id for p in found} == {p.id for p in expected}
+        print("  {:<22} {:>7} hits  scan {:9.2f} ms  index {:9.3f} ms"
+              .format(label, len(found), before, after))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -0,0 +1,130 @@
+#!/usr/bin/python3
+"""
+Load test of the preforking server (api.v1.prefork): requests/sec of
+GET /api/v1/places/<id> for a growing number of workers
+
+usage: python3 -m benchmarks.bench_prefork_scaling [seconds [clients]]
+
+The server runs on a scratch file storage of 10000 places. Client
+processes, twice the number of CPUs by default, request random places
+over new connections for the given seconds (5 by default) at each worker
+count: 1, 2, 4... up to the number of CPUs. Throughput only grows while
+there are free cores for both the workers and the clients.
+"""
+
+import multiprocessing
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def fill(path, size=10000):
+    """writes a file storage of size places to path, returns their ids"""
+    from models.engine.file_storage import FileStorage
+    from models.city import City
+    from models.place import Place
+    from models.state import State
+    from models.user import User
+    FileStorage._FileStorage__file_path = path
+    FileStorage._FileStorage__objects = {}
+    storage = FileStorage()
+    state = State(name="Bench")
+    city = City(name="Bench", state_id=state.id)
+    user = User(email="bench@hbnb.io", password="bench")
+    for obj in (state, city, user):
+        storage.new(obj)
+    ids = []
+    for i in range(size):
+        place = Place(name="Place {}".format(i), city_id=city.id,
+                      user_id=user.id, number_rooms=i % 5)
+        storage.new(place)
+        ids.append(place.id)
+    storage.save()
+    return ids
+
+
+def get(port, path):
+    """returns the status code of a GET of path"""
+    with socket.create_connection(("127.0.0.1", port)) as conn:
+        conn.sendall("GET {} HTTP/1.0\r\nHost: 127.0.0.1\r\n\r\n".format(
+            path).encode())
+        response = b""
+        while True:
+            data = conn.recv(65536)
+            if not data:
+                break
+            response += data
+    return int(response.split(b" ", 2)[1])
+
+
+def client(port, ids, seconds, results):
+    """counts the successful requests until seconds elapsed"""
+    done = 0
+    end = time.monotonic() + seconds
+    while time.monotonic() < end:
+        if get(port, "/api/v1/places/" + random.choice(ids)) == 200:
+            done += 1
+    results.put(done)
+
+
+def load(port, ids, seconds, clients):
+    """returns the requests/sec of clients client processes"""
+    results = multiprocessing.Queue()
+    procs = [multiprocessing.Process(target=client,
+                                     args=(port, ids, seconds, results))
+             for i in range(clients)]
+    for proc in procs:
+        proc.start()
+    total = sum(results.get() for proc in procs)
+    for proc in procs:
+        proc.join()
+    return total / seconds
+
+
+def wait(port):
+    """waits until a server answers on port"""
+    for i in range(100):
+        try:
+            get(port, "/api/v1/status")
+            return
+        except OSError:
+            time.sleep(0.1)
+
+
+def main(seconds, clients):
+    """prints the throughput of each worker count"""
+    cpus = len(os.sched_getaffinity(0)) if hasattr(
+        os, "sched_getaffinity") else os.cpu_count() or 1
+    clients = clients or 2 * cpus
+    counts = [1]
+    while counts[-1] * 2 <= cpus:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != cpus:
+        counts.append(cpus)
+    with tempfile.TemporaryDirectory() as tmp:
+        ids = fill(os.path.join(tmp, "file.json"))
+        print("{} CPUs, {} clients, {} places".format(cpus, clients,
+                                                      len(ids)))
+        for port, workers in enumerate(counts, 5401):
+            env = dict(os.environ, PYTHONPATH=root, HBNB_TYPE_STORAGE="")
+            server = subprocess.Popen(
+                [sys.executable, "-m", "api.v1.prefork", "--port", str(port),
+                 "--workers", str(workers)], cwd=tmp, env=env)
+            try:
+                wait(port)
+                rate = load(port, ids, seconds, clients)
+            finally:
+                server.terminate()
+                server.wait()
+            print("  {:>3} workers {:10.1f} req/s".format(workers, rate))
+
+
+if __name__ == "__main__":
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else 5,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 0)
@@ -0,0 +1,57 @@
+#!/usr/bin/python3
+"""
+Benchmarks the cost of change events on FileStorage.new() and save()
+
+usage: python3 -m benchmarks.bench_storage_events [size]
+
+Times storing size states, then updating them all, without subscribers,
+with one synchronous and with one asynchronous subscriber. save() is
+timed without writing the file, which would dwarf the events.
+"""
+
+import sys
+import timeit
+from models.engine.file_storage import FileStorage
+from models.state import State
+
+
+def best(stmt, number=1):
+    """returns the best time in ms of stmt over a few repeats"""
+    return min(timeit.repeat(stmt, number=number, repeat=3)) / number * 1000
+
+
+def run(size, subscribe):
+    """returns the ms taken to store or update and publish size states, and
+    the number of changes in the last change set"""
+    FileStorage._FileStorage__objects = {}
+    storage = FileStorage()
+    states = [State(name="State {}".format(i)) for i in range(size)]
+    got = []
+    if subscribe is not None:
+        storage.subscribe(got.append, subscribe)
+
+    def cycle():
+        """adds or updates every state, then publishes the changes"""
+        for state in states:
+            storage.new(state)
+        storage._FileStorage__publish()
+    elapsed = best(cycle)
+    storage._FileStorage__events.join()
+    if subscribe is not None:
+        storage.unsubscribe(got.append)
+    return elapsed, len(got[-1]) if got else 0
+
+
+def main(size):
+    """prints the timings"""
+    print("{} states".format(size))
+    for label, subscribe in (("no subscriber", None),
+                             ("synchronous", False),
+                             ("asynchronous", True)):
+        elapsed, events = run(size, subscribe)
+        print("  {:<14} {:10.2f} ms   {:>8} changes".format(
+            label, elapsed, events))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
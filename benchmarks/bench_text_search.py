@@ -0,0 +1,97 @@
+#!/usr/bin/python3
+"""
+Benchmarks full-text search over a synthetic corpus of place names and
+descriptions: a scan tokenizing every place against storage.search(),
+with the storage engine picked by HBNB_TYPE_STORAGE, e.g.
+
+usage: python3 -m benchmarks.bench_text_search [size ...]
+       HBNB_TYPE_STORAGE=sqlite HBNB_SQLITE_PATH=/tmp/bench.db \\
+           python3 -m benchmarks.bench_text_search 100000
+"""
+
+from datetime import datetime, timezone
+import itertools
+import random
+import sys
+import timeit
+import uuid
+import models
+from models.city import City
+from models.engine.file_storage import FileStorage
+from models.engine.text import tokenize
+from models.place import Place
+from models.state import State
+from models.user import User
+
+queries = ("sunny loft", "quiet garden view", "word42")
+
+
+def best(stmt, number):
+    """returns the best time in seconds of stmt over a few repeats"""
+    return min(timeit.repeat(stmt, number=number, repeat=3)) / number
+
+
+def corpus(size, rand):
+    """returns size (name, description) pairs drawing words from a skewed
+    vocabulary of 5000 words"""
+    words = ["sunny", "loft", "quiet", "garden", "view", "park", "beach"] + \
+        ["word{}".format(i) for i in range(5000)]
+    weights = list(itertools.accumulate(1 / (rank + 1)
+                                        for rank in range(len(words))))
+
+    def sentence(length):
+        """returns length words drawn from the vocabulary"""
+        return " ".join(rand.choices(words, cum_weights=weights, k=length))
+
+    return [(sentence(3), sentence(rand.randrange(10, 40)))
+            for i in range(size)]
+
+
+def scan(query):
+    """the places holding any word of query, by tokenizing every place"""
+    terms = set(tokenize(query))
+    return [place for place in models.storage.all(Place).values()
+            if terms.intersection(tokenize(place.name + " " +
+                                           (place.description or "")))]
+
+
+def run(size):
+    """loads size places, then times the queries"""
+    rand = random.Random(size)
+    if models.storage_t != "db":
+        FileStorage._FileStorage__objects = {}
+    state = State(name="Bench")
+    city = City(name="Bench", state_id=state.id)
+    user = User(email="bench@bench", password="bench")
+    for obj in (state, city, user):
+        models.storage.new(obj)
+    models.storage.save()
+    start = timeit.default_timer()
+    if models.storage_t == "db":
+        now = datetime.now(timezone.utc)
+        models.storage.insert(Place, [
+            {"id": str(uuid.uuid4()), "created_at": now, "updated_at": now,
+             "city_id": city.id, "user_id": user.id, "name": name,
+             "description": description}
+            for name, description in corpus(size, rand)])
+        models.storage.save()
+    else:
+        for name, description in corpus(size, rand):
+            models.storage.new(Place(city_id=city.id, user_id=user.id,
+                                     name=name, description=description))
+        models.storage.count(Place)
+    print("{:>9} places, loaded and indexed in {:.2f} s".format(
+        size, timeit.default_timer() - start))
+    for query in queries:
+        found = len(models.storage.search(Place, query))
+        print("  {:20} {:6} found  scan {:9.2f} ms  search() {:8.2f} ms"
+              "  top 10 {:8.2f} ms".format(
+                  repr(query), found, best(lambda: scan(query), 1) * 1e3,
+                  best(lambda: models.storage.search(Place, query), 3) * 1e3,
+                  best(lambda: models.storage.search(Place, query, 10),
+                       3) * 1e3))
+
+
+if __name__ == "__main__":
+    for arg in sys.argv[1:] or ["10000", "100000"]:
+        run(int(arg))
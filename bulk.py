@@ -0,0 +1,229 @@
+#!/usr/bin/python3
+"""
+Bulk import and export of the objects of the storage engine
+
+usage: ./bulk.py export [--format ndjson|csv] [--class NAME ...] [FILE]
+       ./bulk.py import [--format ndjson|csv] [--batch N] [FILE]
+
+FILE defaults to the standard streams. The storage engine is picked by
+HBNB_TYPE_STORAGE as for the console, so piping an export into an import
+migrates objects between engines, e.g. from file.json to SQLite:
+    ./bulk.py export | HBNB_TYPE_STORAGE=sqlite ./bulk.py import
+Exports list parents before the objects referring to them, which imports
+into a database need.
+"""
+
+import argparse
+import csv
+from datetime import datetime, timezone
+import json
+import models
+from models.amenity import Amenity
+from models.base_model import parse_time
+from models.city import City
+from models.place import Place
+from models.review import Review
+from models.state import State
+from models.user import User
+import sys
+import timeit
+
+# parents first, so that a database import never misses a foreign key
+classes = {"State": State, "City": City, "User": User, "Amenity": Amenity,
+           "Place": Place, "Review": Review}
+
+# class name -> attributes beyond id, created_at and updated_at
+fields = {"State": ["name"],
+          "City": ["state_id", "name"],
+          "User": ["email", "password", "first_name", "last_name"],
+          "Amenity": ["name"],
+          "Place": ["city_id", "user_id", "name", "description",
+                    "number_rooms", "number_bathrooms", "max_guest",
+                    "price_by_night", "latitude", "longitude", "amenity_ids"],
+          "Review": ["place_id", "user_id", "text"]}
+columns = ["__class__", "id", "created_at", "updated_at"] + sorted(
+    {attr for attrs in fields.values() for attr in attrs})
+integers = ["number_rooms", "number_bathrooms", "max_guest",
+            "price_by_night"]
+floats = ["latitude", "longitude"]
+
+
+class Progress:
+    """reports on stderr how many objects went through, and how fast"""
+
+    def __init__(self, verb, every=10000):
+        """starts the clock"""
+        self.verb = verb
+        self.every = every
+        self.count = 0
+        self.start = timeit.default_timer()
+
+    def add(self, count=1):
+        """counts objects, reporting every time a multiple of every passes"""
+        before = self.count // self.every
+        self.count += count
+        if self.count // self.every != before:
+            self.report()
+
+    def report(self, end=""):
+        """writes the count and the throughput so far over the last report"""
+        elapsed = max(timeit.default_timer() - self.start, 1e-9)
+        sys.stderr.write("\r{} {} objects, {:.0f} objects/s{}".format(
+            self.verb, self.count, self.count / elapsed, end))
+        sys.stderr.flush()
+
+
+def to_record(obj):
+    """returns the JSON-ready attributes of obj, password hash included"""
+    record = obj.to_dict(saving=True)
+    if models.storage_t == "db":
+        # leaves out the relationships SQLAlchemy loaded
+        names = type(obj).__table__.columns.keys()
+        record = {key: record[key] for key in names + ["__class__"]}
+        if isinstance(obj, Place):
+            record["amenity_ids"] = [amenity.id for amenity in obj.amenities]
+    return record
+
+
+def from_csv(row):
+    """returns the record of a CSV row, typed as an export would be"""
+    record = {key: value for key, value in row.items() if value != ""}
+    for key in integers:
+        if key in record:
+            record[key] = int(record[key])
+    for key in floats:
+        if key in record:
+            record[key] = float(record[key])
+    if "amenity_ids" in record:
+        record["amenity_ids"] = record["amenity_ids"].split()
+    return record
+
+
+def to_csv(record):
+    """returns the CSV row of a record"""
+    if "amenity_ids" in record:
+        record = dict(record, amenity_ids=" ".join(record["amenity_ids"]))
+    return record
+
+
+def export(out, fmt, names):
+    """writes the objects of the classes names to out"""
+    progress = Progress("exported")
+    if fmt == "csv":
+        writer = csv.DictWriter(out, columns, extrasaction="ignore")
+        writer.writeheader()
+    for name in names:
+        eager = ("amenities",) if name == "Place" and \
+            models.storage_t == "db" else ()
+        for obj in models.storage.stream(classes[name], eager=eager):
+            record = to_record(obj)
+            if fmt == "csv":
+                writer.writerow(to_csv(record))
+            else:
+                out.write(json.dumps(record) + "\n")
+            progress.add()
+    progress.report("\n")
+
+
+def build(record):
+    """returns the object of a record, without hashing its password twice"""
+    obj = classes[record["__class__"]](**record)
+    if "password" in record:
+        # exported passwords are hashed, User.__setattr__ would hash again
+        object.__setattr__(obj, "password", record["password"])
+    return obj
+
+
+def row(record):
+    """returns the table row of a record for a database import"""
+    cls = classes[record["__class__"]]
+    names = cls.__table__.columns.keys()
+    values = {key: record[key] for key in names if key in record}
+    for key in ("created_at", "updated_at"):
+        if key in values:
+            values[key] = parse_time(values[key])
+        else:
+            values[key] = datetime.now(timezone.utc)
+    return values
+
+
+def flush(pending):
+    """stores the pending records, parents first"""
+    if models.storage_t == "db":
+        from models.place import place_amenity
+        for name in classes:
+            records = pending.get(name, [])
+            models.storage.insert(name, [row(record) for record in records])
+            if name == "Place":
+                models.storage.insert(place_amenity, [
+                    {"place_id": record["id"], "amenity_id": amenity_id}
+                    for record in records
+                    for amenity_id in record.get("amenity_ids", [])])
+        models.storage.save()
+    else:
+        for name in classes:
+            for record in pending.get(name, []):
+                models.storage.new(build(record))
+
+
+def load(src, fmt, batch):
+    """reads objects from src into storage, batch objects at a time"""
+    progress = Progress("imported")
+    records = csv.DictReader(src) if fmt == "csv" else \
+        (json.loads(line) for line in src if line.strip())
+    pending = {}
+    size = 0
+    for record in records:
+        if fmt == "csv":
+            record = from_csv(record)
+        if record.get("__class__") not in classes:
+            sys.exit("** class doesn't exist **")
+        pending.setdefault(record["__class__"], []).append(record)
+        size += 1
+        if size == batch:
+            flush(pending)
+            progress.add(size)
+            pending = {}
+            size = 0
+    flush(pending)
+    progress.add(size)
+    if models.storage_t != "db":
+        # one rewrite of the file for the whole import
+        models.storage.save()
+    progress.report("\n")
+
+
+def main(argv=None):
+    """parses the command line and runs the command"""
+    parser = argparse.ArgumentParser(description="bulk import and export "
+                                     "of the storage engine objects")
+    parser.add_argument("command", choices=["export", "import"])
+    parser.add_argument("file", nargs="?", default="-",
+                        help="file to read or write, - for stdin/stdout")
+    parser.add_argument("--format", choices=["ndjson", "csv"],
+                        default="ndjson")
+    parser.add_argument("--class", dest="names", action="append",
+                        choices=list(classes),
+                        help="class to export, repeatable; default all")
+    parser.add_argument("--batch", type=int, default=1000,
+                        help="objects inserted per database transaction")
+    args = parser.parse_intermixed_args(argv)
+    if args.command == "export":
+        out = sys.stdout if args.file == "-" else open(args.file, "w",
+                                                       newline="")
+        names = [name for name in classes if name in (args.names or
+                                                      classes)]
+        export(out, args.format, names)
+        if out is sys.stdout:
+            out.flush()
+        else:
+            out.close()
+    else:
+        src = sys.stdin if args.file == "-" else open(args.file, newline="")
+        load(src, args.format, args.batch)
+        if src is not sys.stdin:
+            src.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,9 @@ from os import getenv
 
 
 storage_t = getenv("HBNB_TYPE_STORAGE")
+if storage_t == "sqlite":
+    # same SQLAlchemy models and DBStorage, on SQLite instead of MySQL
+    storage_t = "db"
 
 if storage_t == "db":
     from models.engine.db_storage import DBStorage
@@ -12,6 +12,31 @@ from sqlalchemy.ext.declarative import declarative_base
 import uuid
 
 time = "%Y-%m-%dT%H:%M:%S.%f"
+# the time format for the % operator, several times faster than strftime()
+time_fields = "%04d-%02d-%02dT%02d:%02d:%02d.%06d"
+
+
+def parse_time(string):
+    """returns the naive datetime of a string in the time format"""
+    if len(string) == 26 and string[10] == "T" and string[19] == ".":
+        # the C parser of isoformat() output, about 50 times faster, but
+        # only for the shape format_time() writes: it takes more than
+        # strptime() does, such as time zones or a space for the T
+        try:
+            dt = datetime.fromisoformat(string)
+        except ValueError:
+            dt = None
+        if dt is not None and dt.tzinfo is None:
+            return dt
+    return datetime.strptime(string, time)
+
+
+def format_time(dt):
+    """returns a datetime as a string in the time format, as strftime()
+    does, leaving out any time zone"""
+    return time_fields % (dt.year, dt.month, dt.day, dt.hour, dt.minute,
+                          dt.second, dt.microsecond)
+
 
 if models.storage_t == "db":
     Base = declarative_base()
@@ -19,6 +44,42 @@ else:
     Base = object
 
 
+class IndexedAttribute:
+    """Class attribute of a file storage model that tells models.storage
+    when its value changes, so that storage indexes on it stay right"""
+
+    def __init__(self, default=""):
+        """initializes the attribute with its class-level default"""
+        self.default = default
+
+    def __set_name__(self, owner, name):
+        """remembers the attribute name the descriptor is bound to"""
+        self.name = name
+
+    def __get__(self, obj, objtype=None):
+        """returns the instance value, or the default"""
+        if obj is None:
+            return self.default
+        return obj.__dict__.get(self.name, self.default)
+
+    def __set__(self, obj, value):
+        """stores the value in the instance and reports the change"""
+        old = obj.__dict__.get(self.name, self.default)
+        obj.__dict__[self.name] = value
+        if old != value:
+            models.storage.reindex(obj, self.name, old)
+
+
+class NumericAttribute(IndexedAttribute):
+    """IndexedAttribute whose values file storage keeps in numeric columns
+    rather than a reverse index, for range queries"""
+
+
+class TextAttribute(IndexedAttribute):
+    """IndexedAttribute whose words file storage keeps in a full-text index
+    rather than a reverse index of whole values"""
+
+
 class BaseModel:
     """The BaseModel class from which future classes will be derived"""
     if models.storage_t == "db":
@@ -33,12 +94,12 @@ class BaseModel:
                 if key != "__class__":
                     setattr(self, key, value)
             if kwargs.get("created_at", None) and type(self.created_at) is str:
-                self.created_at = datetime.strptime(kwargs["created_at"], time)
+                self.created_at = parse_time(kwargs["created_at"])
             else:
                 self.created_at = datetime.now(timezone.utc)
 
             if kwargs.get("updated_at", None) and type(self.updated_at) is str:
-                self.updated_at = datetime.strptime(kwargs["updated_at"], time)
+                self.updated_at = parse_time(kwargs["updated_at"])
             else:
                 self.updated_at = datetime.now(timezone.utc)
 
@@ -68,9 +129,9 @@ class BaseModel:
         new_dict = self.__dict__.copy()
 
         if "created_at" in new_dict:
-            new_dict["created_at"] = new_dict["created_at"].strftime(time)
+            new_dict["created_at"] = format_time(new_dict["created_at"])
         if "updated_at" in new_dict:
-            new_dict["updated_at"] = new_dict["updated_at"].strftime(time)
+            new_dict["updated_at"] = format_time(new_dict["updated_at"])
 
         new_dict["__class__"] = self.__class__.__name__
 
@@ -1,7 +1,7 @@
 #!/usr/bin/python
 """ holds class City"""
 import models
-from models.base_model import BaseModel, Base
+from models.base_model import BaseModel, Base, IndexedAttribute
 from os import getenv
 import sqlalchemy
 from sqlalchemy import Column, String, ForeignKey
@@ -12,13 +12,21 @@ class City(BaseModel, Base):
     """Representation of city """
     if models.storage_t == "db":
         __tablename__ = 'cities'
-        state_id = Column(String(60), ForeignKey('states.id'), nullable=False)
+        state_id = Column(String(60), ForeignKey('states.id'),
+                          index=True, nullable=False)
         name = Column(String(128), nullable=False)
         places = relationship("Place", backref="cities")
     else:
-        state_id = ""
+        state_id = IndexedAttribute("")
         name = ""
 
     def __init__(self, *args, **kwargs):
         """initializes city"""
-        super().__init__(*args, **kwargs)
\ No newline at end of file
+        super().__init__(*args, **kwargs)
+
+    if models.storage_t != "db":
+        @property
+        def places(self):
+            """getter for list of place instances located in the city"""
+            from models.place import Place
+            return models.storage.filter_by(Place, city_id=self.id)
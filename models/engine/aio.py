@@ -0,0 +1,64 @@
+#!/usr/bin/python3
+"""
+Contains the class AsyncStorage
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from os import getenv
+
+
+class AsyncStorage:
+    """awaitable facade of a storage engine, whose calls run in a pool of
+    threads so that the event loop never waits on them
+
+    Every awaited call is a unit of work: it runs on one thread of the
+    pool, then the storage is closed on that same thread, which hands the
+    database session back. The objects it returns keep their loaded
+    attributes but no longer load relationships; ask for those with eager,
+    or pass a function doing all the work, writes included, to run().
+
+        state = await storage.get(State, state_id, eager=("cities",))
+        await storage.run(lambda: (storage.storage.new(obj),
+                                   storage.storage.save()))
+    """
+
+    def __init__(self, storage, executor=None):
+        """wraps storage, running its calls in executor, by default a pool
+        of HBNB_STORAGE_THREADS (32) threads"""
+        if executor is None:
+            executor = ThreadPoolExecutor(
+                int(getenv("HBNB_STORAGE_THREADS", "32")),
+                thread_name_prefix="hbnb-storage")
+        self.storage = storage
+        self.executor = executor
+
+    def __getattr__(self, name):
+        """returns the awaitable version of the storage method name"""
+        if name.startswith("_"):
+            raise AttributeError(name)
+        method = getattr(self.storage, name)
+        if not callable(method):
+            raise AttributeError(name)
+
+        async def call(*args, **kwargs):
+            """runs the storage method as a unit of work"""
+            return await self.run(method, *args, **kwargs)
+        call.__name__ = name
+        call.__doc__ = method.__doc__
+        return call
+
+    async def run(self, func, *args, **kwargs):
+        """returns what func(*args, **kwargs) returns, called on a thread of
+        the pool, the storage being closed on that thread afterwards"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, partial(self.__unit, func, args, kwargs))
+
+    def __unit(self, func, args, kwargs):
+        """calls func, then closes the storage of the current thread"""
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self.storage.close()
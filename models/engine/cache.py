@@ -0,0 +1,80 @@
+#!/usr/bin/python3
+"""
+Contains the class ObjectCache
+"""
+
+from collections import OrderedDict
+import threading
+import time
+
+
+class ObjectCache:
+    """process-local LRU cache whose entries also expire after ttl seconds
+
+    A maxsize of 0 disables the cache, a ttl of 0 keeps entries until they
+    are evicted or discarded.
+    """
+
+    def __init__(self, maxsize=1024, ttl=0):
+        """Instantiate an empty cache"""
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.__entries = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def get(self, key):
+        """returns the value cached for key, or None"""
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None:
+                value, expires = entry
+                if not expires or expires > time.monotonic():
+                    self.__entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self.__entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key, value):
+        """caches value for key, evicting the least recently used entries
+        beyond maxsize"""
+        if not self.maxsize:
+            return
+        expires = time.monotonic() + self.ttl if self.ttl else 0
+        with self.__lock:
+            self.__entries[key] = (value, expires)
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.maxsize:
+                self.__entries.popitem(last=False)
+                self.evictions += 1
+
+    def discard(self, key):
+        """removes the entry of key if any"""
+        with self.__lock:
+            self.__entries.pop(key, None)
+
+    def discard_prefix(self, prefix):
+        """removes the entries whose key starts with prefix"""
+        with self.__lock:
+            for key in [key for key in self.__entries
+                        if key.startswith(prefix)]:
+                del self.__entries[key]
+
+    def clear(self):
+        """removes all the entries"""
+        with self.__lock:
+            self.__entries.clear()
+
+    def __len__(self):
+        """returns the number of entries, expired or not"""
+        return len(self.__entries)
+
+    def status(self):
+        """returns the counters and the size of the cache"""
+        return {"entries": len(self), "maxsize": self.maxsize,
+                "ttl": self.ttl, "hits": self.hits, "misses": self.misses,
+                "evictions": self.evictions}
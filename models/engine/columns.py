@@ -0,0 +1,101 @@
+#!/usr/bin/python3
+"""
+Contains the class Columns
+"""
+
+from array import array
+import math
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class Columns:
+    """numeric attributes of the objects of one class, stored column-wise
+
+    Every attribute has an array of doubles with one row per object; the
+    last row moves into the hole a removed object leaves. Values that are
+    not numbers are stored as NaN, which no range matches. Range queries
+    are boolean masks over whole columns when NumPy is installed, and a
+    loop over the arrays otherwise.
+    """
+
+    def __init__(self, attrs):
+        """Instantiate empty columns for the attribute names attrs"""
+        self.attrs = tuple(attrs)
+        self.keys = []
+        self.rows = {}
+        self.__columns = {attr: array("d") for attr in self.attrs}
+
+    def __len__(self):
+        """returns the number of rows"""
+        return len(self.keys)
+
+    @staticmethod
+    def number(value):
+        """returns value as a float, NaN if it is not a number"""
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return float(value)
+        return math.nan
+
+    def add(self, key, obj):
+        """appends the row of obj, stored under key"""
+        if key in self.rows:
+            self.remove(key)
+        self.rows[key] = len(self.keys)
+        self.keys.append(key)
+        for attr, column in self.__columns.items():
+            column.append(self.number(getattr(obj, attr)))
+
+    def remove(self, key):
+        """removes the row stored under key, if any"""
+        row = self.rows.pop(key, None)
+        if row is None:
+            return
+        last = self.keys.pop()
+        for column in self.__columns.values():
+            value = column.pop()
+            if row < len(column):
+                column[row] = value
+        if row < len(self.keys):
+            self.keys[row] = last
+            self.rows[last] = row
+
+    def set(self, key, attr, value):
+        """updates the attr value of the row stored under key"""
+        row = self.rows.get(key)
+        if row is not None:
+            self.__columns[attr][row] = self.number(value)
+
+    def select(self, ranges):
+        """returns the keys of the rows whose values are within ranges, a
+        dictionary of attribute -> (low, high), None meaning unbounded"""
+        if numpy is not None:
+            # one C-level copy per column, so that no append races with it
+            columns = [(numpy.array(self.__columns[attr]), low, high)
+                       for attr, (low, high) in ranges.items()]
+            size = min([len(self.keys)] + [len(values)
+                                           for values, _, _ in columns])
+            mask = numpy.ones(size, dtype=bool)
+            for values, low, high in columns:
+                values = values[:size]
+                if low is not None:
+                    mask &= values >= low
+                if high is not None:
+                    mask &= values <= high
+            keys = self.keys
+            return [keys[row] for row in numpy.flatnonzero(mask).tolist()]
+        rows = None
+        for attr, (low, high) in ranges.items():
+            low = -math.inf if low is None else low
+            high = math.inf if high is None else high
+            column = self.__columns[attr]
+            if rows is None:
+                rows = [row for row, value in enumerate(column)
+                        if low <= value <= high]
+            else:
+                rows = [row for row in rows if low <= column[row] <= high]
+        if rows is None:
+            return list(self.keys)
+        return [self.keys[row] for row in rows]
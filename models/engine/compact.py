@@ -0,0 +1,142 @@
+#!/usr/bin/python3
+"""
+Contains the function compact_class and the class Field
+"""
+
+import models
+from models.base_model import IndexedAttribute
+
+# integer - compact classes made for one model class at most, past which
+# objects of new attribute sets keep the model class
+MAX_SHAPES = 32
+# (model class, attribute names) -> its compact class, or the model class
+shapes = {}
+# model class -> number of compact classes made for it
+made = {}
+# what a Field without a class-level value reads as until set
+missing = object()
+
+
+class Field:
+    """attribute of a compact class, stored in a slot of the object rather
+    than in its __dict__
+
+    Until it is set, it reads as the class-level value it shadows, as an
+    instance attribute would. Setting one that shadows an IndexedAttribute
+    tells models.storage, as the IndexedAttribute does.
+    """
+
+    def __init__(self, name, slot, default=missing, indexed=False):
+        """Instantiate the field name stored in the member descriptor slot"""
+        self.name = name
+        self.slot = slot
+        self.default = default
+        self.indexed = indexed
+
+    def __get__(self, obj, objtype=None):
+        """returns the value of obj, or the class-level value"""
+        if obj is not None:
+            try:
+                return self.slot.__get__(obj)
+            except AttributeError:
+                pass
+        if self.default is missing:
+            raise AttributeError(self.name)
+        return self.default
+
+    def __set__(self, obj, value):
+        """stores the value in obj and reports the change if indexed"""
+        if not self.indexed:
+            self.slot.__set__(obj, value)
+            return
+        old = self.__get__(obj)
+        self.slot.__set__(obj, value)
+        if old != value:
+            models.storage.reindex(obj, self.name, old)
+
+    def __delete__(self, obj):
+        """unsets the value of obj"""
+        try:
+            self.slot.__delete__(obj)
+        except AttributeError:
+            raise AttributeError(self.name) from None
+
+    def has(self, obj):
+        """tells if obj has a value of its own"""
+        try:
+            self.slot.__get__(obj)
+        except AttributeError:
+            return False
+        return True
+
+
+def compact_class(cls, names):
+    """returns a subclass of the model class cls, named like it, whose
+    objects keep the attributes names (and the IndexedAttribute ones of
+    cls) in slots; cls itself if they cannot
+
+    Its objects only get a __dict__ for attributes set outside of names.
+    Their __dict__ attribute reads as a new dictionary of every attribute
+    set, in the order of names, so that to_dict() and __str__() show what
+    the model class would.
+    """
+    key = (cls, names)
+    klass = shapes.get(key)
+    if klass is None:
+        klass = cls
+        if made.get(cls, 0) < MAX_SHAPES:
+            klass = shaped(cls, names) or cls
+            made[cls] = made.get(cls, 0) + int(klass is not cls)
+        shapes[key] = klass
+    return klass
+
+
+def shaped(cls, names):
+    """returns the compact class of cls for names, None if one of them
+    cannot be a Field (private, a method, a property...)"""
+    found = {}
+    for klass in reversed(cls.__mro__):
+        found.update(vars(klass))
+    indexed = [name for name, value in found.items()
+               if isinstance(value, IndexedAttribute)]
+    names = tuple(names) + tuple(name for name in indexed
+                                 if name not in names)
+    for name in names:
+        value = found.get(name, missing)
+        if not name.isidentifier() or name.startswith("_") or \
+                (not isinstance(value, IndexedAttribute) and
+                 hasattr(type(value), "__get__")):
+            return None
+    real = next(vars(klass)["__dict__"] for klass in cls.__mro__
+                if "__dict__" in vars(klass))
+    fields = []
+
+    def attributes(self):
+        """returns the attributes of the object, as __dict__ would"""
+        values = {field.name: field.slot.__get__(self)
+                  for field in fields if field.has(self)}
+        if getattr(self, "_dict", False):
+            values.update(real.__get__(self))
+        return values
+
+    def assign(self, name, value):
+        """sets an attribute, in __dict__ if it has no Field"""
+        if name not in named:
+            object.__setattr__(self, "_dict", True)
+        cls.__setattr__(self, name, value)
+
+    named = frozenset(names)
+    slots = ["_{}".format(i) for i in range(len(names))]
+    klass = type(cls.__name__, (cls,), {
+        "__slots__": slots + ["_dict"], "__module__": cls.__module__,
+        "__qualname__": cls.__qualname__, "__doc__": cls.__doc__,
+        "__dict__": property(attributes), "__setattr__": assign})
+    for name, slot in zip(names, slots):
+        value = found.get(name, missing)
+        if isinstance(value, IndexedAttribute):
+            field = Field(name, vars(klass)[slot], value.default, True)
+        else:
+            field = Field(name, vars(klass)[slot], value)
+        fields.append(field)
+        type.__setattr__(klass, name, field)
+    return klass
@@ -7,21 +7,150 @@ import models
 from models.amenity import Amenity
 from models.base_model import BaseModel, Base
 from models.city import City
+from models.engine.cache import ObjectCache
+from models.engine.events import CREATED, DELETED, UPDATED
+from models.engine.events import ChangeSet, EventBus
+from models.engine import geo, text
 from models.place import Place
 from models.review import Review
 from models.state import State
 from models.user import User
+from collections import Counter
 from os import getenv
 import sqlalchemy
-from sqlalchemy import create_engine
-from sqlalchemy.orm import scoped_session, sessionmaker
+from sqlalchemy import BigInteger, Column, Integer, String, Table, and_
+from sqlalchemy import create_engine, delete, event, func, insert, inspect
+from sqlalchemy import or_, select, update
+from sqlalchemy.dialects import mysql
+from sqlalchemy.orm import configure_mappers, scoped_session, selectinload
+from sqlalchemy.orm import make_transient_to_detached, sessionmaker
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.util import identity_key
+from sqlalchemy.pool import StaticPool
+import threading
+import time
 
 classes = {"Amenity": Amenity, "City": City,
            "Place": Place, "Review": Review, "State": State, "User": User}
 
+# class name -> attributes whose words the full-text side tables hold
+text_fields = {"Place": ("name", "description"), "Review": ("text",)}
+
+if models.storage_t == "db":
+    # length in terms of the text of every indexed object
+    search_documents = Table("search_documents", Base.metadata,
+                             Column("class_name", String(60),
+                                    primary_key=True),
+                             Column("obj_id", String(60), primary_key=True),
+                             Column("length", Integer, nullable=False))
+    # number of times a term appears in the text of an object; terms are
+    # compared byte for byte, MySQL's default collation would make "café"
+    # and "cafe" the same key
+    search_terms = Table("search_terms", Base.metadata,
+                         Column("class_name", String(60), primary_key=True),
+                         Column("term", String(128).with_variant(
+                             mysql.VARCHAR(128, collation="utf8mb4_bin"),
+                             "mysql"), primary_key=True),
+                         Column("obj_id", String(60), primary_key=True),
+                         Column("tf", Integer, nullable=False))
+    # number of commits that changed the objects of a class
+    generations = Table("generations", Base.metadata,
+                        Column("class_name", String(60), primary_key=True),
+                        Column("generation", BigInteger, nullable=False))
+
+# environment variable -> (create_engine() argument, type)
+pool_settings = {"HBNB_DB_POOL_SIZE": ("pool_size", int),
+                 "HBNB_DB_MAX_OVERFLOW": ("max_overflow", int),
+                 "HBNB_DB_POOL_RECYCLE": ("pool_recycle", int),
+                 "HBNB_DB_POOL_TIMEOUT": ("pool_timeout", float),
+                 "HBNB_DB_POOL_PRE_PING": ("pool_pre_ping", bool)}
+
+
+def pool_options():
+    """returns the create_engine() pool arguments set in the environment"""
+    options = {}
+    for variable, (argument, cast) in pool_settings.items():
+        value = getenv(variable)
+        if value is None:
+            continue
+        if cast is bool:
+            options[argument] = value.lower() in ("1", "true", "yes")
+        else:
+            options[argument] = cast(value)
+    return options
+
+
+# PRAGMA -> value, set on every new SQLite connection
+sqlite_pragmas = {"journal_mode": "WAL",
+                  "synchronous": "NORMAL",
+                  "foreign_keys": "ON",
+                  "cache_size": -65536,
+                  "temp_store": "MEMORY",
+                  "busy_timeout": 5000}
+
+
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """applies sqlite_pragmas to a new SQLite connection"""
+    cursor = dbapi_connection.cursor()
+    for pragma, value in sqlite_pragmas.items():
+        cursor.execute("PRAGMA {} = {}".format(pragma, value))
+    cursor.close()
+
+
+def sqlite_engine(path):
+    """returns an engine on the SQLite database file path, or on a private
+    in-memory database shared by all threads for the path :memory:"""
+    connect_args = {"check_same_thread": False}
+    if path == ":memory:":
+        engine = create_engine("sqlite://", poolclass=StaticPool,
+                               connect_args=connect_args)
+    else:
+        engine = create_engine("sqlite:///" + path,
+                               connect_args=connect_args, **pool_options())
+    event.listen(engine, "connect", set_sqlite_pragmas)
+    return engine
+
+
+class PoolMetrics:
+    """counts the connection pool events of an engine"""
+
+    def __init__(self, engine):
+        """starts listening to the pool events of engine"""
+        self.engine = engine
+        self.connects = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.invalidations = 0
+        self.__lock = threading.Lock()
+        event.listen(engine, "connect", self.__count("connects"))
+        event.listen(engine, "checkout", self.__count("checkouts"))
+        event.listen(engine, "checkin", self.__count("checkins"))
+        event.listen(engine, "invalidate", self.__count("invalidations"))
+
+    def __count(self, counter):
+        """returns an event listener incrementing counter"""
+        def listener(*args):
+            """increments the counter of the event"""
+            with self.__lock:
+                setattr(self, counter, getattr(self, counter) + 1)
+        return listener
+
+    def status(self):
+        """returns the counters and the current state of the pool"""
+        pool = self.engine.pool
+        status = {"pool": type(pool).__name__,
+                  "connects": self.connects,
+                  "checkouts": self.checkouts,
+                  "checkins": self.checkins,
+                  "invalidations": self.invalidations}
+        for name in ("size", "checkedin", "checkedout", "overflow"):
+            if hasattr(pool, name):
+                status[name] = getattr(pool, name)()
+        return status
+
 
 class DBStorage:
-    """interaacts with the MySQL database"""
+    """interaacts with the MySQL or SQLite database"""
     __engine = None
     __session = None
 
@@ -32,62 +161,528 @@ class DBStorage:
         HBNB_MYSQL_HOST = getenv('HBNB_MYSQL_HOST')
         HBNB_MYSQL_DB = getenv('HBNB_MYSQL_DB')
         HBNB_ENV = getenv('HBNB_ENV')
-        self.__engine = create_engine('mysql+mysqldb://{}:{}@{}/{}'.
-                                      format(HBNB_MYSQL_USER,
-                                             HBNB_MYSQL_PWD,
-                                             HBNB_MYSQL_HOST,
-                                             HBNB_MYSQL_DB))
+        if getenv('HBNB_TYPE_STORAGE') == 'sqlite':
+            self.__engine = sqlite_engine(getenv('HBNB_SQLITE_PATH',
+                                                 'hbnb.db'))
+        else:
+            self.__engine = create_engine('mysql+mysqldb://{}:{}@{}/{}'.
+                                          format(HBNB_MYSQL_USER,
+                                                 HBNB_MYSQL_PWD,
+                                                 HBNB_MYSQL_HOST,
+                                                 HBNB_MYSQL_DB),
+                                          **pool_options())
+        self.__pool = PoolMetrics(self.__engine)
+        self.__cache = ObjectCache(int(getenv('HBNB_CACHE_SIZE', '1024')),
+                                   float(getenv('HBNB_CACHE_TTL', '10')))
+        self.__counts = {}
+        self.__counted = None
+        self.__count_ttl = float(getenv('HBNB_COUNT_TTL', '5'))
+        self.__count_lock = threading.Lock()
+        # number of commits that dropped cached objects, and its lock
+        self.__invalidations = 0
+        self.__cache_lock = threading.Lock()
+        # class name -> generation the cached objects of the class are of
+        self.__seen = {}
+        self.__events = EventBus()
+        self.__events.subscribe(self.__invalidate)
+        self.__events.subscribe(self.__recount)
         if HBNB_ENV == "test":
             Base.metadata.drop_all(self.__engine)
 
-    def all(self, cls=None):
-        """query on the current database session"""
+    def all(self, cls=None, eager=()):
+        """query on the current database session
+
+        eager names relationships of cls to load in the same round trips
+        (one extra SELECT ... IN per relationship instead of one per
+        object), dotted for nested ones, e.g. ("cities.places",)
+        """
         new_dict = {}
-        for clss in classes:
-            if cls is None or cls is classes[clss] or cls is clss:
-                objs = self.__session.query(classes[clss]).all()
-                for obj in objs:
-                    key = obj.__class__.__name__ + '.' + obj.id
-                    new_dict[key] = obj
-        return (new_dict)
+        for name, clss in classes.items():
+            if cls is None or cls is clss or cls == name:
+                query = self.__session.query(clss)
+                if cls is not None and eager:
+                    query = query.options(*self.__loaders(clss, eager))
+                prefix = name + "."
+                for obj in query:
+                    new_dict[prefix + obj.id] = obj
+        return new_dict
 
     def new(self, obj):
         """add the object to the current database session"""
+        self.__cache.discard(type(obj).__name__ + "." + obj.id)
         self.__session.add(obj)
 
     def save(self):
         """commit all changes of the current database session"""
-        self.__session.commit()
+        session = self.__session
+        self.__write_text(self.__text_changes(session))
+        session.commit()
 
     def delete(self, obj=None):
         """delete from the current database session obj if not None"""
         if obj is not None:
+            self.__cache.discard(type(obj).__name__ + "." + obj.id)
             self.__session.delete(obj)
 
     def reload(self):
         """reloads data from the database"""
+        self.__cache.clear()
+        self.__seen = {}
+        self.__counted = None
         Base.metadata.create_all(self.__engine)
+        self.__add_generations()
         sess_factory = sessionmaker(bind=self.__engine, expire_on_commit=False)
+        event.listen(sess_factory, "after_flush", self.__flushed)
+        event.listen(sess_factory, "after_begin", self.__began)
+        event.listen(sess_factory, "before_commit", self.__committing)
+        event.listen(sess_factory, "after_commit", self.__committed)
+        event.listen(sess_factory, "after_rollback", self.__rolled_back)
         Session = scoped_session(sess_factory)
         self.__session = Session
+        self.__backfill_text()
 
     def close(self):
         """call remove() method on the private session attribute"""
         self.__session.remove()
-        
-    def get(self, cls, id):
-        """Retrieve one object based on the class name and its ID."""
+
+    def dispose(self, close=True):
+        """discards the pooled connections of the engine; a process forked
+        after using the engine passes close=False so as to leave those of
+        its parent open"""
+        self.__engine.dispose(close=close)
+
+    def get(self, cls, id, eager=()):
+        """Retrieve one object based on the class name and its ID.
+
+        eager names relationships to load along, as for all().
+        Objects without eager relationships come from the session, then
+        from the process-wide object cache, and only then from the database.
+        generation() drops the cached objects of a class once it finds
+        that another process changed that class.
+        """
         if cls and id:
-            obj = self.__session.query(cls).filter(cls.id == id).first()
+            if isinstance(cls, str):
+                cls = classes[cls]
+            if eager:
+                return self.__session.get(cls, id,
+                                          options=self.__loaders(cls, eager))
+            if identity_key(cls, id) in self.__session.identity_map:
+                return self.__session.get(cls, id)
+            key = cls.__name__ + "." + id
+            cached = self.__cache.get(key)
+            if cached is not None:
+                return self.__session.merge(cached, load=False)
+            session = self.__session()
+            obj = session.get(cls, id)
+            if obj is not None:
+                # a copy read before a commit dropped the key is stale
+                with self.__cache_lock:
+                    if session.info.get("invalidations") == \
+                            self.__invalidations:
+                        self.__cache.put(key, self.__detached_copy(obj))
             return obj
         return None
 
+    def page(self, cls, limit, after=None, **kwargs):
+        """returns, ordered by id, up to limit objects of cls whose id comes
+        after the id after and whose attributes equal kwargs"""
+        if isinstance(cls, str):
+            cls = classes[cls]
+        query = self.__session.query(cls).filter_by(**kwargs)
+        if after is not None:
+            query = query.filter(cls.id > after)
+        return query.order_by(cls.id).limit(limit).all()
+
+    def stream(self, cls, batch=1000, eager=(), **kwargs):
+        """returns an iterator over the objects of cls whose attributes
+        equal kwargs, fetched batch rows at a time from a server-side
+        cursor instead of all at once, with the eager relationships of
+        each batch loaded along as for all()"""
+        if isinstance(cls, str):
+            cls = classes[cls]
+        query = self.__session.query(cls).filter_by(**kwargs)
+        if eager:
+            query = query.options(*self.__loaders(cls, eager))
+        return iter(query.yield_per(batch))
+
+    def insert(self, cls, rows):
+        """adds the column dictionaries rows to the table of cls, a class,
+        a class name or a Table, in one executemany; save() commits them
+
+        The objects skip the session, so nothing but the database sees them
+        until they are queried.
+        """
+        if isinstance(cls, str):
+            cls = classes[cls]
+        if rows:
+            self.__session.execute(insert(cls), rows)
+            if getattr(cls, "__name__", None) in classes:
+                changes = self.__changes(self.__session())
+                for row in rows:
+                    changes.add(cls.__name__, row["id"], CREATED)
+            fields = text_fields.get(getattr(cls, "__name__", None))
+            if fields:
+                self.__write_text({
+                    (cls.__name__, row["id"]): text.document(
+                        row.get(attr) for attr in fields) for row in rows})
+
+    def filter_by(self, cls, **kwargs):
+        """returns the list of objects of cls whose attributes equal kwargs"""
+        if isinstance(cls, str):
+            cls = classes[cls]
+        return self.__session.query(cls).filter_by(**kwargs).all()
+
+    def where(self, cls, **conditions):
+        """returns the list of objects of cls whose attributes meet the
+        conditions: a (low, high) tuple matches the values of that closed
+        range, either end None for no bound, any other value by equality"""
+        if isinstance(cls, str):
+            cls = classes[cls]
+        query = self.__session.query(cls)
+        for attr, value in conditions.items():
+            column = getattr(cls, attr)
+            if not isinstance(value, tuple):
+                query = query.filter(column == value)
+                continue
+            low, high = value
+            if low is not None:
+                query = query.filter(column >= low)
+            if high is not None:
+                query = query.filter(column <= high)
+        return query.all()
+
+    def within(self, cls, south, west, north, east):
+        """returns the list of objects of cls located in a bounding box, which
+        crosses the antimeridian if west is greater than east"""
+        if isinstance(cls, str):
+            cls = classes[cls]
+        boxes = [and_(cls.latitude.between(box[0], box[2]),
+                      cls.longitude.between(box[1], box[3]))
+                 for box in geo.split(south, west, north, east)]
+        return self.__session.query(cls).filter(or_(*boxes)).all()
+
+    def near(self, cls, lat, lng, radius_km):
+        """returns the list of objects of cls within radius_km of a point,
+        nearest first: the boxes around the circle are read with SQL, then
+        filtered and sorted by great-circle distance"""
+        found = []
+        for box in geo.around(lat, lng, radius_km):
+            for obj in self.within(cls, *box):
+                d = geo.distance(lat, lng, obj.latitude, obj.longitude)
+                if d <= radius_km:
+                    found.append((d, obj))
+        found.sort(key=lambda item: item[0])
+        return [obj for d, obj in found]
+
+    def generation(self, *clss):
+        """returns a token that changes whenever an object of the classes is
+        added, updated or deleted: their rows of the generations table,
+        which every commit changing them increments, read by primary key in
+        one round trip, so that every process sees them alike
+        """
+        names = [cls if isinstance(cls, str) else cls.__name__
+                 for cls in clss]
+        found = dict(self.__session.execute(
+            select(generations.c.class_name, generations.c.generation)
+            .where(generations.c.class_name.in_(names))).all())
+        with self.__cache_lock:
+            for name in names:
+                if self.__seen.get(name) != found.get(name, 0):
+                    # rows cached before are older than the token
+                    self.__invalidations += 1
+                    self.__cache.discard_prefix(name + ".")
+                    self.__seen[name] = found.get(name, 0)
+        return ".".join(str(found.get(name, 0)) for name in names)
+
+    def search(self, cls, query, limit=None):
+        """returns the list of objects of cls whose indexed text holds any
+        word of query, the most relevant first, at most limit of them
+
+        The terms are looked up in the search_terms side table and ranked
+        with BM25 as in file storage.
+        """
+        if isinstance(cls, str):
+            cls = classes[cls]
+        name = cls.__name__
+        terms = set(self.__terms(query))
+        if not terms or name not in text_fields:
+            return []
+        session = self.__session
+        rows = session.execute(
+            select(search_terms.c.term, search_terms.c.obj_id,
+                   search_terms.c.tf, search_documents.c.length)
+            .join(search_documents, and_(
+                search_documents.c.class_name == search_terms.c.class_name,
+                search_documents.c.obj_id == search_terms.c.obj_id))
+            .where(search_terms.c.class_name == name,
+                   search_terms.c.term.in_(terms))).all()
+        if not rows:
+            return []
+        count, average = session.execute(
+            select(func.count(), func.avg(search_documents.c.length))
+            .where(search_documents.c.class_name == name)).one()
+        df = Counter(row.term for row in rows)
+        scores = {}
+        for term, obj_id, tf, length in rows:
+            scores[obj_id] = scores.get(obj_id, 0) + text.bm25(
+                tf, df[term], count, length, float(average))
+        ids = text.rank(scores, limit)
+        objs = {}
+        for i in range(0, len(ids), 500):
+            for obj in session.query(cls).filter(cls.id.in_(ids[i:i + 500])):
+                objs[obj.id] = obj
+        # objects deleted by a cascade leave rows behind
+        return [objs[obj_id] for obj_id in ids if obj_id in objs]
+
+    def subscribe(self, callback, asynchronous=False):
+        """calls callback with the ChangeSet of (class name, id, op) of every
+        committed transaction, from a worker thread if asynchronous is True
+
+        Synchronous callbacks run while the session finishes the commit, so
+        they must not use the session themselves.
+        """
+        self.__events.subscribe(callback, asynchronous)
+
+    def unsubscribe(self, callback):
+        """stops calling callback with the changes"""
+        self.__events.unsubscribe(callback)
+
+    def event_status(self):
+        """returns the change event counters"""
+        return self.__events.status()
+
+    @staticmethod
+    def __changes(session):
+        """returns the ChangeSet of the transaction of session"""
+        changes = session.info.get("changes")
+        if changes is None:
+            changes = session.info["changes"] = ChangeSet()
+        return changes
+
+    def __flushed(self, session, flush_context):
+        """records the objects a flush wrote in the ChangeSet of its
+        transaction"""
+        changes = self.__changes(session)
+        for objs, op in ((session.new, CREATED), (session.dirty, UPDATED),
+                         (session.deleted, DELETED)):
+            for obj in objs:
+                if op == UPDATED and not session.is_modified(obj):
+                    continue
+                changes.add(type(obj).__name__, obj.id, op)
+
+    def __committing(self, session):
+        """increments, in the transaction session commits, the generations
+        of the classes whose objects it changed"""
+        session.flush()
+        changes = session.info.get("changes")
+        if not changes:
+            return
+        # always in the same order, so that commits never deadlock on them
+        names = sorted({name for name, id, op in changes})
+        session.execute(update(generations)
+                        .where(generations.c.class_name.in_(names))
+                        .values(generation=generations.c.generation + 1))
+        session.info["generations"] = dict(session.execute(
+            select(generations.c.class_name, generations.c.generation)
+            .where(generations.c.class_name.in_(names))).all())
+
+    def __add_generations(self):
+        """adds the missing rows of the generations table, starting at the
+        current time in milliseconds so that the tokens of a database
+        created again never repeat those of the one it replaced"""
+        with self.__engine.connect() as conn:
+            found = set(conn.execute(
+                select(generations.c.class_name)).scalars())
+            start = int(time.time() * 1000)
+            rows = [{"class_name": name, "generation": start}
+                    for name in classes if name not in found]
+            if not rows:
+                return
+            try:
+                conn.execute(insert(generations), rows)
+                conn.commit()
+            except sqlalchemy.exc.IntegrityError:
+                # another process added them first
+                conn.rollback()
+
+    def __committed(self, session):
+        """publishes the ChangeSet of the transaction session committed"""
+        changes = session.info.pop("changes", None)
+        if changes is not None:
+            self.__events.publish(changes)
+        with self.__cache_lock:
+            for name, value in session.info.pop("generations", {}).items():
+                # the commit already dropped the objects it changed, unless
+                # another process committed in between
+                if self.__seen.get(name) == value - 1:
+                    self.__seen[name] = value
+
+    def __rolled_back(self, session):
+        """forgets the ChangeSet of the transaction session rolled back"""
+        session.info.pop("changes", None)
+        session.info.pop("generations", None)
+
+    def __began(self, session, transaction, connection):
+        """records how many invalidations the rows the transaction reads
+        may predate"""
+        session.info["invalidations"] = self.__invalidations
+
+    def __invalidate(self, changes):
+        """drops the cached copies of the objects changes changed"""
+        with self.__cache_lock:
+            self.__invalidations += 1
+            for name, id, op in changes:
+                self.__cache.discard(name + "." + id)
+
+    def __recount(self, changes):
+        """applies the objects changes created and deleted to the counts"""
+        with self.__count_lock:
+            if self.__counted is None:
+                return
+            if self.__counted >= changes.started:
+                # counts fetched during the transaction may include it or not
+                self.__counted = None
+                return
+            for name, id, op in changes:
+                if op == CREATED:
+                    self.__counts[name] += 1
+                elif op == DELETED:
+                    self.__counts[name] -= 1
+
+    @staticmethod
+    def __terms(value):
+        """returns the terms of a text as the side table stores them"""
+        return [term[:128] for term in text.tokenize(value)]
+
+    def __text_changes(self, session):
+        """returns {(class name, id): text, None if deleted} of the objects
+        of session whose indexed text the next commit changes"""
+        changes = {}
+        for objs in (session.new, session.dirty):
+            for obj in objs:
+                fields = text_fields.get(type(obj).__name__)
+                if not fields:
+                    continue
+                state = inspect(obj)
+                if objs is session.dirty and not any(
+                        state.attrs[attr].history.has_changes()
+                        for attr in fields):
+                    continue
+                changes[(type(obj).__name__, obj.id)] = text.document(
+                    getattr(obj, attr) for attr in fields)
+        for obj in session.deleted:
+            if type(obj).__name__ in text_fields:
+                changes[(type(obj).__name__, obj.id)] = None
+        return changes
+
+    def __write_text(self, changes):
+        """replaces the side table rows of the objects of changes, as
+        returned by __text_changes(), in the current transaction"""
+        session = self.__session
+        by_class = {}
+        for (name, obj_id), value in changes.items():
+            by_class.setdefault(name, {})[obj_id] = value
+        for name, texts in by_class.items():
+            ids = list(texts)
+            for i in range(0, len(ids), 500):
+                for table in (search_documents, search_terms):
+                    session.execute(delete(table).where(
+                        table.c.class_name == name,
+                        table.c.obj_id.in_(ids[i:i + 500])))
+            documents = []
+            terms = []
+            for obj_id, value in texts.items():
+                if value is None:
+                    continue
+                counts = Counter(self.__terms(value))
+                documents.append({"class_name": name, "obj_id": obj_id,
+                                  "length": sum(counts.values())})
+                terms.extend({"class_name": name, "term": term,
+                              "obj_id": obj_id, "tf": tf}
+                             for term, tf in counts.items())
+            if documents:
+                session.execute(insert(search_documents), documents)
+            if terms:
+                session.execute(insert(search_terms), terms)
+
+    def __backfill_text(self):
+        """indexes the text of the objects stored before the side tables
+        existed, for the classes none of whose objects is indexed"""
+        session = self.__session
+        for name, fields in text_fields.items():
+            indexed = session.execute(select(search_documents.c.obj_id).where(
+                search_documents.c.class_name == name).limit(1)).first()
+            if indexed is not None:
+                continue
+            changes = {}
+            for obj in self.stream(classes[name]):
+                changes[(name, obj.id)] = text.document(
+                    getattr(obj, attr) for attr in fields)
+                if len(changes) == 1000:
+                    self.__write_text(changes)
+                    changes = {}
+            self.__write_text(changes)
+            session.commit()
+
+    def pool_status(self):
+        """returns the connection pool counters and state"""
+        return self.__pool.status()
+
+    def cache_status(self):
+        """returns the object cache counters and size"""
+        return self.__cache.status()
+
+    @staticmethod
+    def __detached_copy(obj):
+        """returns a detached, unmodified copy of the columns of obj that
+        sessions can merge without loading it again"""
+        mapper = inspect(obj).mapper
+        copy = mapper.class_manager.new_instance()
+        for attr in mapper.column_attrs:
+            set_committed_value(copy, attr.key, getattr(obj, attr.key))
+        make_transient_to_detached(copy)
+        return copy
+
+    def __loaders(self, cls, eager):
+        """returns the selectinload options of the relationship paths"""
+        if not eager:
+            return []
+        configure_mappers()
+        options = []
+        for path in eager:
+            owner = cls
+            loader = None
+            for name in path.split("."):
+                attr = getattr(owner, name)
+                if loader is None:
+                    loader = selectinload(attr)
+                else:
+                    loader = loader.selectinload(attr)
+                owner = attr.property.mapper.class_
+            options.append(loader)
+        return options
+
     def count(self, cls=None):
-        """Return the number of objects in storage matching the given class."""
-        if cls:
-            return self.__session.query(cls).count()
-        else:
-            total_count = 0
-            for class_name in classes.values():
-                total_count += self.__session.query(class_name).count()
-            return total_count
+        """Return the number of objects in storage matching the given class.
+
+        The counts of all the classes are fetched together in one query,
+        then kept up to date by save() for HBNB_COUNT_TTL seconds, which
+        also bounds how long rows written by other processes go unseen.
+        """
+        with self.__count_lock:
+            now = time.monotonic()
+            if self.__counted is None or \
+                    now - self.__counted >= self.__count_ttl:
+                self.__counts = self.__count_all()
+                self.__counted = now
+            if cls:
+                name = cls if isinstance(cls, str) else cls.__name__
+                return self.__counts[name]
+            return sum(self.__counts.values())
+
+    def __count_all(self):
+        """returns the number of rows of every class, in one round trip"""
+        counts = [select(func.count()).select_from(clss).scalar_subquery()
+                  .label(name) for name, clss in classes.items()]
+        row = self.__session.execute(select(*counts)).one()
+        return dict(row._mapping)
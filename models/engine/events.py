@@ -0,0 +1,152 @@
+#!/usr/bin/python3
+"""
+Contains the classes ChangeSet and EventBus the storage engines publish
+their changes with
+"""
+
+import os
+import queue
+import threading
+import time
+
+CREATED = "created"
+UPDATED = "updated"
+DELETED = "deleted"
+
+# (op so far, next op) -> the op of both together, None if they cancel out
+coalesced = {(CREATED, UPDATED): CREATED,
+             (CREATED, DELETED): None,
+             (UPDATED, UPDATED): UPDATED,
+             (UPDATED, DELETED): DELETED,
+             (DELETED, CREATED): UPDATED}
+
+
+class ChangeSet:
+    """changes of a batch, at most one per object: (class name, id, op)
+
+    An object created then updated in the same batch is only created, one
+    created then deleted does not appear at all. started is the
+    time.monotonic() of the first change.
+    """
+
+    def __init__(self):
+        """Instantiate an empty change set"""
+        self.started = None
+        self.__ops = {}
+
+    def __len__(self):
+        """returns the number of changed objects"""
+        return len(self.__ops)
+
+    def __iter__(self):
+        """returns an iterator over the (class name, id, op) of the batch"""
+        return ((name, id, op) for (name, id), op in self.__ops.items())
+
+    def add(self, name, id, op):
+        """records the op on the object of class name and id"""
+        if self.started is None:
+            self.started = time.monotonic()
+        key = (name, id)
+        previous = self.__ops.get(key)
+        if previous is None:
+            self.__ops[key] = op
+            return
+        op = coalesced.get((previous, op), op)
+        if op is None:
+            del self.__ops[key]
+        else:
+            self.__ops[key] = op
+
+
+class EventBus:
+    """delivers the change sets of a storage engine to its subscribers
+
+    Synchronous subscribers are called by publish(), in the thread that
+    committed the changes, asynchronous ones by a worker thread started on
+    their first change set. A subscriber raising an exception does not
+    stop the others; it is counted in status(). Without subscribers,
+    publish() returns at once and the engines skip recording changes.
+    """
+
+    def __init__(self):
+        """Instantiate a bus without subscribers"""
+        self.__sync = ()
+        self.__async = ()
+        self.__queue = None
+        self.__pid = None
+        self.__lock = threading.Lock()
+        self.published = 0
+        self.events = 0
+        self.errors = 0
+
+    def __bool__(self):
+        """tells if anyone subscribed"""
+        return bool(self.__sync or self.__async)
+
+    def subscribe(self, callback, asynchronous=False):
+        """calls callback with every ChangeSet published from now on, from
+        a worker thread if asynchronous is True"""
+        with self.__lock:
+            if asynchronous:
+                self.__async += (callback,)
+            else:
+                self.__sync += (callback,)
+
+    def unsubscribe(self, callback):
+        """stops calling callback"""
+        with self.__lock:
+            self.__sync = tuple(c for c in self.__sync if c != callback)
+            self.__async = tuple(c for c in self.__async if c != callback)
+
+    def publish(self, changes):
+        """delivers the ChangeSet changes unless it is empty"""
+        if not changes or not self:
+            return
+        with self.__lock:
+            self.published += 1
+            self.events += len(changes)
+        self.__deliver(self.__sync, changes)
+        if self.__async:
+            self.__worker().put(changes)
+
+    def join(self):
+        """waits until the asynchronous subscribers got every change set
+        published so far"""
+        if self.__queue is not None and self.__pid == os.getpid():
+            self.__queue.join()
+
+    def status(self):
+        """returns the counters of the bus"""
+        return {"subscribers": len(self.__sync) + len(self.__async),
+                "published": self.published, "events": self.events,
+                "errors": self.errors}
+
+    def __deliver(self, callbacks, changes):
+        """calls every callback with changes"""
+        for callback in callbacks:
+            try:
+                callback(changes)
+            except Exception:
+                with self.__lock:
+                    self.errors += 1
+
+    def __worker(self):
+        """returns the queue of the worker thread, starting it if needed,
+        also in a forked process, which does not inherit the thread"""
+        with self.__lock:
+            if self.__queue is None or self.__pid != os.getpid():
+                self.__queue = queue.Queue()
+                self.__pid = os.getpid()
+                threading.Thread(target=self.__run, daemon=True,
+                                 name="hbnb-events").start()
+            return self.__queue
+
+    def __run(self):
+        """delivers the queued change sets to the asynchronous subscribers"""
+        work = self.__queue
+        while True:
+            changes = work.get()
+            try:
+                self.__deliver(self.__async, changes)
+            finally:
+                work.task_done()
@@ -3,10 +3,24 @@
 Contains the FileStorage class
 """
 
+from bisect import bisect_left, bisect_right, insort
 import json
+import os
+from os import getenv
+import sys
+import threading
+from types import MappingProxyType
+import uuid
 from models.amenity import Amenity
-from models.base_model import BaseModel
+from models.base_model import BaseModel, IndexedAttribute, NumericAttribute
+from models.base_model import TextAttribute
 from models.city import City
+from models.engine.columns import Columns
+from models.engine.compact import compact_class
+from models.engine.events import CREATED, DELETED, UPDATED
+from models.engine.events import ChangeSet, EventBus
+from models.engine.geo import Grid
+from models.engine.text import TextIndex, document
 from models.place import Place
 from models.review import Review
 from models.state import State
@@ -23,61 +37,666 @@ class FileStorage:
     __file_path = "file.json"
     # dictionary - empty but will store all objects by <class name>.id
     __objects = {}
+    # dictionary - <class name> -> {<class name>.id: obj}, mirrors __objects
+    __by_class = {}
+    # dictionary - (<class name>, attribute) -> {value: {<class name>.id: obj}}
+    # for every IndexedAttribute, e.g. ("City", "state_id")
+    __refs = {}
+    # dictionary - <class name> -> sorted ids, built on demand by page()
+    __sorted = {}
+    # dictionary - class -> names of its IndexedAttribute attributes, of its
+    # NumericAttribute attributes, then of its TextAttribute attributes
+    __attributes = {}
+    # dictionary - <class name> -> Columns of its NumericAttribute values
+    __columns = {}
+    # dictionary - <class name> -> Grid of its latitude and longitude
+    __grids = {}
+    # dictionary - <class name> -> TextIndex of its TextAttribute values
+    __texts = {}
+    # the __objects dictionary, and its size, the indexes were built for
+    __indexed = (None, 0)
+    # dictionary - <class name> -> number of new() and delete() calls on it
+    # since the indexes were last rebuilt
+    __generations = {}
+    # (pid, random token, number of index rebuilds) that generation() tokens
+    # start with, so that no two processes or rebuilds give the same token
+    __epoch = (None, None, 0)
+    # EventBus - subscribers to the changes published by save() and reload()
+    __events = EventBus()
+    # ChangeSet - changes since the last save() or reload(), only recorded
+    # while someone subscribes
+    __changes = ChangeSet()
+    # (mtime, size, inode) of the JSON file and journal when last read/written
+    __stamp = None
+    # boolean - append changes to <__file_path>.journal instead of rewriting
+    __journal = getenv("HBNB_FILE_STORAGE_MODE") == "journal"
+    # integer - journal records after which save() rewrites the JSON file
+    __journal_limit = int(getenv("HBNB_FILE_JOURNAL_LIMIT", "10000"))
+    # integer - records currently in the journal
+    __journal_len = 0
+    # dictionary - <class name>.id -> obj (None once deleted) not yet saved
+    __pending = {}
+    # float - seconds save() waits so that a burst of saves is written once
+    __commit_window = float(getenv("HBNB_FILE_COMMIT_WINDOW", "0"))
+    # threading.Timer - the write scheduled by save() during a commit window
+    __timer = None
+    __lock = threading.RLock()
+    # boolean - objects read from the files keep their attributes in slots
+    # rather than a __dict__, and share their repeated values: one string
+    # per referenced id, one datetime if never updated
+    __compact = getenv("HBNB_FILE_COMPACT") == "1"
 
-    def all(self, cls=None):
-        """returns the dictionary __objects"""
+    def all(self, cls=None, eager=()):
+        """returns the dictionary __objects, or only the objects of cls
+
+        eager is accepted for parity with DBStorage: relationships are
+        already index lookups here.
+        """
         if cls is not None:
-            new_dict = {}
-            for key, value in self.__objects.items():
-                if cls == value.__class__ or cls == value.__class__.__name__:
-                    new_dict[key] = value
-            return new_dict
+            return dict(self.__bucket(cls))
         return self.__objects
 
     def new(self, obj):
         """sets in __objects the obj with key <obj class name>.id"""
         if obj is not None:
             key = obj.__class__.__name__ + "." + obj.id
-            self.__objects[key] = obj
+            self.__add(key, obj)
+            self.__changed(obj.__class__.__name__)
+            if self.__journal:
+                self.__pending[key] = obj
 
     def save(self):
-        """serializes __objects to the JSON file (path: __file_path)"""
-        json_objects = {}
-        for key in self.__objects:
-            json_objects[key] = self.__objects[key].to_dict()
-        with open(self.__file_path, 'w') as f:
-            json.dump(json_objects, f)
+        """serializes __objects to the JSON file (path: __file_path)
+
+        In journal mode only the objects given to new() or delete() since
+        the last save are appended to the journal, which is folded back
+        into the JSON file once it holds more than __journal_limit records.
+        With a commit window, the write happens that many seconds later so
+        that a burst of save() calls only writes once. The subscribers get
+        the changes since the previous save() right away.
+        """
+        self.__publish()
+        if self.__commit_window > 0:
+            with self.__lock:
+                if FileStorage.__timer is None:
+                    FileStorage.__timer = threading.Timer(
+                        self.__commit_window, self.flush)
+                    FileStorage.__timer.start()
+            return
+        self.flush()
+
+    def flush(self):
+        """writes what save() has been asked for to the JSON file or journal"""
+        with self.__lock:
+            if FileStorage.__timer is not None:
+                FileStorage.__timer.cancel()
+                FileStorage.__timer = None
+            pending = FileStorage.__pending
+            FileStorage.__pending = {}
+            try:
+                if self.__journal and (self.__journal_len + len(pending) <=
+                                       self.__journal_limit):
+                    self.__append(pending)
+                else:
+                    self.__write()
+            except BaseException:
+                pending.update(FileStorage.__pending)
+                FileStorage.__pending = pending
+                raise
+            FileStorage.__stamp = self.__file_stamp()
 
-    def reload(self):
-        """deserializes the JSON file to __objects"""
+    def reload(self, force=False):
+        """deserializes the JSON file, then its journal, to __objects
+
+        Unless force is True, the files are only read again when they
+        changed since this storage last read or wrote them, and not while
+        a save() waits for its commit window: memory is newer than them.
+        What the files hold then replaces __objects, so that objects
+        another process deleted go too; only the changes save() has yet
+        to journal are kept on top.
+        """
+        if FileStorage.__timer is not None:
+            if not force:
+                return
+            self.flush()
+        stamp = self.__file_stamp()
+        if not force and stamp == FileStorage.__stamp:
+            return
         try:
             with open(self.__file_path, 'r') as f:
+                base = os.fstat(f.fileno()).st_ino
                 jo = json.load(f)
-            for key in jo:
-                self.__objects[key] = classes[jo[key]["__class__"]](**jo[key])
-        except:
-            pass
+        except FileNotFoundError:
+            base = None
+            jo = {}
+        objects = {key: self.__build(attrs) for key, attrs in jo.items()}
+        if self.__replay(objects, base):
+            stamp = self.__file_stamp()
+        for key, obj in self.__pending.items():
+            if obj is None:
+                objects.pop(key, None)
+            else:
+                objects[key] = obj
+        if self.__events:
+            for key in objects:
+                self.__changes.add(*key.split(".", 1), UPDATED
+                                   if key in self.__objects else CREATED)
+            for key in self.__objects:
+                if key not in objects:
+                    self.__changes.add(*key.split(".", 1), DELETED)
+        # the indexes, and so every generation, are rebuilt for the new
+        # dictionary by __sync()
+        FileStorage.__objects = objects
+        self.__sync()
+        FileStorage.__stamp = stamp
+        self.__publish()
 
     def delete(self, obj=None):
         """delete obj from __objects if it’s inside"""
         if obj is not None:
             key = obj.__class__.__name__ + '.' + obj.id
-            if key in self.__objects:
-                del self.__objects[key]
+            if self.__remove(key) is not None:
+                self.__changed(obj.__class__.__name__)
+                if self.__journal:
+                    self.__pending[key] = None
 
     def close(self):
-        """call reload() method for deserializing the JSON file to objects"""
+        """reload the JSON file if another process changed it meanwhile"""
         self.reload()
 
-    def get(self, cls, id):
-        """Retrieve one object."""
+    def get(self, cls, id, eager=()):
+        """Retrieve one object (eager is ignored, see all())."""
         if cls and id:
-            key = "{}.{}".format(cls.__name__, id)
-            return self.__objects.get(key)
+            name = cls if isinstance(cls, str) else cls.__name__
+            return self.__objects.get(name + "." + id)
         return None
 
     def count(self, cls=None):
-        """Return the count of objects in storage or specific class if given."""
+        """Return the count of objects in storage or of class cls if given."""
         if cls:
-            return len([obj for obj in self.__objects.values() if isinstance(obj, cls)])
-        return len(self.__objects)
\ No newline at end of file
+            return len(self.__bucket(cls))
+        return len(self.__objects)
+
+    def generation(self, *clss):
+        """returns a token that changes whenever an object of the classes is
+        added, updated through new() or deleted, and never repeats in
+        another process"""
+        self.__sync()
+        pid, token, rebuilds = FileStorage.__epoch
+        if pid != os.getpid():
+            pid, token = os.getpid(), uuid.uuid4().hex
+            FileStorage.__epoch = (pid, token, rebuilds)
+        names = [cls if isinstance(cls, str) else cls.__name__
+                 for cls in clss]
+        return ".".join([token, str(rebuilds)] + [
+            str(self.__generations.get(name, 0)) for name in names])
+
+    def subscribe(self, callback, asynchronous=False):
+        """calls callback with the ChangeSet of (class name, id, op) of every
+        save() and reload() that changed objects, from a worker thread if
+        asynchronous is True"""
+        self.__events.subscribe(callback, asynchronous)
+
+    def unsubscribe(self, callback):
+        """stops calling callback with the changes"""
+        self.__events.unsubscribe(callback)
+
+    def event_status(self):
+        """returns the change event counters"""
+        return self.__events.status()
+
+    def __publish(self):
+        """hands the changes recorded so far to the subscribers"""
+        with self.__lock:
+            changes = FileStorage.__changes
+            if not changes:
+                return
+            FileStorage.__changes = ChangeSet()
+        self.__events.publish(changes)
+
+    def __changed(self, name):
+        """counts a change to the objects of the class name"""
+        self.__generations[name] = self.__generations.get(name, 0) + 1
+
+    def page(self, cls, limit, after=None, **kwargs):
+        """returns, ordered by id, up to limit objects of cls whose id comes
+        after the id after and whose attributes equal kwargs"""
+        self.__sync()
+        name = cls if isinstance(cls, str) else cls.__name__
+        if kwargs:
+            found = {obj.id: obj for obj in self.filter_by(name, **kwargs)}
+            ids = sorted(found)
+        else:
+            ids = self.__sorted.get(name)
+            if ids is None:
+                ids = sorted(obj.id
+                             for obj in self.__by_class.get(name, {}).values())
+                self.__sorted[name] = ids
+        start = 0 if after is None else bisect_right(ids, after)
+        ids = ids[start:start + limit]
+        if kwargs:
+            return [found[id] for id in ids]
+        return [self.__objects[name + "." + id] for id in ids]
+
+    def stream(self, cls, eager=(), **kwargs):
+        """returns an iterator over the objects of cls whose attributes
+        equal kwargs, unaffected by objects added or deleted meanwhile"""
+        if kwargs:
+            return iter(self.filter_by(cls, **kwargs))
+        return iter(list(self.__bucket(cls).values()))
+
+    def filter_by(self, cls, **kwargs):
+        """returns the list of objects of cls whose attributes equal kwargs
+
+        Attributes declared as IndexedAttribute are looked up in the
+        reverse indexes, other ones are compared object by object. A list
+        attribute matches the values it contains.
+        """
+        self.__sync()
+        name = cls if isinstance(cls, str) else cls.__name__
+        objs = None
+        for attr, value in kwargs.items():
+            refs = self.__refs.get((name, attr))
+            if refs is not None:
+                found = refs.get(value, {})
+                if objs is None or len(found) < len(objs):
+                    objs = found
+        if objs is None:
+            objs = self.__by_class.get(name, {})
+        elif len(kwargs) == 1:
+            return list(objs.values())
+        return [obj for obj in objs.values()
+                if all(self.__matches(getattr(obj, attr), value)
+                       for attr, value in kwargs.items())]
+
+    def where(self, cls, **conditions):
+        """returns the list of objects of cls whose attributes meet the
+        conditions: a (low, high) tuple matches the values of that closed
+        range, either end None for no bound, any other value as filter_by()
+
+        Conditions on NumericAttribute attributes are evaluated over whole
+        columns at once, unless a reverse index already narrows the objects
+        down to a few.
+        """
+        self.__sync()
+        name = cls if isinstance(cls, str) else cls.__name__
+        numeric = self.__attributes_of(classes[name])[1]
+        ranges = {}
+        equal = {}
+        for attr, value in conditions.items():
+            if isinstance(value, tuple):
+                ranges[attr] = value
+            elif attr in numeric:
+                ranges[attr] = (value, value)
+            else:
+                equal[attr] = value
+        columns = self.__columns.get(name)
+        vectorized = {attr: bounds for attr, bounds in ranges.items()
+                      if attr in numeric}
+        narrowest = min((len(self.__refs[(name, attr)].get(value, ()))
+                         for attr, value in equal.items()
+                         if (name, attr) in self.__refs), default=None)
+        if columns is not None and vectorized and \
+                (narrowest is None or narrowest * 16 > len(columns)):
+            bucket = self.__by_class[name]
+            objs = [bucket[key] for key in columns.select(vectorized)]
+            for attr in vectorized:
+                del ranges[attr]
+        else:
+            objs = self.filter_by(name, **equal)
+            equal = {}
+        if not equal and not ranges:
+            return objs
+        return [obj for obj in objs
+                if all(self.__matches(getattr(obj, attr), value)
+                       for attr, value in equal.items()) and
+                all(self.__within(getattr(obj, attr), bounds)
+                    for attr, bounds in ranges.items())]
+
+    def within(self, cls, south, west, north, east):
+        """returns the list of objects of cls located in a bounding box, which
+        crosses the antimeridian if west is greater than east"""
+        self.__sync()
+        name = cls if isinstance(cls, str) else cls.__name__
+        grid = self.__grids.get(name)
+        if grid is None:
+            return []
+        return list(grid.within(south, west, north, east).values())
+
+    def near(self, cls, lat, lng, radius_km):
+        """returns the list of objects of cls within radius_km of a point,
+        nearest first"""
+        self.__sync()
+        name = cls if isinstance(cls, str) else cls.__name__
+        grid = self.__grids.get(name)
+        if grid is None:
+            return []
+        return [obj for d, key, obj in grid.near(lat, lng, radius_km)]
+
+    def search(self, cls, query, limit=None):
+        """returns the list of objects of cls whose TextAttribute attributes
+        hold any word of query, the most relevant first, at most limit"""
+        self.__sync()
+        name = cls if isinstance(cls, str) else cls.__name__
+        texts = self.__texts.get(name)
+        if texts is None:
+            return []
+        return [obj for key, obj in texts.search(query, limit)]
+
+    def index(self, cls, attr, value):
+        """returns a read-only view, keyed like __objects, of the objects of
+        cls indexed under value for the IndexedAttribute attr"""
+        self.__sync()
+        name = cls if isinstance(cls, str) else cls.__name__
+        return MappingProxyType(self.__refs.get((name, attr), {}).get(value,
+                                                                      {}))
+
+    def reindex(self, obj, attr, old):
+        """moves obj in the index of attr after it changed from old"""
+        self.__sync()
+        name = obj.__class__.__name__
+        key = name + "." + str(getattr(obj, "id", None))
+        if self.__objects.get(key) is not obj:
+            return
+        indexed, numeric, text = self.__attributes_of(obj.__class__)
+        if attr in text:
+            self.__texts[name].add(key, obj, self.__text(obj, text))
+            return
+        if attr in numeric:
+            self.__columns[name].set(key, attr, getattr(obj, attr))
+            if attr in ("latitude", "longitude") and name in self.__grids:
+                self.__grids[name].add(key, obj, obj.latitude, obj.longitude)
+            return
+        refs = self.__refs.setdefault((name, attr), {})
+        self.__unref(refs, old, key)
+        for value in self.__values(getattr(obj, attr)):
+            refs.setdefault(value, {})[key] = obj
+
+    def __add(self, key, obj):
+        """puts obj in __objects, its class bucket and the reverse indexes"""
+        self.__sync()
+        replaced = self.__objects.get(key)
+        if self.__events:
+            self.__changes.add(*key.split(".", 1),
+                               CREATED if replaced is None else UPDATED)
+        if replaced is obj:
+            return
+        if replaced is not None:
+            self.__unindex(key, replaced)
+        self.__objects[key] = obj
+        self.__index(key, obj)
+        FileStorage.__indexed = (self.__objects, len(self.__objects))
+
+    def __remove(self, key):
+        """takes the object stored under key out of __objects, if any"""
+        self.__sync()
+        obj = self.__objects.pop(key, None)
+        if obj is not None:
+            if self.__events:
+                self.__changes.add(*key.split(".", 1), DELETED)
+            self.__unindex(key, obj)
+            FileStorage.__indexed = (self.__objects, len(self.__objects))
+        return obj
+
+    def __index(self, key, obj):
+        """adds obj to its class bucket and the reverse indexes"""
+        name = obj.__class__.__name__
+        self.__by_class.setdefault(name, {})[key] = obj
+        if self.__sorted.get(name) is not None:
+            insort(self.__sorted[name], obj.id)
+        indexed, numeric, text = self.__attributes_of(obj.__class__)
+        for attr in indexed:
+            refs = self.__refs.setdefault((name, attr), {})
+            for value in self.__values(getattr(obj, attr)):
+                refs.setdefault(value, {})[key] = obj
+        if numeric:
+            columns = self.__columns.get(name)
+            if columns is None:
+                columns = self.__columns[name] = Columns(numeric)
+            columns.add(key, obj)
+            if "latitude" in numeric and "longitude" in numeric:
+                grid = self.__grids.get(name)
+                if grid is None:
+                    grid = self.__grids[name] = Grid()
+                grid.add(key, obj, obj.latitude, obj.longitude)
+        if text:
+            texts = self.__texts.get(name)
+            if texts is None:
+                texts = self.__texts[name] = TextIndex()
+            texts.add(key, obj, self.__text(obj, text))
+
+    def __unindex(self, key, obj):
+        """removes obj from its class bucket and the reverse indexes"""
+        name = obj.__class__.__name__
+        self.__by_class[name].pop(key, None)
+        ids = self.__sorted.get(name)
+        if ids is not None:
+            i = bisect_left(ids, obj.id)
+            if i < len(ids) and ids[i] == obj.id:
+                del ids[i]
+        indexed, numeric, text = self.__attributes_of(obj.__class__)
+        for attr in indexed:
+            self.__unref(self.__refs[(name, attr)], getattr(obj, attr), key)
+        if numeric:
+            self.__columns[name].remove(key)
+            if name in self.__grids:
+                self.__grids[name].remove(key)
+        if text:
+            self.__texts[name].remove(key)
+
+    def __unref(self, refs, value, key):
+        """removes key from the objects indexed under value in refs"""
+        for item in self.__values(value):
+            found = refs.get(item)
+            if found is not None:
+                found.pop(key, None)
+                if not found:
+                    del refs[item]
+
+    def __values(self, value):
+        """returns the index entries of a value: the items of a list"""
+        return value if isinstance(value, list) else (value,)
+
+    def __matches(self, attr_value, value):
+        """tells if an attribute value is or, for a list, contains value"""
+        if isinstance(attr_value, list):
+            return value in attr_value
+        return attr_value == value
+
+    def __attributes_of(self, cls):
+        """returns the names of the IndexedAttribute attributes of cls kept
+        in reverse indexes, of those kept in columns, then of those kept in
+        the full-text index"""
+        attrs = self.__attributes.get(cls)
+        if attrs is None:
+            found = {attr: value for klass in reversed(cls.__mro__)
+                     for attr, value in vars(klass).items()
+                     if isinstance(value, IndexedAttribute)}
+            kinds = (NumericAttribute, TextAttribute)
+            attrs = (tuple(attr for attr, value in found.items()
+                           if not isinstance(value, kinds)),) + \
+                tuple(tuple(attr for attr, value in found.items()
+                            if isinstance(value, kind)) for kind in kinds)
+            self.__attributes[cls] = attrs
+        return attrs
+
+    def __text(self, obj, attrs):
+        """returns the text of the attributes attrs of obj, as one document"""
+        return document(getattr(obj, attr) for attr in attrs)
+
+    def __within(self, value, bounds):
+        """tells if value is in the closed range of the pair bounds"""
+        low, high = bounds
+        try:
+            return (low is None or low <= value) and \
+                (high is None or value <= high)
+        except TypeError:
+            return False
+
+    def __write(self):
+        """atomically replaces the JSON file with all of __objects"""
+        json_objects = {}
+        for key, obj in list(self.__objects.items()):
+            json_objects[key] = obj.to_dict(saving=True)
+        tmp_path = "{}.{}.tmp".format(self.__file_path, os.getpid())
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(json_objects, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.__file_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        self.__fsync_dir()
+        # the journal records name the file they applied to, so that replay
+        # skips them if this process stops before removing them
+        if self.__journal_len or self.__journal:
+            try:
+                os.remove(self.__file_path + ".journal")
+            except FileNotFoundError:
+                pass
+            FileStorage.__journal_len = 0
+
+    def __fsync_dir(self):
+        """makes the last rename in the JSON file's directory durable"""
+        try:
+            fd = os.open(os.path.dirname(os.path.abspath(self.__file_path)),
+                         os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+    def __append(self, pending):
+        """appends one journal record per pending object"""
+        if not pending:
+            return
+        try:
+            base = os.stat(self.__file_path).st_ino
+        except FileNotFoundError:
+            base = None
+        lines = []
+        for key, obj in pending.items():
+            record = {"key": key, "base": base,
+                      "obj": None if obj is None else obj.to_dict(True)}
+            lines.append(json.dumps(record) + "\n")
+        with open(self.__file_path + ".journal", 'a') as f:
+            f.writelines(lines)
+            f.flush()
+            os.fsync(f.fileno())
+        FileStorage.__journal_len += len(lines)
+
+    def __replay(self, objects, base):
+        """applies the journal records on top of objects, a dictionary
+        like __objects read from the JSON file of inode base
+
+        A torn record left by an interrupted append is cut off the journal
+        with whatever follows it, so that the next records are appended
+        where replay can read them. Records appended to an older JSON file
+        are already in this one, which a compaction wrote before it could
+        remove them: they are skipped, and dropped from the journal.
+        Returns True if the journal was changed.
+        """
+        count = 0
+        torn = stale = False
+        kept = []
+        try:
+            with open(self.__file_path + ".journal", 'rb+') as f:
+                offset = 0
+                for line in f:
+                    try:
+                        if not line.endswith(b"\n"):
+                            raise ValueError("unterminated record")
+                        record = json.loads(line)
+                    except ValueError:
+                        torn = True
+                        break
+                    offset += len(line)
+                    if record.get("base", base) != base:
+                        stale = True
+                        continue
+                    kept.append(line)
+                    obj = record["obj"]
+                    if obj is None:
+                        objects.pop(record["key"], None)
+                    else:
+                        objects[record["key"]] = self.__build(obj)
+                    count += 1
+                if torn and not stale:
+                    f.truncate(offset)
+                    f.flush()
+                    os.fsync(f.fileno())
+        except FileNotFoundError:
+            pass
+        if stale:
+            path = self.__file_path + ".journal"
+            tmp_path = "{}.{}.tmp".format(path, os.getpid())
+            with open(tmp_path, 'wb') as f:
+                f.writelines(kept)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        FileStorage.__journal_len = count
+        return torn or stale
+
+    def __build(self, attrs):
+        """returns the object of a to_dict(saving=True) dictionary"""
+        if self.__compact:
+            for attr, value in attrs.items():
+                if attr.endswith("_id") and type(value) is str:
+                    attrs[attr] = sys.intern(value)
+                elif attr.endswith("_ids") and type(value) is list:
+                    attrs[attr] = [sys.intern(item) for item in value]
+        cls = classes[attrs["__class__"]]
+        if self.__compact:
+            cls = compact_class(cls, tuple(attr for attr in attrs
+                                           if attr != "__class__"))
+        obj = cls(**attrs)
+        if "password" in attrs:
+            # stored passwords are hashed, User.__setattr__ would hash again
+            object.__setattr__(obj, "password", attrs["password"])
+        if self.__compact and obj.updated_at == obj.created_at:
+            obj.updated_at = obj.created_at
+        return obj
+
+    def __file_stamp(self):
+        """returns what identifies the current JSON file and journal"""
+        stamp = ()
+        for path in (self.__file_path, self.__file_path + ".journal"):
+            try:
+                st = os.stat(path)
+                stamp += ((st.st_mtime_ns, st.st_size, st.st_ino),)
+            except OSError:
+                stamp += (None,)
+        return stamp
+
+    def __bucket(self, cls):
+        """returns the objects of cls (class or class name) keyed by key"""
+        self.__sync()
+        name = cls if isinstance(cls, str) else cls.__name__
+        return self.__by_class.get(name, {})
+
+    def __sync(self):
+        """rebuilds the indexes if __objects was swapped or edited directly"""
+        objects = FileStorage.__objects
+        indexed, size = FileStorage.__indexed
+        if indexed is objects and size == len(objects):
+            return
+        self.__by_class.clear()
+        self.__refs.clear()
+        self.__sorted.clear()
+        self.__columns.clear()
+        self.__grids.clear()
+        self.__texts.clear()
+        self.__generations.clear()
+        pid, token, rebuilds = FileStorage.__epoch
+        FileStorage.__epoch = (pid, token, rebuilds + 1)
+        for key, obj in objects.items():
+            self.__index(key, obj)
+        FileStorage.__indexed = (objects, len(objects))
@@ -0,0 +1,147 @@
+#!/usr/bin/python3
+"""
+Contains the class Grid and the geometry helpers of spatial queries
+"""
+
+import math
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = EARTH_RADIUS_KM * math.pi / 180
+
+
+def distance(lat1, lng1, lat2, lng2):
+    """returns the great-circle distance in km between two points"""
+    lat1, lng1, lat2, lng2 = map(math.radians, (lat1, lng1, lat2, lng2))
+    h = math.sin((lat2 - lat1) / 2) ** 2 + \
+        math.cos(lat1) * math.cos(lat2) * math.sin((lng2 - lng1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(h)))
+
+
+def split(south, west, north, east):
+    """returns the boxes of a bounding box, two if it crosses the
+    antimeridian, that is if west is greater than east"""
+    if west <= east:
+        return [(south, west, north, east)]
+    return [(south, west, north, 180.0), (south, -180.0, north, east)]
+
+
+def around(lat, lng, radius_km):
+    """returns the boxes, as split() does, holding the circle of radius_km
+    around a point"""
+    dlat = radius_km / KM_PER_DEGREE
+    south = max(-90.0, lat - dlat)
+    north = min(90.0, lat + dlat)
+    if south == -90.0 or north == 90.0:
+        return [(south, -180.0, north, 180.0)]
+    # the circle is widest at the latitude of the tangent meridians
+    dlng = math.degrees(math.asin(min(1.0, math.sin(math.radians(dlat)) /
+                                      math.cos(math.radians(lat)))))
+    if dlng >= 180.0 or math.isnan(dlng):
+        return [(south, -180.0, north, 180.0)]
+    west = (lng - dlng + 180.0) % 360.0 - 180.0
+    east = (lng + dlng + 180.0) % 360.0 - 180.0
+    return split(south, west, north, east)
+
+
+def centre(south, west, north, east):
+    """returns the centre (lat, lng) of a bounding box"""
+    if west > east:
+        east += 360.0
+    return (south + north) / 2, ((west + east) / 2 + 180.0) % 360.0 - 180.0
+
+
+def coordinates(lat, lng):
+    """returns (lat, lng) as floats, None if either is not a valid
+    coordinate"""
+    for value in (lat, lng):
+        if not isinstance(value, (int, float)) or isinstance(value, bool):
+            return None
+    if not (-90 <= lat <= 90 and -180 <= lng <= 180):
+        return None
+    return float(lat), float(lng)
+
+
+class Grid:
+    """spatial index of objects in square cells of size degrees
+
+    A box query visits the cells it overlaps, or the occupied cells when
+    there are fewer of them, so that its cost follows the size of the area
+    and of the result rather than the number of objects.
+    """
+
+    def __init__(self, size=0.25):
+        """Instantiate an empty grid"""
+        self.size = size
+        self.__cells = {}
+        self.__points = {}
+
+    def __len__(self):
+        """returns the number of objects in the grid"""
+        return len(self.__points)
+
+    def cell(self, lat, lng):
+        """returns the cell of a point"""
+        return int(math.floor(lat / self.size)), \
+            int(math.floor(lng / self.size))
+
+    def add(self, key, obj, lat, lng):
+        """puts obj at (lat, lng) under key, moving it if already in, or
+        takes it out if the coordinates are not valid"""
+        self.remove(key)
+        point = coordinates(lat, lng)
+        if point is None:
+            return
+        cell = self.cell(*point)
+        self.__cells.setdefault(cell, {})[key] = obj
+        self.__points[key] = point + (cell,)
+
+    def remove(self, key):
+        """takes the object stored under key out of the grid, if any"""
+        point = self.__points.pop(key, None)
+        if point is not None:
+            objs = self.__cells[point[2]]
+            del objs[key]
+            if not objs:
+                del self.__cells[point[2]]
+
+    def point(self, key):
+        """returns the (lat, lng) of the object stored under key"""
+        return self.__points[key][:2]
+
+    def within(self, south, west, north, east):
+        """returns the {key: object} in a bounding box crossing the
+        antimeridian if west is greater than east"""
+        found = {}
+        for box in split(south, west, north, east):
+            low = self.cell(box[0], box[1])
+            high = self.cell(box[2], box[3])
+            area = (high[0] - low[0] + 1) * (high[1] - low[1] + 1)
+            if area > len(self.__cells):
+                cells = [cell for cell in self.__cells
+                         if low[0] <= cell[0] <= high[0] and
+                         low[1] <= cell[1] <= high[1]]
+            else:
+                cells = [(i, j) for i in range(low[0], high[0] + 1)
+                         for j in range(low[1], high[1] + 1)
+                         if (i, j) in self.__cells]
+            for cell in cells:
+                inner = low[0] < cell[0] < high[0] and \
+                    low[1] < cell[1] < high[1]
+                for key, obj in self.__cells[cell].items():
+                    lat, lng = self.__points[key][:2]
+                    if inner or (box[0] <= lat <= box[2] and
+                                 box[1] <= lng <= box[3]):
+                        found[key] = obj
+        return found
+
+    def near(self, lat, lng, radius_km):
+        """returns the (distance, key, object) within radius_km of a point,
+        nearest first"""
+        found = []
+        for south, west, north, east in around(lat, lng, radius_km):
+            for key, obj in self.within(south, west, north, east).items():
+                d = distance(lat, lng, *self.__points[key][:2])
+                if d <= radius_km:
+                    found.append((d, key, obj))
+        found.sort(key=lambda item: item[0])
+        return found
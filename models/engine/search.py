@@ -0,0 +1,131 @@
+#!/usr/bin/python3
+"""
+Contains the place search engine behind /places_search
+"""
+
+import math
+import models
+from models.amenity import Amenity
+from models.city import City
+from models.engine import geo
+from models.engine.columns import Columns
+from models.place import Place
+from models.state import State
+
+
+def search_places(states=(), cities=(), amenities=(), ranges=None,
+                  near=None, bbox=None, q=None):
+    """returns the places located in any of the states or cities,
+    offering all of the amenities (lists of ids, each one optional) and
+    whose numeric attributes are within ranges, a dictionary of attribute
+    -> (low, high) with None for no bound
+
+    near (lat, lng, radius_km) and bbox (south, west, north, east) keep
+    the places of an area, then sort them by distance from the point, or
+    from the centre of the box. q keeps the places whose name or
+    description holds any of its words, then sorts them by relevance
+    instead.
+
+    Every criterion is a posting list of places read from the storage
+    indexes (state -> cities -> places, amenity -> places, spatial grid).
+    Starting from the smallest list, places missing from the next lists
+    are dropped. Unknown state or city ids are ignored, an unknown amenity
+    id matches no place. Ranges are a storage where() query, unless the
+    other lists leave few enough places to check one by one.
+    """
+    postings = []
+    located = _located_in(states, cities)
+    if located is not None:
+        postings.append(located)
+    for amenity_id in dict.fromkeys(amenities):
+        amenity = models.storage.get(Amenity, amenity_id,
+                                     eager=("place_amenities",))
+        if amenity is None:
+            return []
+        postings.append(_offering(amenity))
+    if near is not None:
+        postings.append({_key(place): place for place in
+                         models.storage.near(Place, *near)})
+    if bbox is not None:
+        postings.append({_key(place): place for place in
+                         models.storage.within(Place, *bbox)})
+    relevance = None
+    if q is not None:
+        matches = models.storage.search(Place, q)
+        relevance = {place.id: i for i, place in enumerate(matches)}
+        postings.append({_key(place): place for place in matches})
+    if not postings:
+        if ranges:
+            return models.storage.where(Place, **ranges)
+        return list(models.storage.all(Place).values())
+    if len(postings) == 1 and relevance is not None and not ranges:
+        return matches
+    postings.sort(key=len)
+    found = postings[0]
+    if ranges and len(found) * 16 > models.storage.count(Place):
+        postings.append({_key(place): place for place in
+                         models.storage.where(Place, **ranges)})
+        ranges = None
+    for posting in postings[1:]:
+        found = {key: place for key, place in found.items()
+                 if key in posting}
+    places = [place for place in found.values()
+              if not ranges or _within(place, ranges)]
+    origin = near[:2] if near is not None else \
+        geo.centre(*bbox) if bbox is not None else None
+    if relevance is not None:
+        places.sort(key=lambda place: relevance[place.id])
+    elif origin is not None:
+        places.sort(key=lambda place: geo.distance(
+            origin[0], origin[1], place.latitude, place.longitude))
+    return places
+
+
+def _key(place):
+    """returns the key of place in the posting lists"""
+    if models.storage_t == "db":
+        return place.id
+    return "Place." + place.id
+
+
+def _within(place, ranges):
+    """tells if the attributes of place are within ranges, which no value
+    that is not a number is, as in the columns of where()"""
+    for attr, (low, high) in ranges.items():
+        value = Columns.number(getattr(place, attr))
+        if math.isnan(value) or (low is not None and value < low) or \
+                (high is not None and value > high):
+            return False
+    return True
+
+
+def _located_in(states, cities):
+    """returns the places of the states and cities, None if none exists"""
+    found = {}
+    for state_id in states:
+        state = models.storage.get(State, state_id, eager=("cities.places",))
+        if state is not None:
+            for city in state.cities:
+                found[city.id] = city
+    for city_id in cities:
+        city = models.storage.get(City, city_id, eager=("places",))
+        if city is not None:
+            found[city.id] = city
+    if not found:
+        return None
+    if models.storage_t == "db":
+        return {place.id: place
+                for city in found.values() for place in city.places}
+    if len(found) == 1:
+        return models.storage.index(Place, "city_id", next(iter(found)))
+    places = {}
+    for city_id in found:
+        places.update(models.storage.index(Place, "city_id", city_id).copy())
+    return places
+
+
+def _offering(amenity):
+    """returns the places offering amenity"""
+    if models.storage_t == "db":
+        return {place.id: place for place in amenity.place_amenities}
+    return models.storage.index(Place, "amenity_ids", amenity.id)
@@ -0,0 +1,103 @@
+#!/usr/bin/python3
+"""
+Contains the class TextIndex and the tokenizer and ranking it shares with
+the database side tables
+"""
+
+from collections import Counter
+import heapq
+import math
+import re
+
+word = re.compile(r"\w+")
+
+# BM25 term frequency saturation and document length normalization
+K1 = 1.2
+B = 0.75
+
+
+def tokenize(text):
+    """returns the terms of a text: its words, case-folded"""
+    if not isinstance(text, str):
+        return []
+    return word.findall(text.casefold())
+
+
+def document(values):
+    """returns the text of a document made of several attribute values"""
+    return "\n".join(str(value or "") for value in values)
+
+
+def bm25(tf, df, count, length, average):
+    """returns the BM25 score of a term appearing tf times in a document of
+    length terms, and in df of the count documents averaging average terms
+    """
+    idf = math.log(1 + (count - df + 0.5) / (df + 0.5))
+    norm = 1 - B + B * length / average if average else 1
+    return idf * tf * (K1 + 1) / (tf + K1 * norm)
+
+
+def rank(scores, limit=None):
+    """returns the keys of a dictionary key -> score, best first, at most
+    limit of them"""
+    if limit is not None:
+        return heapq.nlargest(limit, scores, key=scores.get)
+    return sorted(scores, key=scores.get, reverse=True)
+
+
+class TextIndex:
+    """inverted index of the words of documents, ranked with BM25
+
+    Every document is the text of one object, stored under its key. The
+    postings of a term map the keys of the documents holding it to the
+    number of times it appears there.
+    """
+
+    def __init__(self):
+        """Instantiate an empty index"""
+        self.__postings = {}
+        self.__terms = {}
+        self.__objs = {}
+        self.__total = 0
+
+    def __len__(self):
+        """returns the number of documents"""
+        return len(self.__objs)
+
+    def add(self, key, obj, text):
+        """indexes the text of obj under key, replacing any previous one"""
+        self.remove(key)
+        terms = Counter(tokenize(text))
+        for term, tf in terms.items():
+            self.__postings.setdefault(term, {})[key] = tf
+        self.__terms[key] = (tuple(terms), sum(terms.values()))
+        self.__objs[key] = obj
+        self.__total += self.__terms[key][1]
+
+    def remove(self, key):
+        """takes the document stored under key out of the index, if any"""
+        if key not in self.__objs:
+            return
+        terms, length = self.__terms.pop(key)
+        del self.__objs[key]
+        self.__total -= length
+        for term in terms:
+            postings = self.__postings[term]
+            del postings[key]
+            if not postings:
+                del self.__postings[term]
+
+    def search(self, query, limit=None):
+        """returns the (key, object) of the documents holding any word of
+        query, the most relevant first, at most limit of them"""
+        count = len(self.__objs)
+        if not count:
+            return []
+        average = self.__total / count
+        scores = {}
+        for term in set(tokenize(query)):
+            postings = self.__postings.get(term, {})
+            for key, tf in postings.items():
+                scores[key] = scores.get(key, 0) + bm25(
+                    tf, len(postings), count, self.__terms[key][1], average)
+        return [(key, self.__objs[key]) for key in rank(scores, limit)]
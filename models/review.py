@@ -1,7 +1,8 @@
 #!/usr/bin/python
 """ holds class Review"""
 import models
-from models.base_model import BaseModel, Base
+from models.base_model import BaseModel, Base, IndexedAttribute
+from models.base_model import TextAttribute
 from os import getenv
 import sqlalchemy
 from sqlalchemy import Column, String, ForeignKey
@@ -11,13 +12,15 @@ class Review(BaseModel, Base):
     """Representation of Review """
     if models.storage_t == 'db':
         __tablename__ = 'reviews'
-        place_id = Column(String(60), ForeignKey('places.id'), nullable=False)
-        user_id = Column(String(60), ForeignKey('users.id'), nullable=False)
+        place_id = Column(String(60), ForeignKey('places.id'),
+                          index=True, nullable=False)
+        user_id = Column(String(60), ForeignKey('users.id'),
+                         index=True, nullable=False)
         text = Column(String(1024), nullable=False)
     else:
-        place_id = ""
-        user_id = ""
-        text = ""
+        place_id = IndexedAttribute("")
+        user_id = IndexedAttribute("")
+        text = TextAttribute("")
 
     def __init__(self, *args, **kwargs):
         """initializes Review"""
@@ -35,3 +35,16 @@ class User(BaseModel, Base):
             # Encode and hash, then store the hex digest
             value = hashlib.md5(value.encode()).hexdigest()
         super().__setattr__(name, value)
+
+    if models.storage_t != 'db':
+        @property
+        def places(self):
+            """getter attribute returns the list of Place instances"""
+            from models.place import Place
+            return models.storage.filter_by(Place, user_id=self.id)
+
+        @property
+        def reviews(self):
+            """getter attribute returns the list of Review instances"""
+            from models.review import Review
+            return models.storage.filter_by(Review, user_id=self.id)
@@ -0,0 +1,117 @@
+#!/usr/bin/python3
+"""
+Contains the TestAsgiDocs and TestAsgi classes
+"""
+
+from api.v1 import asgi
+import asyncio
+import inspect
+import json
+import pycodestyle
+import unittest
+from unittest import mock
+
+
+class TestAsgiDocs(unittest.TestCase):
+    """Tests to check the documentation and style of the ASGI entry point"""
+    def test_pep8_conformance_asgi(self):
+        """Test that api/v1/asgi.py conforms to PEP8."""
+        pep8s = pycodestyle.StyleGuide(quiet=True)
+        result = pep8s.check_files(['api/v1/asgi.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_asgi_docstrings(self):
+        """Test for the presence of docstrings in the ASGI entry point"""
+        self.assertTrue(len(asgi.__doc__) >= 1)
+        for name, func in inspect.getmembers(asgi, inspect.isfunction):
+            if func.__module__ == asgi.__name__:
+                self.assertTrue(func.__doc__,
+                                "{:s} needs a docstring".format(name))
+
+
+class TestAsgi(unittest.TestCase):
+    """Test requests through the ASGI application"""
+    def request(self, method, path, chunks=(), headers=()):
+        """Return the status, headers and body the application sends for
+        a request whose body arrives in chunks"""
+        scope = {"type": "http", "method": method, "path": path,
+                 "query_string": b"", "headers": list(headers),
+                 "http_version": "1.1", "scheme": "http",
+                 "server": ("testserver", 80)}
+        messages = [{"type": "http.request", "body": chunk,
+                     "more_body": True} for chunk in chunks]
+        messages.append({"type": "http.request", "body": b"",
+                         "more_body": False})
+        sent = []
+
+        async def receive():
+            """Hand out the next message of the request"""
+            return messages.pop(0)
+
+        async def send(message):
+            """Record a message of the response"""
+            sent.append(message)
+        asyncio.run(asgi.application(scope, receive, send))
+        start = sent[0]
+        self.assertEqual(start["type"], "http.response.start")
+        body = b"".join(message.get("body", b"") for message in sent[1:])
+        return start["status"], dict(start["headers"]), body
+
+    def test_get(self):
+        """Test that a GET goes through the Flask views"""
+        status, headers, body = self.request("GET", "/api/v1/status")
+        self.assertEqual(status, 200)
+        self.assertEqual(json.loads(body), {"status": "OK"})
+        self.assertEqual(int(headers[b"content-length"]), len(body))
+
+    def test_body(self):
+        """Test that a body sent in several chunks, without a length,
+        reaches the view"""
+        body = json.dumps({"q": "nothing matches zqxwv"}).encode()
+        status, headers, found = self.request(
+            "POST", "/api/v1/places_search", [body[:5], body[5:]],
+            [(b"content-type", b"application/json"),
+             (b"transfer-encoding", b"chunked")])
+        self.assertEqual(status, 200)
+        self.assertEqual(json.loads(found), [])
+
+    def test_too_large(self):
+        """Test that bodies over MAX_BODY get 413, whether their length is
+        announced or not"""
+        with mock.patch.object(asgi, "MAX_BODY", 8):
+            status, headers, body = self.request(
+                "POST", "/api/v1/places_search", [b"{}"],
+                [(b"content-length", b"9")])
+            self.assertEqual(status, 413)
+            status, headers, body = self.request(
+                "POST", "/api/v1/places_search", [b"{}", b" " * 7])
+            self.assertEqual(status, 413)
+            status, headers, body = self.request(
+                "POST", "/api/v1/places_search", [b"{}", b" " * 6])
+            self.assertEqual(status, 200)
+
+    def test_lifespan(self):
+        """Test that the application completes startup"""
+        messages = [{"type": "lifespan.startup"}]
+        sent = []
+
+        async def receive():
+            """Ask for startup, then wait for ever"""
+            if messages:
+                return messages.pop(0)
+            await asyncio.sleep(3600)
+
+        async def send(message):
+            """Record a message"""
+            sent.append(message)
+
+        async def scenario():
+            """Run the lifespan until startup completes"""
+            task = asyncio.ensure_future(asgi.application(
+                {"type": "lifespan"}, receive, send))
+            while not sent:
+                await asyncio.sleep(0.01)
+            task.cancel()
+        asyncio.run(scenario())
+        self.assertEqual(sent, [{"type": "lifespan.startup.complete"}])
@@ -0,0 +1,149 @@
+#!/usr/bin/python3
+"""
+Contains the TestPreforkDocs and TestPrefork classes
+"""
+
+from api.v1 import prefork
+import inspect
+import json
+import os
+import pycodestyle
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+import urllib.request
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__)))))
+
+
+class TestPreforkDocs(unittest.TestCase):
+    """Tests to check the documentation and style of the prefork server"""
+    def test_pep8_conformance_prefork(self):
+        """Test that api/v1/prefork.py conforms to PEP8."""
+        pep8s = pycodestyle.StyleGuide(quiet=True)
+        result = pep8s.check_files(['api/v1/prefork.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_prefork_docstrings(self):
+        """Test for the presence of docstrings in the prefork server"""
+        self.assertTrue(len(prefork.__doc__) >= 1)
+        for name, func in inspect.getmembers(prefork, inspect.isfunction):
+            if func.__module__ == prefork.__name__:
+                self.assertTrue(func.__doc__,
+                                "{:s} needs a docstring".format(name))
+        for name, func in inspect.getmembers(prefork.Master,
+                                             inspect.isfunction):
+            self.assertTrue(func.__doc__,
+                            "{:s} needs a docstring".format(name))
+
+
+@unittest.skipUnless(sys.platform.startswith("linux"), "needs /proc")
+class TestPrefork(unittest.TestCase):
+    """Test that the master spawns, replaces and reaps its workers"""
+    def setUp(self):
+        """Start a master of two workers on a free port, over a scratch
+        file storage whose saves wait for a long commit window"""
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            self.port = sock.getsockname()[1]
+        self.tmp = tempfile.TemporaryDirectory()
+        env = dict(os.environ, PYTHONPATH=root, HBNB_TYPE_STORAGE="",
+                   HBNB_FILE_COMMIT_WINDOW="60")
+        self.master = subprocess.Popen(
+            [sys.executable, "-m", "api.v1.prefork", "--host", "127.0.0.1",
+             "--port", str(self.port), "--workers", "2"],
+            cwd=self.tmp.name, env=env, stderr=subprocess.DEVNULL)
+        self.wait(lambda: self.status() == 200)
+
+    def tearDown(self):
+        """Stop the master if still running"""
+        if self.master.poll() is None:
+            self.master.kill()
+            self.master.wait()
+        self.tmp.cleanup()
+
+    def wait(self, condition, timeout=10):
+        """Wait until condition() holds"""
+        end = time.monotonic() + timeout
+        while not condition():
+            if time.monotonic() > end:
+                self.fail("timed out")
+            time.sleep(0.05)
+
+    def status(self):
+        """Return the status code of GET /api/v1/status, None if the
+        server does not answer"""
+        try:
+            with urllib.request.urlopen("http://127.0.0.1:{}/api/v1/status"
+                                        .format(self.port), timeout=5) as r:
+                return r.status
+        except OSError:
+            return None
+
+    def children(self):
+        """Return {pid: state} of the processes the master forked"""
+        found = {}
+        for name in os.listdir("/proc"):
+            if not name.isdigit():
+                continue
+            try:
+                with open("/proc/{}/stat".format(name)) as f:
+                    fields = f.read().rsplit(")", 1)[1].split()
+            except OSError:
+                continue
+            if int(fields[1]) == self.master.pid:
+                found[int(name)] = fields[0]
+        return found
+
+    def workers(self):
+        """Return the pids of the live workers"""
+        return {pid for pid, state in self.children().items()
+                if state != "Z"}
+
+    def test_spawn_and_reap(self):
+        """Test that a dead worker is reaped and replaced"""
+        self.wait(lambda: len(self.workers()) == 2)
+        first = self.workers()
+        dead = min(first)
+        os.kill(dead, signal.SIGKILL)
+        self.wait(lambda: dead not in self.children() and
+                  len(self.workers()) == 2)
+        self.assertEqual(len(self.workers() & first), 1)
+        self.assertEqual(self.status(), 200)
+
+    def test_reload_and_stop(self):
+        """Test that SIGHUP replaces every worker, and that SIGTERM stops
+        them, then the master"""
+        self.wait(lambda: len(self.workers()) == 2)
+        first = self.workers()
+        self.master.send_signal(signal.SIGHUP)
+        self.wait(lambda: not self.children().keys() & first and
+                  len(self.workers()) == 2)
+        self.assertEqual(self.status(), 200)
+        last = self.workers()
+        self.master.send_signal(signal.SIGTERM)
+        self.assertEqual(self.master.wait(10), 0)
+        for pid in last:
+            self.assertFalse(os.path.exists("/proc/{}".format(pid)))
+
+    def test_stop_writes_pending_saves(self):
+        """Test that stopping the workers writes the saves waiting for
+        their commit window"""
+        request = urllib.request.Request(
+            "http://127.0.0.1:{}/api/v1/states".format(self.port),
+            data=json.dumps({"name": "Pending"}).encode(),
+            headers={"Content-Type": "application/json"}, method="POST")
+        with urllib.request.urlopen(request, timeout=5) as response:
+            state_id = json.load(response)["id"]
+        path = os.path.join(self.tmp.name, "file.json")
+        self.assertFalse(os.path.exists(path))
+        self.master.send_signal(signal.SIGTERM)
+        self.assertEqual(self.master.wait(10), 0)
+        with open(path) as f:
+            self.assertIn("State." + state_id, json.load(f))
@@ -0,0 +1,174 @@
+#!/usr/bin/python3
+"""
+Contains the TestBatchDocs and TestBatch classes
+"""
+
+from api.v1.app import app
+from api.v1.views import batch
+import inspect
+import models
+from models.city import City
+from models.state import State
+from models.user import User
+import pycodestyle
+import unittest
+import uuid
+
+
+class TestBatchDocs(unittest.TestCase):
+    """Tests to check the documentation and style of the batch view"""
+    def test_pep8_conformance_batch(self):
+        """Test that api/v1/views/batch.py conforms to PEP8."""
+        pep8s = pycodestyle.StyleGuide(quiet=True)
+        result = pep8s.check_files(['api/v1/views/batch.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_batch_docstrings(self):
+        """Test for the presence of docstrings in the batch view"""
+        self.assertTrue(len(batch.__doc__) >= 1)
+        for name, func in inspect.getmembers(batch, inspect.isfunction):
+            if func.__module__ == batch.__name__:
+                self.assertTrue(func.__doc__,
+                                "{:s} needs a docstring".format(name))
+
+
+class TestBatch(unittest.TestCase):
+    """Test that POST /api/v1/batch applies all of its items or none"""
+    def setUp(self):
+        """Store a state and a user to refer to"""
+        self.client = app.test_client()
+        self.state = State(name="Batched")
+        self.user = User(email="batch@hbnb.io", password="pwd")
+        self.ids = [(State, self.state.id), (User, self.user.id)]
+        for obj in (self.state, self.user):
+            models.storage.new(obj)
+        models.storage.save()
+        models.storage.close()
+
+    def tearDown(self):
+        """Remove the objects of the test from storage"""
+        for cls, id in self.ids:
+            obj = models.storage.get(cls, id)
+            if obj is not None:
+                models.storage.delete(obj)
+        models.storage.save()
+        models.storage.close()
+
+    def post(self, items):
+        """Return the status and JSON body of a batch of items"""
+        response = self.client.post("/api/v1/batch", json=items)
+        return response.status_code, response.get_json()
+
+    def new_id(self, cls):
+        """Return a fresh id of cls, removed by tearDown"""
+        id = str(uuid.uuid4())
+        self.ids.append((cls, id))
+        return id
+
+    def test_invalid_items(self):
+        """Test that each invalid item gets its own 400, and that nothing
+        is applied"""
+        valid = {"op": "update", "class": "State", "id": self.state.id,
+                 "data": {"name": "Renamed"}}
+        invalid = [
+            {"op": "update", "class": "State", "id": 42},
+            {"op": "create", "class": "State", "data": {"name": "A",
+                                                        "id": 42}},
+            {"op": "create", "class": "City", "data": {
+                "name": "A", "state_id": [self.state.id]}},
+            {"op": "update", "class": "State", "id": self.state.id,
+             "data": {"__dict__": {}}},
+            {"op": "update", "class": "State", "id": self.state.id,
+             "data": {"_sa_instance_state": None}},
+            {"op": "update", "class": "State", "id": self.state.id,
+             "data": {"cities": []}},
+            {"op": "update", "class": "State", "id": self.state.id,
+             "data": {"to_dict": "nope"}},
+            {"op": "update", "class": "User", "id": self.user.id,
+             "data": {"password": 1234}},
+            {"op": "create", "class": "User", "data": {"email": "a@b.c",
+                                                       "password": None}},
+        ]
+        status, results = self.post([valid] + invalid)
+        self.assertEqual(status, 400)
+        self.assertEqual(results[0], {"status": 200})
+        for i, result in enumerate(results[1:]):
+            with self.subTest(item=invalid[i]):
+                self.assertEqual(result["status"], 400)
+                self.assertIn("error", result)
+        self.assertEqual(models.storage.get(State, self.state.id).name,
+                         "Batched")
+
+    def test_create_then_reference(self):
+        """Test that items may refer to an object created before them"""
+        state_id = self.new_id(State)
+        city_id = self.new_id(City)
+        status, results = self.post([
+            {"op": "create", "class": "State",
+             "data": {"id": state_id, "name": "New"}},
+            {"op": "create", "class": "City",
+             "data": {"id": city_id, "name": "Town", "state_id": state_id}},
+            {"op": "update", "class": "City", "id": city_id,
+             "data": {"name": "City"}}])
+        self.assertEqual(status, 200)
+        self.assertEqual([result["status"] for result in results],
+                         [201, 201, 200])
+        models.storage.close()
+        city = models.storage.get(City, city_id)
+        self.assertEqual(city.name, "City")
+        self.assertEqual(city.state_id, state_id)
+
+    def test_create_then_delete(self):
+        """Test that an object created then deleted never reaches
+        storage, and that later items cannot refer to it"""
+        state_id = self.new_id(State)
+        created = {"op": "create", "class": "State",
+                   "data": {"id": state_id, "name": "Gone"}}
+        deleted = {"op": "delete", "class": "State", "id": state_id}
+        count = models.storage.count(State)
+        status, results = self.post([created, deleted])
+        self.assertEqual(status, 200)
+        self.assertEqual([result["status"] for result in results],
+                         [201, 200])
+        models.storage.close()
+        self.assertIsNone(models.storage.get(State, state_id))
+        self.assertEqual(models.storage.count(State), count)
+        status, results = self.post([created, deleted, {
+            "op": "create", "class": "City",
+            "data": {"name": "Town", "state_id": state_id}}])
+        self.assertEqual(status, 400)
+        self.assertEqual(results[2]["status"], 404)
+        self.assertIsNone(models.storage.get(State, state_id))
+
+    def test_delete_then_create(self):
+        """Test that a stored object deleted before an item creates one
+        with its id is replaced"""
+        status, results = self.post([
+            {"op": "delete", "class": "State", "id": self.state.id},
+            {"op": "create", "class": "State",
+             "data": {"id": self.state.id, "name": "Replaced"}}])
+        self.assertEqual(status, 200)
+        self.assertEqual([result["status"] for result in results],
+                         [200, 201])
+        models.storage.close()
+        self.assertEqual(models.storage.get(State, self.state.id).name,
+                         "Replaced")
+
+    @unittest.skipIf(models.storage_t != 'db', "not testing db storage")
+    def test_column_values(self):
+        """Test that values the columns would refuse get their own 400"""
+        invalid = [{"name": None}, {"name": {"a": 1}}, {"name": ["a"]},
+                   {"name": 5}, {"name": "x" * 129}]
+        status, results = self.post([
+            {"op": "update", "class": "State", "id": self.state.id,
+             "data": data} for data in invalid] + [
+            {"op": "create", "class": "State", "data": {"name": None}},
+            {"op": "update", "class": "User", "id": self.user.id,
+             "data": {"first_name": None, "password": "p" * 200}}])
+        self.assertEqual(status, 400)
+        self.assertEqual([result["status"] for result in results],
+                         [400] * 6 + [200])
+        models.storage.close()
+        self.assertEqual(models.storage.get(State, self.state.id).name,
+                         "Batched")
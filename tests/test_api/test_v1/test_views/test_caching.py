@@ -0,0 +1,153 @@
+#!/usr/bin/python3
+"""
+Contains the TestCachingDocs, TestEntityTag, TestConditional and
+TestRedisCache classes
+"""
+
+from api.v1.app import app
+from api.v1.views import caching
+from api.v1.views.caching import conditional, entity_tag
+import inspect
+import models
+from models.city import City
+from models.state import State
+import pycodestyle
+from sqlalchemy import text
+import time
+import unittest
+from unittest import mock
+
+
+class TestCachingDocs(unittest.TestCase):
+    """Tests to check the documentation and style of caching"""
+    def test_pep8_conformance_caching(self):
+        """Test that api/v1/views/caching.py conforms to PEP8."""
+        pep8s = pycodestyle.StyleGuide(quiet=True)
+        result = pep8s.check_files(['api/v1/views/caching.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_caching_docstrings(self):
+        """Test for the presence of docstrings in caching"""
+        self.assertTrue(len(caching.__doc__) >= 1)
+        for name, func in inspect.getmembers(caching, inspect.isfunction):
+            if func.__module__ == caching.__name__:
+                self.assertTrue(func.__doc__,
+                                "{:s} needs a docstring".format(name))
+
+
+class TestEntityTag(unittest.TestCase):
+    """Test that entity tags change with the objects they depend on"""
+    def setUp(self):
+        """Store a state"""
+        self.state = State(name="Tagged")
+        models.storage.new(self.state)
+        models.storage.save()
+
+    def tearDown(self):
+        """Remove the state"""
+        models.storage.delete(models.storage.get(State, self.state.id))
+        models.storage.save()
+        models.storage.close()
+
+    def tag(self, *parts):
+        """Return the entity_tag() of parts for one path"""
+        with app.test_request_context("/api/v1/states"):
+            return entity_tag(*parts)
+
+    def test_object_version(self):
+        """Test that the tag of an object changes with every save, even
+        one that leaves its updated_at as it was"""
+        before = self.tag(self.state)
+        city_tag = self.tag(City)
+        self.assertEqual(self.tag(self.state), before)
+        self.state.name = "Retagged"
+        models.storage.new(self.state)
+        models.storage.save()
+        self.assertNotEqual(self.tag(self.state), before)
+        self.assertEqual(self.tag(City), city_tag)
+        self.assertIsNone(self.tag(State, None))
+
+    @unittest.skipIf(models.storage_t != 'db', "not testing db storage")
+    def test_foreign_write(self):
+        """Test that a tagged GET answers the row another process wrote,
+        not a copy cached before, under the new tag"""
+        client = app.test_client()
+        path = "/api/v1/states/" + self.state.id
+        models.storage.close()
+        tag = client.get(path).get_etag()[0]
+        self.assertEqual(client.get(path).get_json()["name"], "Tagged")
+        engine = models.storage._DBStorage__engine
+        with engine.begin() as conn:
+            conn.execute(text("UPDATE states SET name = 'Foreign' "
+                              "WHERE id = :id"), {"id": self.state.id})
+            conn.execute(text("UPDATE generations SET generation = "
+                              "generation + 1 WHERE class_name = 'State'"))
+        response = client.get(path, headers={"If-None-Match": tag})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()["name"], "Foreign")
+        self.assertNotEqual(response.get_etag()[0], tag)
+
+
+class TestConditional(unittest.TestCase):
+    """Test that conditional() answers 304 without running the view"""
+    def setUp(self):
+        """Wrap a view counting its calls"""
+        self.calls = 0
+
+        def view():
+            """Count the call and answer"""
+            self.calls += 1
+            return "body"
+        self.view = conditional(lambda: entity_tag("part"))(view)
+
+    def get(self, *tags):
+        """Return the response of the view to a GET with If-None-Match"""
+        headers = {"If-None-Match": ", ".join(
+            '"{}"'.format(tag) for tag in tags)} if tags else {}
+        with app.test_request_context("/api/v1/conditional",
+                                      headers=headers):
+            return self.view()
+
+    def test_not_modified(self):
+        """Test that a matching tag skips the view"""
+        response = self.get()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.calls, 1)
+        tag = response.get_etag()[0]
+        response = self.get("other", tag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.get_etag()[0], tag)
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(self.get("other").status_code, 200)
+        self.assertEqual(self.calls, 2)
+
+
+class TestRedisCache(unittest.TestCase):
+    """Test that Redis entries expire and a missing server is a miss"""
+    def setUp(self):
+        """Point a cache at a port nothing listens on"""
+        try:
+            self.cache = caching.RedisCache("redis://127.0.0.1:1/0", ttl=60,
+                                            timeout=0.2)
+        except ImportError:
+            self.skipTest("redis is not installed")
+
+    def test_expiry(self):
+        """Test that put() sets the time to live"""
+        with mock.patch.object(self.cache.client, "set") as put:
+            self.cache.put("key", {"a": 1})
+        put.assert_called_once_with("hbnb:response:key", '{"a": 1}', ex=60)
+        self.assertEqual(caching.RedisCache("redis://127.0.0.1:1/0",
+                                            ttl=0).ttl, None)
+
+    def test_unreachable(self):
+        """Test that an unreachable server only counts misses"""
+        kwargs = self.cache.client.connection_pool.connection_kwargs
+        self.assertEqual(kwargs["socket_timeout"], 0.2)
+        self.assertEqual(kwargs["socket_connect_timeout"], 0.2)
+        start = time.monotonic()
+        self.cache.put("key", {"a": 1})
+        self.assertIsNone(self.cache.get("key"))
+        self.assertLess(time.monotonic() - start, 5)
+        self.assertEqual(self.cache.status()["misses"], 1)
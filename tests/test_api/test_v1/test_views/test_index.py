@@ -0,0 +1,80 @@
+#!/usr/bin/python3
+"""
+Contains the TestIndexDocs and TestStats classes
+"""
+
+from api.v1.app import app
+from api.v1.views import index
+import inspect
+import models
+from models.state import State
+import pycodestyle
+from sqlalchemy import event
+import unittest
+
+
+class TestIndexDocs(unittest.TestCase):
+    """Tests to check the documentation and style of the index views"""
+    def test_pep8_conformance_index(self):
+        """Test that api/v1/views/index.py conforms to PEP8."""
+        pep8s = pycodestyle.StyleGuide(quiet=True)
+        result = pep8s.check_files(['api/v1/views/index.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_index_docstrings(self):
+        """Test for the presence of docstrings in the index views"""
+        self.assertTrue(len(index.__doc__) >= 1)
+        for name, func in inspect.getmembers(index, inspect.isfunction):
+            if func.__module__ == index.__name__:
+                self.assertTrue(func.__doc__,
+                                "{:s} needs a docstring".format(name))
+
+
+class TestStats(unittest.TestCase):
+    """Test that GET /api/v1/stats is tagged by the object counts"""
+    def setUp(self):
+        """Prepare a client"""
+        self.client = app.test_client()
+        self.statements = []
+
+    def count(self, conn, cursor, statement, *args):
+        """Record one executed statement"""
+        self.statements.append(statement)
+
+    def test_tag(self):
+        """Test that the tag follows the counts"""
+        response = self.client.get("/api/v1/stats")
+        self.assertEqual(response.status_code, 200)
+        tag = response.get_etag()[0]
+        state = State(name="Counted")
+        state.save()
+        try:
+            response = self.client.get("/api/v1/stats",
+                                       headers={"If-None-Match": tag})
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.get_json()["states"],
+                             models.storage.count(State))
+            self.assertNotEqual(response.get_etag()[0], tag)
+        finally:
+            models.storage.delete(state)
+            models.storage.save()
+            models.storage.close()
+        response = self.client.get("/api/v1/stats",
+                                   headers={"If-None-Match": tag})
+        self.assertEqual(response.status_code, 304)
+
+    @unittest.skipIf(models.storage_t != 'db', "not testing db storage")
+    def test_no_query(self):
+        """Test that revalidating the stats queries nothing while the
+        counts are fresh"""
+        tag = self.client.get("/api/v1/stats").get_etag()[0]
+        engine = models.storage._DBStorage__engine
+        event.listen(engine, "before_cursor_execute", self.count)
+        try:
+            response = self.client.get("/api/v1/stats",
+                                       headers={"If-None-Match": tag})
+        finally:
+            event.remove(engine, "before_cursor_execute", self.count)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(self.statements, [])
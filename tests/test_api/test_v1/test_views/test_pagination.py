@@ -0,0 +1,108 @@
+#!/usr/bin/python3
+"""
+Contains the TestPaginationDocs and TestRankedPages classes
+"""
+
+from api.v1.app import app
+from api.v1.views import pagination
+import inspect
+import models
+from models.city import City
+from models.place import Place
+from models.review import Review
+from models.state import State
+from models.user import User
+import pycodestyle
+import unittest
+
+
+class TestPaginationDocs(unittest.TestCase):
+    """Tests to check the documentation and style of pagination"""
+    def test_pep8_conformance_pagination(self):
+        """Test that api/v1/views/pagination.py conforms to PEP8."""
+        pep8s = pycodestyle.StyleGuide(quiet=True)
+        result = pep8s.check_files(['api/v1/views/pagination.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_pagination_docstrings(self):
+        """Test for the presence of docstrings in pagination"""
+        self.assertTrue(len(pagination.__doc__) >= 1)
+        for name, func in inspect.getmembers(pagination, inspect.isfunction):
+            if func.__module__ == pagination.__name__:
+                self.assertTrue(func.__doc__,
+                                "{:s} needs a docstring".format(name))
+
+
+class TestRankedPages(unittest.TestCase):
+    """Test that ranked search results are paged in their order"""
+    def setUp(self):
+        """Store five places and reviews whose ids run against their rank:
+        the nearest place and most relevant review have the largest id"""
+        self.client = app.test_client()
+        state = State(name="Paged")
+        city = City(name="Paged", state_id=state.id)
+        user = User(email="paged@hbnb.io", password="pwd")
+        self.objs = [state, city, user]
+        for i in range(5):
+            place = Place(id="place-{}".format(4 - i), city_id=city.id,
+                          user_id=user.id, name="Paged",
+                          latitude=10 + i, longitude=20)
+            review = Review(id="review-{}".format(4 - i), place_id=place.id,
+                            user_id=user.id,
+                            text=" ".join(["wqzxv"] * (5 - i) +
+                                          ["other"] * i))
+            self.objs += [place, review]
+        for obj in self.objs:
+            models.storage.new(obj)
+        models.storage.save()
+        models.storage.close()
+
+    def tearDown(self):
+        """Remove the objects of the test from storage"""
+        for obj in reversed(self.objs):
+            obj = models.storage.get(type(obj), obj.id)
+            if obj is not None:
+                models.storage.delete(obj)
+        models.storage.save()
+        models.storage.close()
+
+    def pages(self, send, limit):
+        """Return the ids of every page of limit objects, following the
+        cursors; send(query string) returns a response"""
+        pages = []
+        query = "limit={}".format(limit)
+        while True:
+            response = send(query)
+            self.assertEqual(response.status_code, 200)
+            pages.append([obj["id"] for obj in response.get_json()])
+            cursor = response.headers.get("X-Next-Cursor")
+            if cursor is None:
+                return pages
+            query = "limit={}&after={}".format(limit, cursor)
+
+    def test_places_search_near(self):
+        """Test that places near a point come nearest first, page after
+        page"""
+        body = {"near": {"lat": 10, "lng": 20, "radius_km": 1000}}
+        pages = self.pages(lambda query: self.client.post(
+            "/api/v1/places_search?" + query, json=body), 2)
+        self.assertEqual(pages, [["place-4", "place-3"],
+                                 ["place-2", "place-1"], ["place-0"]])
+
+    def test_reviews_search(self):
+        """Test that reviews come the most relevant first, page after
+        page"""
+        whole = self.client.get("/api/v1/reviews_search?q=wqzxv").get_json()
+        ids = [review["id"] for review in whole]
+        self.assertNotEqual(ids, sorted(ids))
+        pages = self.pages(lambda query: self.client.get(
+            "/api/v1/reviews_search?q=wqzxv&" + query), 2)
+        self.assertEqual(sum(pages, []), ids)
+        self.assertEqual([len(page) for page in pages], [2, 2, 1])
+
+    def test_invalid_cursor(self):
+        """Test that a cursor without a position is rejected"""
+        response = self.client.get(
+            "/api/v1/reviews_search?q=wqzxv&limit=2&after=cmV2aWV3LTQ=")
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,104 @@
+#!/usr/bin/python3
+"""
+Contains the TestBulkDocs and TestBulk classes
+"""
+
+import bulk
+import inspect
+import io
+import json
+import models
+from models.engine.file_storage import FileStorage
+from models.amenity import Amenity
+from models.city import City
+from models.place import Place
+from models.state import State
+from models.user import User
+import os
+import pycodestyle
+import unittest
+from unittest import mock
+
+
+class TestBulkDocs(unittest.TestCase):
+    """Class for testing documentation of bulk.py"""
+    def test_pep8_conformance_bulk(self):
+        """Test that bulk.py conforms to PEP8."""
+        pep8s = pycodestyle.StyleGuide(quiet=True)
+        result = pep8s.check_files(['bulk.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_pep8_conformance_test_bulk(self):
+        """Test that tests/test_bulk.py conforms to PEP8."""
+        pep8s = pycodestyle.StyleGuide(quiet=True)
+        result = pep8s.check_files(['tests/test_bulk.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_bulk_docstrings(self):
+        """Test for the presence of docstrings in bulk.py"""
+        self.assertTrue(len(bulk.__doc__) >= 1)
+        for name, func in inspect.getmembers(bulk, inspect.isfunction):
+            if func.__module__ == "bulk":
+                self.assertTrue(func.__doc__,
+                                "{:s} needs a docstring".format(name))
+
+
+@unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+class TestBulk(unittest.TestCase):
+    """Test exporting and importing objects with file storage"""
+    def setUp(self):
+        """Point FileStorage at a scratch file holding one of each class"""
+        self.saved = {attr: getattr(FileStorage, "_FileStorage__" + attr)
+                      for attr in ("file_path", "objects", "stamp")}
+        FileStorage._FileStorage__file_path = "file_bulk_test.json"
+        FileStorage._FileStorage__objects = {}
+        state = State(name="California")
+        city = City(name="San Francisco", state_id=state.id)
+        user = User(email="a@b.c", password="pwd")
+        amenity = Amenity(name="Wifi")
+        place = Place(name="Loft", city_id=city.id, user_id=user.id,
+                      number_rooms=2, latitude=37.7,
+                      amenity_ids=[amenity.id])
+        self.objs = [state, city, user, amenity, place]
+        for obj in self.objs:
+            models.storage.new(obj)
+        self.stderr = mock.patch("sys.stderr", new=io.StringIO())
+        self.stderr.start()
+
+    def tearDown(self):
+        """Restore FileStorage and remove the scratch file"""
+        self.stderr.stop()
+        if os.path.exists("file_bulk_test.json"):
+            os.remove("file_bulk_test.json")
+        for attr, value in self.saved.items():
+            setattr(FileStorage, "_FileStorage__" + attr, value)
+
+    def round_trip(self, fmt):
+        """exports every object, then imports them into empty storage"""
+        out = io.StringIO()
+        bulk.export(out, fmt, list(bulk.classes))
+        FileStorage._FileStorage__objects = {}
+        bulk.load(io.StringIO(out.getvalue()), fmt, 2)
+        return out.getvalue()
+
+    def test_ndjson_order(self):
+        """Test that an NDJSON export lists parents first, one per line"""
+        lines = self.round_trip("ndjson").splitlines()
+        self.assertEqual([json.loads(line)["__class__"] for line in lines],
+                         ["State", "City", "User", "Amenity", "Place"])
+
+    def test_round_trip(self):
+        """Test that both formats bring back the same attributes"""
+        for fmt in ("ndjson", "csv"):
+            with self.subTest(fmt=fmt):
+                FileStorage._FileStorage__objects = {}
+                for obj in self.objs:
+                    models.storage.new(obj)
+                self.round_trip(fmt)
+                for obj in self.objs:
+                    loaded = models.storage.get(type(obj), obj.id)
+                    self.assertEqual(loaded.to_dict(saving=True),
+                                     obj.to_dict(saving=True))
+                self.assertTrue(os.path.exists("file_bulk_test.json"))
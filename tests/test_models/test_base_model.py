@@ -1,6 +1,6 @@
 #!/usr/bin/python3
 """Test BaseModel for expected behavior and documentation"""
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 import inspect
 import models
 import pycodestyle as pycodestyle
@@ -138,6 +138,43 @@ class TestBaseModel(unittest.TestCase):
         self.assertEqual(new_d["created_at"], bm.created_at.strftime(t_format))
         self.assertEqual(new_d["updated_at"], bm.updated_at.strftime(t_format))
 
+    def test_time_round_trip(self):
+        """test that format_time() matches strftime() and parse_time()
+        reads back the same datetime as strptime()"""
+        t_format = "%Y-%m-%dT%H:%M:%S.%f"
+        dates = [datetime(2017, 9, 28, 21, 3, 54, 52298),
+                 datetime(2017, 9, 28, 21, 3, 54),
+                 datetime(1999, 12, 31, 23, 59, 59, 999999),
+                 datetime.now(timezone.utc),
+                 datetime.now(timezone(timedelta(hours=-7)))]
+        for date in dates:
+            with self.subTest(date=date):
+                string = models.base_model.format_time(date)
+                self.assertEqual(string, date.strftime(t_format))
+                self.assertEqual(models.base_model.parse_time(string),
+                                 datetime.strptime(string, t_format))
+        for string in ["2017-09-28T21:03:54.5", "2017-09-28T21:03:54.052"]:
+            with self.subTest(string=string):
+                self.assertEqual(models.base_model.parse_time(string),
+                                 datetime.strptime(string, t_format))
+        for string in ["28/09/2017", "2017-09-28T21:03:54",
+                       "2017-09-28 21:03:54.052298",
+                       "2017-09-28T21:03:54.05229Z",
+                       "2017-09-28T21:03:54.052298+00:00",
+                       "20170928T210354.052298"]:
+            with self.subTest(string=string):
+                with self.assertRaises(ValueError):
+                    datetime.strptime(string, t_format)
+                with self.assertRaises(ValueError):
+                    models.base_model.parse_time(string)
+
+    def test_kwargs_time_round_trip(self):
+        """test that an instance made from to_dict() has the same times"""
+        bm = BaseModel()
+        copy = BaseModel(**bm.to_dict())
+        self.assertEqual(copy.created_at, bm.created_at.replace(tzinfo=None))
+        self.assertEqual(copy.to_dict(), bm.to_dict())
+
     def test_str(self):
         """test that the str method has the correct output"""
         inst = BaseModel()
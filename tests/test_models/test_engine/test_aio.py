@@ -0,0 +1,95 @@
+#!/usr/bin/python3
+"""
+Contains the TestAsyncStorageDocs and TestAsyncStorage classes
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import inspect
+import models
+from models.engine import aio
+from models.engine.aio import AsyncStorage
+from models.state import State
+import pycodestyle
+import threading
+import unittest
+
+
+class TestAsyncStorageDocs(unittest.TestCase):
+    """Tests to check the documentation and style of AsyncStorage class"""
+    def test_pep8_conformance_aio(self):
+        """Test that models/engine/aio.py conforms to PEP8."""
+        pep8s = pycodestyle.StyleGuide(quiet=True)
+        result = pep8s.check_files(['models/engine/aio.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_aio_docstrings(self):
+        """Test for the presence of docstrings in AsyncStorage"""
+        self.assertTrue(len(aio.__doc__) >= 1)
+        self.assertTrue(len(AsyncStorage.__doc__) >= 1)
+        for name, func in inspect.getmembers(AsyncStorage,
+                                             inspect.isfunction):
+            self.assertTrue(func.__doc__, "{:s} needs a docstring".format(
+                name))
+
+
+class TestAsyncStorage(unittest.TestCase):
+    """Test that AsyncStorage runs storage calls off the event loop"""
+    def setUp(self):
+        """Wrap the storage with a pool of two threads"""
+        self.executor = ThreadPoolExecutor(2)
+        self.storage = AsyncStorage(models.storage, self.executor)
+
+    def tearDown(self):
+        """Stop the pool"""
+        self.executor.shutdown()
+
+    def test_methods(self):
+        """Test that storage methods become awaitable"""
+        state = State(name="Awaited")
+
+        def add():
+            """Store the state"""
+            models.storage.new(state)
+            models.storage.save()
+
+        async def scenario():
+            """Store, read then delete the state"""
+            await self.storage.run(add)
+            found = await self.storage.get(State, state.id)
+            count = await self.storage.count(State)
+            await self.storage.run(lambda: (models.storage.delete(
+                models.storage.get(State, state.id)), models.storage.save()))
+            return found, count, await self.storage.get(State, state.id)
+        found, count, deleted = asyncio.run(scenario())
+        self.assertEqual(found.id, state.id)
+        self.assertEqual(found.name, "Awaited")
+        self.assertGreaterEqual(count, 1)
+        self.assertIsNone(deleted)
+        self.assertEqual(self.storage.count.__doc__,
+                         models.storage.count.__doc__)
+
+    def test_private(self):
+        """Test that only the public storage methods are wrapped"""
+        with self.assertRaises(AttributeError):
+            self.storage._FileStorage__objects
+        with self.assertRaises(AttributeError):
+            self.storage.missing
+
+    def test_threads(self):
+        """Test that the calls run on the pool, concurrently"""
+        barrier = threading.Barrier(2, timeout=5)
+
+        def meet():
+            """Wait for the other call, then return the current thread"""
+            barrier.wait()
+            return threading.current_thread()
+
+        async def scenario():
+            """Run two calls at once"""
+            return await asyncio.gather(self.storage.run(meet),
+                                        self.storage.run(meet))
+        threads = asyncio.run(scenario())
+        self.assertNotEqual(threads[0], threads[1])
+        self.assertNotIn(threading.current_thread(), threads)
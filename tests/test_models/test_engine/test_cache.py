@@ -0,0 +1,86 @@
+#!/usr/bin/python3
+"""
+Contains the TestObjectCacheDocs and TestObjectCache classes
+"""
+
+import inspect
+from models.engine import cache
+from models.engine.cache import ObjectCache
+import pycodestyle
+import unittest
+from unittest import mock
+
+
+class TestObjectCacheDocs(unittest.TestCase):
+    """Tests to check the documentation and style of ObjectCache class"""
+    def test_pep8_conformance_cache(self):
+        """Test that models/engine/cache.py conforms to PEP8."""
+        pep8s = pycodestyle.StyleGuide(quiet=True)
+        result = pep8s.check_files(['models/engine/cache.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_cache_docstrings(self):
+        """Test for the presence of docstrings in ObjectCache"""
+        self.assertTrue(len(cache.__doc__) >= 1)
+        self.assertTrue(len(ObjectCache.__doc__) >= 1)
+        for name, func in inspect.getmembers(ObjectCache,
+                                             inspect.isfunction):
+            self.assertTrue(func.__doc__, "{:s} needs a docstring".format(
+                name))
+
+
+class TestObjectCache(unittest.TestCase):
+    """Test the LRU and TTL behavior of ObjectCache"""
+    def test_hit_miss(self):
+        """Test that get() counts hits and misses"""
+        objs = ObjectCache(2)
+        self.assertIsNone(objs.get("State.1"))
+        objs.put("State.1", "one")
+        self.assertEqual(objs.get("State.1"), "one")
+        self.assertEqual((objs.hits, objs.misses), (1, 1))
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted first"""
+        objs = ObjectCache(2)
+        objs.put("State.1", "one")
+        objs.put("State.2", "two")
+        objs.get("State.1")
+        objs.put("State.3", "three")
+        self.assertIsNone(objs.get("State.2"))
+        self.assertEqual(objs.get("State.1"), "one")
+        self.assertEqual(objs.evictions, 1)
+        self.assertEqual(len(objs), 2)
+
+    def test_ttl(self):
+        """Test that entries expire after ttl seconds"""
+        objs = ObjectCache(2, ttl=10)
+        with mock.patch("time.monotonic", return_value=100):
+            objs.put("State.1", "one")
+        with mock.patch("time.monotonic", return_value=109):
+            self.assertEqual(objs.get("State.1"), "one")
+        with mock.patch("time.monotonic", return_value=111):
+            self.assertIsNone(objs.get("State.1"))
+        self.assertEqual(len(objs), 0)
+
+    def test_discard_disabled(self):
+        """Test discard() and that a maxsize of 0 caches nothing"""
+        objs = ObjectCache(2)
+        objs.put("State.1", "one")
+        objs.discard("State.1")
+        objs.discard("State.1")
+        self.assertIsNone(objs.get("State.1"))
+        disabled = ObjectCache(0)
+        disabled.put("State.1", "one")
+        self.assertEqual(disabled.status()["entries"], 0)
+
+    def test_discard_prefix(self):
+        """Test that discard_prefix() removes the entries of one class"""
+        objs = ObjectCache(4)
+        objs.put("State.1", "one")
+        objs.put("State.2", "two")
+        objs.put("City.1", "three")
+        objs.discard_prefix("State.")
+        self.assertIsNone(objs.get("State.1"))
+        self.assertIsNone(objs.get("State.2"))
+        self.assertEqual(objs.get("City.1"), "three")
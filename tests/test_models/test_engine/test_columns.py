@@ -0,0 +1,73 @@
+#!/usr/bin/python3
+"""
+Contains the TestColumnsDocs and TestColumns classes
+"""
+
+import inspect
+import math
+from models.engine import columns
+from models.engine.columns import Columns
+import pycodestyle
+import types
+import unittest
+from unittest import mock
+
+
+class TestColumnsDocs(unittest.TestCase):
+    """Tests to check the documentation and style of Columns class"""
+    def test_pep8_conformance_columns(self):
+        """Test that models/engine/columns.py conforms to PEP8."""
+        pep8s = pycodestyle.StyleGuide(quiet=True)
+        result = pep8s.check_files(['models/engine/columns.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_columns_docstrings(self):
+        """Test for the presence of docstrings in Columns"""
+        self.assertTrue(len(columns.__doc__) >= 1)
+        self.assertTrue(len(Columns.__doc__) >= 1)
+        for name, func in inspect.getmembers(Columns, inspect.isfunction):
+            self.assertTrue(func.__doc__, "{:s} needs a docstring".format(
+                name))
+
+
+class TestColumns(unittest.TestCase):
+    """Test Columns rows and range selection, with and without NumPy"""
+    def setUp(self):
+        """Fill columns with five rows"""
+        self.cols = Columns(("price", "guests"))
+        for i in range(5):
+            self.cols.add(str(i), types.SimpleNamespace(price=i * 10,
+                                                        guests=i))
+
+    def select(self, ranges):
+        """returns the keys select() finds, checking both code paths"""
+        found = sorted(self.cols.select(ranges))
+        with mock.patch.object(columns, "numpy", None):
+            self.assertEqual(sorted(self.cols.select(ranges)), found)
+        return found
+
+    def test_number(self):
+        """Test that only ints and floats are stored as numbers"""
+        self.assertEqual(Columns.number(3), 3.0)
+        self.assertTrue(math.isnan(Columns.number("3")))
+        self.assertTrue(math.isnan(Columns.number(True)))
+        self.assertTrue(math.isnan(Columns.number(None)))
+
+    def test_select(self):
+        """Test closed and open ranges over one and two columns"""
+        self.assertEqual(self.select({"price": (10, 30)}), ["1", "2", "3"])
+        self.assertEqual(self.select({"price": (None, 10)}), ["0", "1"])
+        self.assertEqual(self.select({"price": (10, None),
+                                      "guests": (None, 2)}), ["1", "2"])
+        self.assertEqual(self.select({}), ["0", "1", "2", "3", "4"])
+
+    def test_remove_and_set(self):
+        """Test that the last row fills the hole of a removed one"""
+        self.cols.remove("1")
+        self.cols.remove("missing")
+        self.assertEqual(len(self.cols), 4)
+        self.assertEqual(self.cols.rows["4"], 1)
+        self.cols.set("4", "price", 15)
+        self.cols.set("0", "price", "free")
+        self.assertEqual(self.select({"price": (None, 20)}), ["2", "4"])
@@ -0,0 +1,123 @@
+#!/usr/bin/python3
+"""
+Contains the TestCompactDocs and TestCompactClass classes
+"""
+
+import inspect
+import models
+from models.engine import compact
+from models.engine.compact import Field, compact_class
+from models.place import Place
+from models.review import Review
+from models.user import User
+import pycodestyle
+import unittest
+from unittest import mock
+
+
+class TestCompactDocs(unittest.TestCase):
+    """Tests to check the documentation and style of compact classes"""
+    def test_pep8_conformance_compact(self):
+        """Test that models/engine/compact.py conforms to PEP8."""
+        pep8s = pycodestyle.StyleGuide(quiet=True)
+        result = pep8s.check_files(['models/engine/compact.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_compact_docstrings(self):
+        """Test for the presence of docstrings in compact classes"""
+        self.assertTrue(len(compact.__doc__) >= 1)
+        self.assertTrue(len(Field.__doc__) >= 1)
+        for name, func in inspect.getmembers(compact, inspect.isfunction):
+            if func.__module__ == compact.__name__:
+                self.assertTrue(func.__doc__,
+                                "{:s} needs a docstring".format(name))
+        for name, func in inspect.getmembers(Field, inspect.isfunction):
+            self.assertTrue(func.__doc__, "{:s} needs a docstring".format(
+                name))
+
+
+@unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+class TestCompactClass(unittest.TestCase):
+    """Test that compact objects behave as objects of their model class"""
+    def build(self, cls, **attrs):
+        """Return the object of the compact class of cls for attrs"""
+        return compact_class(cls, tuple(attrs))(**attrs)
+
+    def test_same_class(self):
+        """Test that the compact class passes for its model class"""
+        review = Review(place_id="0001", user_id="0002", text="Nice")
+        attrs = review.to_dict()
+        del attrs["__class__"]
+        klass = compact_class(Review, tuple(attrs))
+        self.assertIsNot(klass, Review)
+        self.assertIs(compact_class(Review, tuple(attrs)), klass)
+        self.assertTrue(issubclass(klass, Review))
+        self.assertEqual(klass.__name__, "Review")
+        copy = klass(**review.to_dict())
+        self.assertEqual(copy.to_dict(), review.to_dict())
+        self.assertEqual(str(copy), str(Review(**review.to_dict())))
+        self.assertFalse(hasattr(copy, "_dict"))
+
+    def test_defaults(self):
+        """Test that unset fields read as the class-level values, and that
+        to_dict() leaves them out"""
+        place = self.build(Place, id="0001", name="Loft")
+        self.assertEqual(place.city_id, "")
+        self.assertEqual(place.amenity_ids, [])
+        self.assertEqual(type(place).city_id, "")
+        self.assertNotIn("city_id", place.to_dict())
+        place.city_id = "0002"
+        self.assertEqual(place.to_dict()["city_id"], "0002")
+        del place.city_id
+        self.assertEqual(place.city_id, "")
+        user = self.build(User, id="0003")
+        self.assertEqual(user.email, "")
+        del user.id
+        with self.assertRaises(AttributeError):
+            user.id
+
+    def test_other_attributes(self):
+        """Test that attributes outside the fields go to __dict__, after
+        the fields"""
+        review = self.build(Review, id="0001", text="Nice")
+        review.stars = 5
+        self.assertEqual(review.stars, 5)
+        self.assertEqual(list(review.to_dict())[-2:], ["stars", "__class__"])
+        self.assertIn("'stars': 5", str(review))
+
+    def test_indexed(self):
+        """Test that setting an indexed field tells storage, and only when
+        the value changes"""
+        review = self.build(Review, id="0001", place_id="0002")
+        with mock.patch("models.storage.reindex") as reindex:
+            review.place_id = "0003"
+            review.place_id = "0003"
+            review.text = "Nice"
+        reindex.assert_any_call(review, "place_id", "0002")
+        reindex.assert_any_call(review, "text", "")
+        self.assertEqual(reindex.call_count, 2)
+
+    def test_password(self):
+        """Test that a compact user still hashes the passwords set"""
+        user = self.build(User, id="0001", email="a@b.c")
+        user.password = "pwd"
+        self.assertEqual(user.password, User(password="pwd").password)
+
+    def test_fallback(self):
+        """Test that attribute names a slot cannot hold keep the model
+        class"""
+        self.assertIs(compact_class(Review, ("id", "_private")), Review)
+        self.assertIs(compact_class(Review, ("id", "save")), Review)
+        self.assertIs(compact_class(Place, ("id", "reviews")), Place)
+
+    def test_max_shapes(self):
+        """Test that a model class gets at most MAX_SHAPES compact
+        classes"""
+        with mock.patch.object(compact, "MAX_SHAPES", 2), \
+                mock.patch.dict(compact.shapes, clear=True), \
+                mock.patch.dict(compact.made, clear=True):
+            self.assertIsNot(compact_class(Review, ("id", "a")), Review)
+            self.assertIsNot(compact_class(Review, ("id", "b")), Review)
+            self.assertIs(compact_class(Review, ("id", "c")), Review)
+            self.assertIsNot(compact_class(Review, ("id", "a")), Review)
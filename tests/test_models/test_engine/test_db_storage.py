@@ -6,7 +6,7 @@ Contains the TestDBStorageDocs and TestDBStorage classes
 from datetime import datetime
 import inspect
 import models
-from models.engine import db_storage
+from models.engine import db_storage, events
 from models.amenity import Amenity
 from models.base_model import BaseModel
 from models.city import City
@@ -17,7 +17,13 @@ from models.user import User
 import json
 import os
 import pycodestyle
+from sqlalchemy import create_engine, event, exc, text
+from sqlalchemy.dialects import mysql
+from sqlalchemy.schema import CreateTable
+from sqlalchemy.pool import QueuePool
+import tempfile
 import unittest
+from unittest import mock
 DBStorage = db_storage.DBStorage
 classes = {"Amenity": Amenity, "City": City, "Place": Place,
            "Review": Review, "State": State, "User": User}
@@ -87,6 +93,116 @@ class TestFileStorage(unittest.TestCase):
     def test_save(self):
         """Test that save properly saves objects to file.json"""
 
+    @unittest.skipIf(models.storage_t != 'db', "not testing db storage")
+    def test_where(self):
+        """Test that where() turns ranges and values into SQL filters"""
+        state = State(name="Ranged")
+        city = City(name="Ranged", state_id=state.id)
+        user = User(email="where@test", password="pwd")
+        places = [Place(city_id=city.id, user_id=user.id, name=str(price),
+                        price_by_night=price) for price in (40, 80, 120)]
+        for obj in [state, city, user] + places:
+            models.storage.new(obj)
+        models.storage.save()
+        found = models.storage.where(Place, city_id=city.id,
+                                     price_by_night=(50, None))
+        self.assertEqual(sorted(p.price_by_night for p in found), [80, 120])
+        self.assertEqual(models.storage.where("Place", city_id=city.id,
+                                              price_by_night=(None, 80),
+                                              name="40"), places[:1])
+        for obj in places + [user, city, state]:
+            models.storage.delete(obj)
+        models.storage.save()
+
+    @unittest.skipIf(models.storage_t != 'db', "not testing db storage")
+    def test_near_and_within(self):
+        """Test that near() and within() read boxes and sort by distance"""
+        state = State(name="Mapped")
+        city = City(name="Mapped", state_id=state.id)
+        user = User(email="near@test", password="pwd")
+        paris = Place(city_id=city.id, user_id=user.id, name="Paris",
+                      latitude=48.8566, longitude=2.3522)
+        london = Place(city_id=city.id, user_id=user.id, name="London",
+                       latitude=51.5074, longitude=-0.1278)
+        fiji = Place(city_id=city.id, user_id=user.id, name="Fiji",
+                     latitude=-17.7, longitude=178.1)
+        objs = [state, city, user, paris, london, fiji]
+        for obj in objs:
+            models.storage.new(obj)
+        models.storage.save()
+        self.assertEqual(models.storage.near(Place, 50, 1, 400),
+                         [paris, london])
+        self.assertEqual(models.storage.within("Place", -20, 170, -10, -170),
+                         [fiji])
+        for obj in reversed(objs):
+            models.storage.delete(obj)
+        models.storage.save()
+
+    @unittest.skipIf(models.storage_t != 'db', "not testing db storage")
+    def test_text_search(self):
+        """Test that save() keeps the full-text side tables up to date"""
+        state = State(name="Texts")
+        city = City(name="Texts", state_id=state.id)
+        user = User(email="text@test", password="pwd")
+        loft = Place(city_id=city.id, user_id=user.id, name="Zyxwv loft")
+        flat = Place(city_id=city.id, user_id=user.id, name="Flat",
+                     description="Zyxwv zyxwv view")
+        objs = [state, city, user, loft, flat]
+        for obj in objs:
+            models.storage.new(obj)
+        models.storage.save()
+        self.assertEqual(models.storage.search(Place, "ZYXWV"), [flat, loft])
+        self.assertEqual(models.storage.search("Place", "zyxwv loft", 1),
+                         [loft])
+        flat.description = "Dark"
+        models.storage.save()
+        self.assertEqual(models.storage.search(Place, "zyxwv"), [loft])
+        for obj in reversed(objs):
+            models.storage.delete(obj)
+        models.storage.save()
+        self.assertEqual(models.storage.search(Place, "zyxwv"), [])
+
+    @unittest.skipIf(models.storage_t != 'db', "not testing db storage")
+    def test_text_search_accents(self):
+        """Test that terms differing by an accent are different keys"""
+        ddl = str(CreateTable(db_storage.search_terms).compile(
+            dialect=mysql.dialect()))
+        self.assertIn("COLLATE utf8mb4_bin", ddl)
+        state = State(name="Accents")
+        city = City(name="Accents", state_id=state.id)
+        user = User(email="accents@test", password="pwd")
+        cafe = Place(city_id=city.id, user_id=user.id, name="Cafe",
+                     description="café cafe")
+        objs = [state, city, user, cafe]
+        for obj in objs:
+            models.storage.new(obj)
+        models.storage.save()
+        try:
+            self.assertEqual(models.storage.search(Place, "café"), [cafe])
+        finally:
+            for obj in reversed(objs):
+                models.storage.delete(obj)
+            models.storage.save()
+
+    @unittest.skipIf(models.storage_t != 'db', "not testing db storage")
+    def test_generation(self):
+        """Test that generation() changes with the rows of its class"""
+        before = models.storage.generation(State)
+        state = State(name="Generated")
+        models.storage.new(state)
+        models.storage.save()
+        added = models.storage.generation("State")
+        self.assertNotEqual(added, before)
+        state.name = "Renamed"
+        state.save()
+        self.assertNotEqual(models.storage.generation(State), added)
+        saved = models.storage.generation(State)
+        both = models.storage.generation(State, City)
+        models.storage.delete(state)
+        models.storage.save()
+        self.assertNotEqual(models.storage.generation(State), saved)
+        self.assertNotEqual(models.storage.generation(State, City), both)
+
     def test_get(self):
         """Test the get method for DBStorage."""
         state = State(name="TestState")
@@ -102,4 +218,341 @@ class TestFileStorage(unittest.TestCase):
         self.session.add(state)
         self.session.commit()
         new_count = models.storage.count(State)
-        self.assertEqual(new_count, initial_count + 1)
\ No newline at end of file
+        self.assertEqual(new_count, initial_count + 1)
+
+
+@unittest.skipIf(models.storage_t != 'db', "not testing db storage")
+class TestDBStorageEager(unittest.TestCase):
+    """Test how many SQL statements relationship loading takes"""
+    def setUp(self):
+        """Store three states of two cities each, then count statements"""
+        self.ids = []
+        for i in range(3):
+            state = State(name="Eager {}".format(i))
+            models.storage.new(state)
+            self.ids.append(state.id)
+            for j in range(2):
+                models.storage.new(City(name="City {}".format(j),
+                                        state_id=state.id))
+        models.storage.save()
+        models.storage.close()
+        self.engine = models.storage._DBStorage__engine
+        self.statements = []
+        event.listen(self.engine, "before_cursor_execute", self.count)
+
+    def tearDown(self):
+        """Stop counting and remove the states and cities"""
+        event.remove(self.engine, "before_cursor_execute", self.count)
+        for state_id in self.ids:
+            state = models.storage.get(State, state_id, eager=("cities",))
+            for city in state.cities:
+                models.storage.delete(city)
+            models.storage.delete(state)
+        models.storage.save()
+        models.storage.close()
+
+    def count(self, conn, cursor, statement, *args):
+        """Record one executed statement"""
+        self.statements.append(statement)
+
+    def test_all_eager(self):
+        """Test that all() loads the cities of every state in one query"""
+        states = models.storage.all(State, eager=("cities",))
+        cities = [city for state in states.values() for city in state.cities]
+        self.assertGreaterEqual(len(cities), 6)
+        self.assertEqual(len(self.statements), 2)
+
+    def test_all_lazy(self):
+        """Test that without eager loading each state costs a query"""
+        states = models.storage.all(State)
+        for state in states.values():
+            state.cities
+        self.assertEqual(len(self.statements), 1 + len(states))
+
+    def test_get_eager_nested(self):
+        """Test that get() loads nested relationships along"""
+        state = models.storage.get(State, self.ids[0],
+                                   eager=("cities.places",))
+        places = [place for city in state.cities for place in city.places]
+        self.assertEqual(places, [])
+        self.assertEqual(len(state.cities), 2)
+        self.assertEqual(len(self.statements), 3)
+
+
+@unittest.skipIf(models.storage_t != 'db', "not testing db storage")
+class TestDBStorageCache(unittest.TestCase):
+    """Test that get() reads through the object cache"""
+    def setUp(self):
+        """Store a state, then count statements in a fresh session"""
+        self.state = State(name="Cached")
+        models.storage.new(self.state)
+        models.storage.save()
+        models.storage.close()
+        self.engine = models.storage._DBStorage__engine
+        self.statements = []
+        event.listen(self.engine, "before_cursor_execute", self.count)
+
+    def tearDown(self):
+        """Stop counting and remove the state"""
+        event.remove(self.engine, "before_cursor_execute", self.count)
+        models.storage.delete(models.storage.get(State, self.state.id))
+        models.storage.save()
+        models.storage.close()
+
+    def count(self, conn, cursor, statement, *args):
+        """Record one executed statement"""
+        self.statements.append(statement)
+
+    def test_get_cached(self):
+        """Test that a second session gets the object without a query"""
+        models.storage.get(State, self.state.id)
+        models.storage.close()
+        state = models.storage.get(State, self.state.id)
+        self.assertEqual(state.name, "Cached")
+        self.assertEqual(len(self.statements), 1)
+        state.name = "Renamed"
+        state.save()
+        models.storage.close()
+        self.statements.clear()
+        self.assertEqual(models.storage.get(State, self.state.id).name,
+                         "Renamed")
+        self.assertEqual(len(self.statements), 1)
+
+    def test_get_deleted(self):
+        """Test that deleting an object drops it from the cache"""
+        extra = State(name="Deleted")
+        extra.save()
+        models.storage.close()
+        models.storage.delete(models.storage.get(State, extra.id))
+        models.storage.save()
+        models.storage.close()
+        self.assertIsNone(models.storage.get(State, extra.id))
+
+    def test_get_after_foreign_write(self):
+        """Test that generation() drops the cached objects of a class
+        another process changed"""
+        models.storage.get(State, self.state.id)
+        models.storage.generation(State)
+        models.storage.close()
+        with self.engine.begin() as conn:
+            conn.execute(text("UPDATE states SET name = 'Foreign' "
+                              "WHERE id = :id"), {"id": self.state.id})
+            conn.execute(text("UPDATE generations SET generation = "
+                              "generation + 1 WHERE class_name = 'State'"))
+        self.assertEqual(models.storage.get(State, self.state.id).name,
+                         "Cached")
+        models.storage.close()
+        models.storage.generation(State)
+        self.assertEqual(models.storage.get(State, self.state.id).name,
+                         "Foreign")
+
+    def test_get_after_own_write(self):
+        """Test that a commit of this process keeps the cached objects of
+        the class it did not change"""
+        other = State(name="Other")
+        other.save()
+        models.storage.close()
+        models.storage.generation(State)
+        models.storage.get(State, self.state.id)
+        models.storage.close()
+        other.name = "Renamed"
+        models.storage.new(other)
+        models.storage.save()
+        models.storage.close()
+        models.storage.generation(State)
+        self.statements.clear()
+        models.storage.get(State, self.state.id)
+        self.assertEqual(len(self.statements), 0)
+        models.storage.delete(models.storage.get(State, other.id))
+        models.storage.save()
+
+    def test_get_invalidated(self):
+        """Test that an object read before another commit dropped it from
+        the cache is not cached"""
+        models.storage.all(City)
+        models.storage._DBStorage__invalidate([("State", self.state.id,
+                                                events.UPDATED)])
+        self.statements.clear()
+        models.storage.get(State, self.state.id)
+        models.storage.close()
+        models.storage.get(State, self.state.id)
+        self.assertEqual(len(self.statements), 2)
+        models.storage.close()
+        self.statements.clear()
+        models.storage.get(State, self.state.id)
+        self.assertEqual(len(self.statements), 0)
+
+
+@unittest.skipIf(models.storage_t != 'db', "not testing db storage")
+class TestDBStorageCount(unittest.TestCase):
+    """Test that count() is served from counters kept by save()"""
+    def setUp(self):
+        """Expire the counts, then count statements"""
+        models.storage._DBStorage__counted = None
+        self.engine = models.storage._DBStorage__engine
+        self.statements = []
+        event.listen(self.engine, "before_cursor_execute", self.count)
+
+    def tearDown(self):
+        """Stop counting statements"""
+        event.remove(self.engine, "before_cursor_execute", self.count)
+
+    def count(self, conn, cursor, statement, *args):
+        """Record one executed statement"""
+        self.statements.append(statement)
+
+    def test_count_save(self):
+        """Test that saving adjusts the counts without counting again"""
+        total = models.storage.count()
+        states = models.storage.count(State)
+        self.assertEqual(models.storage.count("City"), models.storage.count(
+            City))
+        self.assertEqual(len(self.statements), 1)
+        state = State(name="Counted")
+        state.save()
+        self.assertEqual(models.storage.count(State), states + 1)
+        self.assertEqual(models.storage.count(), total + 1)
+        models.storage.delete(state)
+        models.storage.save()
+        self.assertEqual(models.storage.count(State), states)
+        counts = [sql for sql in self.statements if "count(" in sql]
+        self.assertEqual(len(counts), 1)
+
+
+@unittest.skipIf(models.storage_t != 'db', "not testing db storage")
+class TestDBStorageEvents(unittest.TestCase):
+    """Test the change sets DBStorage publishes on commit"""
+    def setUp(self):
+        """Subscribe to the changes"""
+        self.got = []
+        models.storage.subscribe(self.got.append)
+
+    def tearDown(self):
+        """Unsubscribe and roll back what a test left"""
+        models.storage.unsubscribe(self.got.append)
+        models.storage.close()
+
+    def test_commit(self):
+        """Test that a commit publishes one change per object"""
+        state = State(name="Published")
+        models.storage.new(state)
+        models.storage.save()
+        state.name = "Renamed"
+        city = City(name="Published", state_id=state.id)
+        models.storage.new(city)
+        models.storage.save()
+        models.storage.delete(city)
+        models.storage.delete(state)
+        models.storage.save()
+        self.assertEqual([sorted(changes) for changes in self.got],
+                         [[("State", state.id, "created")],
+                          [("City", city.id, "created"),
+                           ("State", state.id, "updated")],
+                          [("City", city.id, "deleted"),
+                           ("State", state.id, "deleted")]])
+
+    def test_rollback(self):
+        """Test that a rolled back transaction publishes nothing"""
+        models.storage.new(State(name="Rolled back"))
+        models.storage._DBStorage__session.flush()
+        models.storage.close()
+        models.storage.new(State(name="Committed"))
+        models.storage.save()
+        self.assertEqual(len(self.got), 1)
+        self.assertEqual(len(self.got[0]), 1)
+        models.storage.delete(models.storage.get(State,
+                                                 list(self.got[0])[0][1]))
+        models.storage.save()
+
+    def test_insert(self):
+        """Test that rows added by insert() are published on save()"""
+        models.storage.insert(State, [{"id": "published-1", "name": "One"},
+                                      {"id": "published-2", "name": "Two"}])
+        models.storage.save()
+        self.assertEqual(sorted(self.got[0]),
+                         [("State", "published-1", "created"),
+                          ("State", "published-2", "created")])
+        for id in ("published-1", "published-2"):
+            models.storage.delete(models.storage.get(State, id))
+        models.storage.save()
+
+
+class TestDBStoragePool(unittest.TestCase):
+    """Test the pool settings and metrics, with SQLite standing in for MySQL"""
+    env = {"HBNB_DB_POOL_SIZE": "1", "HBNB_DB_MAX_OVERFLOW": "1",
+           "HBNB_DB_POOL_RECYCLE": "3600", "HBNB_DB_POOL_TIMEOUT": "0.1",
+           "HBNB_DB_POOL_PRE_PING": "true"}
+
+    def setUp(self):
+        """Create a pooled SQLite engine from the environment settings"""
+        self.dir = tempfile.TemporaryDirectory()
+        with mock.patch.dict(os.environ, self.env):
+            self.options = db_storage.pool_options()
+        self.engine = create_engine("sqlite:///{}/pool.db".format(
+            self.dir.name), poolclass=QueuePool, **self.options)
+        self.metrics = db_storage.PoolMetrics(self.engine)
+
+    def tearDown(self):
+        """Dispose of the engine and its database"""
+        self.engine.dispose()
+        self.dir.cleanup()
+
+    def test_pool_options(self):
+        """Test that the environment maps to create_engine() arguments"""
+        self.assertEqual(self.options, {"pool_size": 1, "max_overflow": 1,
+                                        "pool_recycle": 3600,
+                                        "pool_timeout": 0.1,
+                                        "pool_pre_ping": True})
+        with mock.patch.dict(os.environ, {}, clear=True):
+            self.assertEqual(db_storage.pool_options(), {})
+
+    def test_metrics(self):
+        """Test that checkouts and checkins are counted"""
+        first = self.engine.connect()
+        second = self.engine.connect()
+        first.execute(text("SELECT 1"))
+        status = self.metrics.status()
+        self.assertEqual(status["checkouts"], 2)
+        self.assertEqual(status["checkedout"], 2)
+        self.assertEqual(status["overflow"], 1)
+        first.close()
+        second.close()
+        status = self.metrics.status()
+        self.assertEqual(status["checkins"], 2)
+        self.assertEqual(status["connects"], 2)
+        self.assertEqual(status["pool"], "QueuePool")
+
+    def test_pool_timeout(self):
+        """Test that a full pool gives up after the configured timeout"""
+        held = [self.engine.connect(), self.engine.connect()]
+        with self.assertRaises(exc.TimeoutError):
+            self.engine.connect()
+        for conn in held:
+            conn.close()
+
+
+class TestDBStorageSQLite(unittest.TestCase):
+    """Test the engines of the sqlite storage type"""
+
+    def test_file_pragmas(self):
+        """Test that a database file is opened in WAL mode with FKs on"""
+        with tempfile.TemporaryDirectory() as tmp:
+            engine = db_storage.sqlite_engine(os.path.join(tmp, "hbnb.db"))
+            with engine.connect() as conn:
+                pragma = conn.exec_driver_sql
+                self.assertEqual(pragma("PRAGMA journal_mode").scalar(),
+                                 "wal")
+                self.assertEqual(pragma("PRAGMA foreign_keys").scalar(), 1)
+                self.assertEqual(pragma("PRAGMA synchronous").scalar(), 1)
+            engine.dispose()
+
+    def test_memory_shared(self):
+        """Test that all connections see the same in-memory database"""
+        engine = db_storage.sqlite_engine(":memory:")
+        with engine.begin() as conn:
+            conn.execute(text("CREATE TABLE t (x INTEGER)"))
+            conn.execute(text("INSERT INTO t VALUES (1)"))
+        with engine.connect() as conn:
+            self.assertEqual(conn.execute(text("SELECT x FROM t")).scalar(),
+                             1)
+        engine.dispose()
@@ -0,0 +1,118 @@
+#!/usr/bin/python3
+"""
+Contains the TestEventsDocs, TestChangeSet and TestEventBus classes
+"""
+
+import inspect
+from models.engine import events
+from models.engine.events import ChangeSet, EventBus
+import pycodestyle
+import threading
+import unittest
+
+
+class TestEventsDocs(unittest.TestCase):
+    """Tests to check the documentation and style of the events module"""
+    def test_pep8_conformance_events(self):
+        """Test that models/engine/events.py conforms to PEP8."""
+        pep8s = pycodestyle.StyleGuide(quiet=True)
+        result = pep8s.check_files(['models/engine/events.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_events_docstrings(self):
+        """Test for the presence of docstrings in the events module"""
+        self.assertTrue(len(events.__doc__) >= 1)
+        for cls in (ChangeSet, EventBus):
+            self.assertTrue(len(cls.__doc__) >= 1)
+            for name, func in inspect.getmembers(cls, inspect.isfunction):
+                self.assertTrue(func.__doc__,
+                                "{:s} needs a docstring".format(name))
+
+
+class TestChangeSet(unittest.TestCase):
+    """Test that ChangeSet keeps one change per object"""
+    def test_coalesce(self):
+        """Test that successive ops on an object add up to one"""
+        changes = ChangeSet()
+        self.assertEqual(len(changes), 0)
+        self.assertIsNone(changes.started)
+        changes.add("State", "1", events.CREATED)
+        changes.add("State", "1", events.UPDATED)
+        changes.add("State", "2", events.UPDATED)
+        changes.add("State", "2", events.DELETED)
+        changes.add("City", "3", events.DELETED)
+        changes.add("City", "3", events.CREATED)
+        self.assertIsNotNone(changes.started)
+        self.assertEqual(list(changes), [("State", "1", events.CREATED),
+                                         ("State", "2", events.DELETED),
+                                         ("City", "3", events.UPDATED)])
+
+    def test_cancel(self):
+        """Test that an object created then deleted disappears"""
+        changes = ChangeSet()
+        changes.add("State", "1", events.CREATED)
+        changes.add("State", "1", events.DELETED)
+        self.assertEqual(len(changes), 0)
+        self.assertEqual(list(changes), [])
+
+
+class TestEventBus(unittest.TestCase):
+    """Test the delivery of change sets by EventBus"""
+    def changes(self, *ids):
+        """Return a ChangeSet updating the states of ids"""
+        changes = ChangeSet()
+        for id in ids:
+            changes.add("State", id, events.UPDATED)
+        return changes
+
+    def test_sync(self):
+        """Test that synchronous subscribers get every change set"""
+        bus = EventBus()
+        self.assertFalse(bus)
+        got = []
+        bus.subscribe(got.append)
+        self.assertTrue(bus)
+        first = self.changes("1", "2")
+        bus.publish(first)
+        bus.publish(ChangeSet())
+        self.assertEqual(got, [first])
+        bus.unsubscribe(got.append)
+        self.assertFalse(bus)
+        bus.publish(self.changes("3"))
+        self.assertEqual(got, [first])
+        self.assertEqual(bus.status(), {"subscribers": 0, "published": 1,
+                                        "events": 2, "errors": 0})
+
+    def test_async(self):
+        """Test that asynchronous subscribers get the change sets in order
+        from another thread"""
+        bus = EventBus()
+        got = []
+        threads = set()
+
+        def subscriber(changes):
+            """Record the change set and the thread delivering it"""
+            got.append(changes)
+            threads.add(threading.current_thread())
+        bus.subscribe(subscriber, asynchronous=True)
+        sent = [self.changes(str(i)) for i in range(10)]
+        for changes in sent:
+            bus.publish(changes)
+        bus.join()
+        self.assertEqual(got, sent)
+        self.assertNotIn(threading.current_thread(), threads)
+
+    def test_errors(self):
+        """Test that a failing subscriber does not stop the others"""
+        bus = EventBus()
+        got = []
+
+        def failing(changes):
+            """Raise on every change set"""
+            raise ValueError("failing subscriber")
+        bus.subscribe(failing)
+        bus.subscribe(got.append)
+        bus.publish(self.changes("1"))
+        self.assertEqual(len(got), 1)
+        self.assertEqual(bus.status()["errors"], 1)
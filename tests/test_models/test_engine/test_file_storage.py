@@ -17,7 +17,10 @@ from models.user import User
 import json
 import os
 import pycodestyle
+import subprocess
+import sys
 import unittest
+from unittest import mock
 FileStorage = file_storage.FileStorage
 classes = {"Amenity": Amenity, "BaseModel": BaseModel, "City": City,
            "Place": Place, "Review": Review, "State": State, "User": User}
@@ -130,4 +133,528 @@ class TestFileStorage(unittest.TestCase):
         models.storage.new(state)
         models.storage.save()
         new_count = models.storage.count(State)
-        self.assertEqual(new_count, initial_count + 1)
\ No newline at end of file
+        self.assertEqual(new_count, initial_count + 1)
+
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def test_all_cls_class_or_name(self):
+        """Test that all(cls) accepts a class or a class name"""
+        storage = FileStorage()
+        state = State(name="Indexed")
+        storage.new(state)
+        key = "State." + state.id
+        self.assertIn(key, storage.all(State))
+        self.assertIn(key, storage.all("State"))
+        self.assertNotIn(key, storage.all(City))
+        self.assertIsNot(storage.all(State), storage.all(State))
+        storage.delete(state)
+        self.assertNotIn(key, storage.all(State))
+
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def test_count_cls_class_or_name(self):
+        """Test that count(cls) follows new() and delete()"""
+        storage = FileStorage()
+        initial = storage.count(City)
+        city = City(name="Indexed")
+        storage.new(city)
+        self.assertEqual(storage.count(City), initial + 1)
+        self.assertEqual(storage.count("City"), initial + 1)
+        storage.delete(city)
+        self.assertEqual(storage.count(City), initial)
+
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def test_class_index_follows_objects(self):
+        """Test that all(cls) stays right when __objects is replaced"""
+        storage = FileStorage()
+        save = FileStorage._FileStorage__objects
+        amenity = Amenity()
+        FileStorage._FileStorage__objects = {
+            "Amenity." + amenity.id: amenity}
+        try:
+            self.assertEqual(storage.count(Amenity), 1)
+            self.assertEqual(list(storage.all(Amenity).values()), [amenity])
+        finally:
+            FileStorage._FileStorage__objects = save
+        self.assertNotIn("Amenity." + amenity.id, storage.all(Amenity))
+
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def test_close_reloads_only_changed_file(self):
+        """Test that close() only re-reads file.json after it changed"""
+        storage = FileStorage()
+        state = State(name="Written elsewhere")
+        storage.save()
+        with open("file.json", "r") as f:
+            js = json.load(f)
+        js["State." + state.id] = state.to_dict()
+        storage.close()
+        self.assertNotIn("State." + state.id, storage.all(State))
+        generation = storage.generation(State)
+        with open("file.json", "w") as f:
+            json.dump(js, f)
+        os.utime("file.json", ns=(0, 0))
+        storage.close()
+        self.assertIn("State." + state.id, storage.all(State))
+        self.assertNotEqual(storage.generation(State), generation)
+        storage.delete(storage.get(State, state.id))
+        storage.save()
+
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def test_reload_force(self):
+        """Test that reload(force=True) re-reads an unchanged file.json"""
+        storage = FileStorage()
+        state = State(name="Forced")
+        storage.new(state)
+        storage.save()
+        storage.delete(state)
+        storage.reload()
+        self.assertIsNone(storage.get(State, state.id))
+        storage.reload(force=True)
+        self.assertIsNotNone(storage.get(State, state.id))
+        storage.delete(storage.get(State, state.id))
+        storage.save()
+
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def test_filter_by_follows_reassignment(self):
+        """Test that filter_by() sees a foreign key being reassigned"""
+        storage = FileStorage()
+        first = State(name="First")
+        second = State(name="Second")
+        city = City(name="Moving", state_id=first.id)
+        storage.new(city)
+        self.assertEqual(storage.filter_by(City, state_id=first.id), [city])
+        city.state_id = second.id
+        self.assertEqual(storage.filter_by(City, state_id=first.id), [])
+        self.assertEqual(storage.filter_by("City", state_id=second.id),
+                         [city])
+        self.assertEqual(storage.filter_by(City, state_id=second.id,
+                                           name="Other"), [])
+        storage.delete(city)
+        self.assertEqual(storage.filter_by(City, state_id=second.id), [])
+
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def test_relationship_properties(self):
+        """Test the file mode relationship getters read the indexes"""
+        storage = FileStorage()
+        state = State(name="Parent")
+        city = City(state_id=state.id)
+        user = User()
+        place = Place(city_id=city.id, user_id=user.id)
+        review = Review(place_id=place.id, user_id=user.id)
+        for obj in (state, city, user, place, review):
+            storage.new(obj)
+        self.assertEqual(state.cities, [city])
+        self.assertEqual(city.places, [place])
+        self.assertEqual(place.reviews, [review])
+        self.assertEqual(user.places, [place])
+        self.assertEqual(user.reviews, [review])
+        for obj in (state, city, user, place, review):
+            storage.delete(obj)
+
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def test_page(self):
+        """Test that page() walks objects by id after a cursor"""
+        storage = FileStorage()
+        state = State(name="Paged")
+        storage.new(state)
+        cities = [City(state_id=state.id) for i in range(5)]
+        for city in cities[:4]:
+            storage.new(city)
+        ids = sorted(city.id for city in storage.all(City).values())
+        first = storage.page(City, 2)
+        self.assertEqual([city.id for city in first], ids[:2])
+        storage.new(cities[4])
+        ids = sorted(city.id for city in storage.all(City).values())
+        rest = storage.page(City, len(ids), first[-1].id)
+        self.assertEqual([city.id for city in rest],
+                         [id for id in ids if id > first[-1].id])
+        own = sorted(city.id for city in cities)
+        self.assertEqual([c.id for c in storage.page(City, 3, own[0],
+                                                     state_id=state.id)],
+                         own[1:4])
+        for obj in cities + [state]:
+            storage.delete(obj)
+        self.assertEqual(storage.page(City, 10, after=own[0],
+                                      state_id=state.id), [])
+
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def test_stream(self):
+        """Test that stream() iterates a snapshot of the matching objects"""
+        storage = FileStorage()
+        state = State(name="Streamed")
+        cities = [City(state_id=state.id) for i in range(3)]
+        for city in cities:
+            storage.new(city)
+        streamed = storage.stream(City, state_id=state.id)
+        self.assertEqual(next(streamed), cities[0])
+        all_cities = storage.stream("City")
+        storage.delete(cities[2])
+        self.assertEqual(list(streamed), cities[1:])
+        self.assertEqual(len(list(all_cities)), storage.count(City) + 1)
+        for city in cities:
+            storage.delete(city)
+
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def test_where(self):
+        """Test that where() filters ranges on columns kept up to date"""
+        storage = FileStorage()
+        city = City(name="Ranged")
+        places = [Place(city_id=city.id, price_by_night=price, max_guest=2)
+                  for price in (40, 80, 120)]
+        for place in places:
+            storage.new(place)
+        found = storage.where(Place, price_by_night=(50, 150))
+        self.assertEqual(found, places[1:])
+        self.assertEqual(storage.where("Place", city_id=city.id,
+                                       price_by_night=(None, 80)),
+                         places[:2])
+        self.assertEqual(storage.where(Place, city_id=city.id,
+                                       price_by_night=120), places[2:])
+        places[0].price_by_night = 100
+        storage.delete(places[2])
+        self.assertEqual(storage.where(Place, price_by_night=(50, 150),
+                                       max_guest=(2, 2)), places[:2])
+        self.assertEqual(storage.where(Place, city_id=city.id,
+                                       name=("a", "z")), [])
+        for place in places[:2]:
+            storage.delete(place)
+        self.assertEqual(storage.where(Place, city_id=city.id,
+                                       price_by_night=(None, None)), [])
+
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def test_near_and_within(self):
+        """Test that the spatial index follows coordinates changes"""
+        storage = FileStorage()
+        paris = Place(name="Paris", latitude=48.8566, longitude=2.3522)
+        london = Place(name="London", latitude=51.5074, longitude=-0.1278)
+        for place in (paris, london):
+            storage.new(place)
+        self.assertEqual(storage.near(Place, 50, 1, 400), [paris, london])
+        self.assertEqual(storage.within("Place", 48, 0, 50, 5), [paris])
+        paris.latitude = 51.4
+        self.assertEqual(storage.within(Place, 48, 0, 50, 5), [])
+        self.assertEqual(storage.near(Place, 51.5, 0, 200), [london, paris])
+        storage.delete(london)
+        self.assertEqual(storage.near(Place, 51.5, 0, 200), [paris])
+        storage.delete(paris)
+
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def test_text_search(self):
+        """Test that the full-text index follows text changes"""
+        storage = FileStorage()
+        loft = Place(name="Loft", description="Zyxwv sunny view")
+        review = Review(text="Zyxwv was great")
+        for obj in (loft, review):
+            storage.new(obj)
+        self.assertEqual(storage.search(Place, "ZYXWV loft"), [loft])
+        self.assertEqual(storage.search("Review", "zyxwv"), [review])
+        loft.description = "Dark"
+        self.assertEqual(storage.search(Place, "zyxwv"), [])
+        self.assertEqual(storage.search(Place, "dark loft", 1), [loft])
+        storage.delete(review)
+        self.assertEqual(storage.search(Review, "zyxwv"), [])
+        storage.delete(loft)
+
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def test_generation(self):
+        """Test that generation() changes with the objects of its class"""
+        storage = FileStorage()
+        state = State(name="Generated")
+        before = storage.generation(State)
+        storage.new(state)
+        added = storage.generation("State")
+        self.assertNotEqual(added, before)
+        city_gen = storage.generation(City)
+        state.name = "Renamed"
+        state.save()
+        self.assertNotEqual(storage.generation(State), added)
+        self.assertEqual(storage.generation(City), city_gen)
+        saved = storage.generation(State)
+        both = storage.generation(State, City)
+        storage.delete(state)
+        self.assertNotEqual(storage.generation(State), saved)
+        self.assertNotEqual(storage.generation(State, City), both)
+
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def test_subscribe(self):
+        """Test that save() publishes the changes made since the last one"""
+        storage = FileStorage()
+        got = []
+        storage.subscribe(got.append)
+        try:
+            state = State(name="Published")
+            storage.new(state)
+            state.name = "Renamed"
+            storage.new(state)
+            dropped = State(name="Dropped")
+            storage.new(dropped)
+            storage.delete(dropped)
+            storage.save()
+            storage.delete(state)
+            storage.save()
+            storage.save()
+        finally:
+            storage.unsubscribe(got.append)
+        self.assertEqual([list(changes) for changes in got],
+                         [[("State", state.id, "created")],
+                          [("State", state.id, "deleted")]])
+
+
+@unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+class TestFileStorageJournal(unittest.TestCase):
+    """Test the journal persistence mode of FileStorage"""
+    def setUp(self):
+        """Point FileStorage at a scratch file in journal mode"""
+        self.saved = {attr: getattr(FileStorage, "_FileStorage__" + attr)
+                      for attr in ("file_path", "objects", "journal",
+                                   "journal_limit", "stamp")}
+        FileStorage._FileStorage__file_path = "file_journal_test.json"
+        FileStorage._FileStorage__objects = {}
+        FileStorage._FileStorage__journal = True
+        FileStorage._FileStorage__journal_len = 0
+        self.storage = FileStorage()
+
+    def tearDown(self):
+        """Restore FileStorage and remove the scratch files"""
+        for path in ("file_journal_test.json",
+                     "file_journal_test.json.journal"):
+            if os.path.exists(path):
+                os.remove(path)
+        for attr, value in self.saved.items():
+            setattr(FileStorage, "_FileStorage__" + attr, value)
+        FileStorage._FileStorage__journal_len = 0
+        FileStorage._FileStorage__pending.clear()
+
+    def test_save_appends_records(self):
+        """Test that save() appends one record per new or deleted object"""
+        kept = State(name="Kept")
+        gone = State(name="Gone")
+        self.storage.new(kept)
+        self.storage.new(gone)
+        self.storage.save()
+        self.storage.delete(gone)
+        self.storage.save()
+        self.assertFalse(os.path.exists("file_journal_test.json"))
+        with open("file_journal_test.json.journal", "r") as f:
+            records = [json.loads(line) for line in f]
+        self.assertEqual(len(records), 3)
+        self.assertEqual(records[-1], {"key": "State." + gone.id,
+                                       "base": None, "obj": None})
+
+    def test_reload_replays_journal(self):
+        """Test that reload() replays the journal over the JSON file"""
+        kept = State(name="Kept")
+        gone = State(name="Gone")
+        self.storage.new(kept)
+        self.storage.new(gone)
+        self.storage.save()
+        self.storage.delete(gone)
+        self.storage.save()
+        FileStorage._FileStorage__objects = {}
+        self.storage.reload(force=True)
+        self.assertEqual(self.storage.get(State, kept.id).name, "Kept")
+        self.assertIsNone(self.storage.get(State, gone.id))
+
+    def test_torn_record(self):
+        """Test that saves after a torn record survive a restart"""
+        first = State(name="a")
+        self.storage.new(first)
+        self.storage.save()
+        with open("file_journal_test.json.journal", "a") as f:
+            f.write('{"key": "State.torn", "obj": {"__cla')
+        FileStorage._FileStorage__objects = {}
+        self.storage.reload(force=True)
+        self.assertEqual(self.storage.count(State), 1)
+        for name in ("b", "c"):
+            self.storage.new(State(name=name))
+            self.storage.save()
+        FileStorage._FileStorage__objects = {}
+        self.storage.reload(force=True)
+        self.assertEqual(sorted(state.name for state in
+                                self.storage.all(State).values()),
+                         ["a", "b", "c"])
+
+    def test_compaction(self):
+        """Test that a full journal is folded back into the JSON file"""
+        FileStorage._FileStorage__journal_limit = 2
+        states = [State(name=str(i)) for i in range(3)]
+        for state in states:
+            self.storage.new(state)
+            self.storage.save()
+        self.assertFalse(os.path.exists("file_journal_test.json.journal"))
+        with open("file_journal_test.json", "r") as f:
+            self.assertEqual(len(json.load(f)), 3)
+        FileStorage._FileStorage__objects = {}
+        self.storage.reload(force=True)
+        self.assertEqual(self.storage.count(State), 3)
+
+    def test_compaction_interrupted(self):
+        """Test that a journal a compaction could not remove is not
+        replayed over the JSON file that compaction wrote"""
+        FileStorage._FileStorage__journal_limit = 2
+        kept = State(name="Old")
+        gone = State(name="Gone")
+        self.storage.new(kept)
+        self.storage.new(gone)
+        self.storage.save()
+        kept.name = "New"
+        self.storage.new(kept)
+        self.storage.delete(gone)
+        with mock.patch.object(file_storage.os, "remove",
+                               side_effect=OSError("stopped")):
+            with self.assertRaises(OSError):
+                self.storage.save()
+        self.assertTrue(os.path.exists("file_journal_test.json.journal"))
+        FileStorage._FileStorage__pending.clear()
+        FileStorage._FileStorage__objects = {}
+        self.storage.reload(force=True)
+        self.assertEqual(self.storage.get(State, kept.id).name, "New")
+        self.assertIsNone(self.storage.get(State, gone.id))
+        with open("file_journal_test.json.journal", "r") as f:
+            self.assertEqual(f.read(), "")
+        self.storage.new(State(name="Later"))
+        self.storage.save()
+        FileStorage._FileStorage__objects = {}
+        self.storage.reload(force=True)
+        self.assertEqual(self.storage.count(State), 2)
+
+
+@unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+class TestFileStorageWrites(unittest.TestCase):
+    """Test how FileStorage writes and reads back file.json"""
+    def setUp(self):
+        """Point FileStorage at a scratch file in snapshot mode"""
+        self.saved = {attr: getattr(FileStorage, "_FileStorage__" + attr)
+                      for attr in ("file_path", "objects", "journal",
+                                   "commit_window", "stamp", "compact")}
+        FileStorage._FileStorage__file_path = "file_writes_test.json"
+        FileStorage._FileStorage__objects = {}
+        FileStorage._FileStorage__journal = False
+        self.storage = FileStorage()
+
+    def tearDown(self):
+        """Restore FileStorage and remove the scratch file"""
+        self.storage.flush()
+        if os.path.exists("file_writes_test.json"):
+            os.remove("file_writes_test.json")
+        for attr, value in self.saved.items():
+            setattr(FileStorage, "_FileStorage__" + attr, value)
+
+    def test_save_leaves_no_temporary_file(self):
+        """Test that save() renames its temporary file over file.json"""
+        self.storage.new(State(name="Atomic"))
+        self.storage.save()
+        self.assertEqual([name for name in os.listdir(".")
+                          if name.startswith("file_writes_test.json")],
+                         ["file_writes_test.json"])
+
+    def test_reload_corrupt_file_raises(self):
+        """Test that reload() does not turn a corrupt file into no data"""
+        with open("file_writes_test.json", "w") as f:
+            f.write('{"State.1": {"__cla')
+        with self.assertRaises(ValueError):
+            self.storage.reload(force=True)
+
+    def test_password_survives_reload(self):
+        """Test that the password hash is written and not hashed again"""
+        user = User(email="a@b.c", password="pwd")
+        self.storage.new(user)
+        self.storage.save()
+        FileStorage._FileStorage__objects = {}
+        self.storage.reload(force=True)
+        self.assertEqual(self.storage.get(User, user.id).password,
+                         user.password)
+
+    def test_compact_reload(self):
+        """Test that compact mode keeps attributes in slots and shares
+        repeated values, not behavior"""
+        FileStorage._FileStorage__compact = True
+        place = Place(city_id="0001", user_id="0002", amenity_ids=["0003"])
+        reviews = [Review(place_id=place.id, user_id="0002", text=str(i))
+                   for i in range(2)]
+        for obj in [place] + reviews:
+            obj.updated_at = obj.created_at
+            self.storage.new(obj)
+        self.storage.save()
+        FileStorage._FileStorage__objects = {}
+        self.storage.reload(force=True)
+        loaded = [self.storage.get(Review, review.id) for review in reviews]
+        self.assertIsNot(type(loaded[0]), Review)
+        self.assertIs(type(loaded[0]), type(loaded[1]))
+        self.assertIs(loaded[0].place_id, loaded[1].place_id)
+        self.assertIs(loaded[0].user_id,
+                      self.storage.get(Place, place.id).user_id)
+        self.assertIs(loaded[0].updated_at, loaded[0].created_at)
+        self.assertEqual(self.storage.filter_by(Review, place_id=place.id),
+                         [loaded[0], loaded[1]])
+        for review, copy in zip(reviews, loaded):
+            self.assertEqual(copy.to_dict(), review.to_dict())
+            self.assertEqual(str(copy), str(Review(**review.to_dict())))
+        loaded[1].place_id = "0004"
+        self.assertEqual(self.storage.filter_by(Review, place_id=place.id),
+                         [loaded[0]])
+        self.assertEqual(self.storage.filter_by(Review, place_id="0004"),
+                         [loaded[1]])
+        self.storage.new(loaded[1])
+        self.storage.save()
+        FileStorage._FileStorage__objects = {}
+        self.storage.reload(force=True)
+        self.assertEqual(self.storage.get(Review, reviews[1].id).place_id,
+                         "0004")
+
+    def test_delete_in_another_process(self):
+        """Test that an object another process deleted is gone after
+        close(), and that the next save() does not write it back"""
+        gone = State(name="Gone")
+        kept = State(name="Kept")
+        for state in (gone, kept):
+            self.storage.new(state)
+        self.storage.save()
+        code = ("from models.engine.file_storage import FileStorage\n"
+                "FileStorage._FileStorage__file_path = {!r}\n"
+                "storage = FileStorage()\n"
+                "storage.reload(force=True)\n"
+                "storage.delete(storage.get('State', {!r}))\n"
+                "storage.save()\n").format("file_writes_test.json", gone.id)
+        env = dict(os.environ, HBNB_TYPE_STORAGE="")
+        subprocess.run([sys.executable, "-c", code], env=env, check=True)
+        self.storage.close()
+        self.assertIsNone(self.storage.get(State, gone.id))
+        self.assertEqual(self.storage.get(State, kept.id).name, "Kept")
+        self.assertEqual(self.storage.filter_by(State, name="Gone"), [])
+        self.storage.new(State(name="Unrelated"))
+        self.storage.save()
+        with open("file_writes_test.json", "r") as f:
+            self.assertNotIn("State." + gone.id, json.load(f))
+
+    def test_commit_window_coalesces_saves(self):
+        """Test that saves within the commit window are written once"""
+        FileStorage._FileStorage__commit_window = 60
+        for i in range(3):
+            self.storage.new(State(name=str(i)))
+            self.storage.save()
+        self.assertFalse(os.path.exists("file_writes_test.json"))
+        self.storage.flush()
+        with open("file_writes_test.json", "r") as f:
+            self.assertEqual(len(json.load(f)), 3)
+
+    def test_commit_window_spans_close(self):
+        """Test that close() after each save() does not force the write, so
+        that saves of successive requests are still written once"""
+        FileStorage._FileStorage__commit_window = 60
+        writes = []
+        write = self.storage._FileStorage__write
+
+        def counted():
+            """Count the writes of file.json"""
+            writes.append(1)
+            write()
+        with mock.patch.object(self.storage, "_FileStorage__write", counted):
+            for i in range(2):
+                self.storage.new(State(name=str(i)))
+                self.storage.save()
+                self.storage.close()
+            self.assertEqual(self.storage.count(State), 2)
+            self.assertEqual(writes, [])
+            self.storage.flush()
+        self.assertEqual(len(writes), 1)
+        with open("file_writes_test.json", "r") as f:
+            self.assertEqual(len(json.load(f)), 2)
@@ -0,0 +1,97 @@
+#!/usr/bin/python3
+"""
+Contains the TestGeoDocs, TestGeo and TestGrid classes
+"""
+
+import inspect
+from models.engine import geo
+from models.engine.geo import Grid
+import pycodestyle
+import unittest
+
+
+class TestGeoDocs(unittest.TestCase):
+    """Tests to check the documentation and style of the geo module"""
+    def test_pep8_conformance_geo(self):
+        """Test that models/engine/geo.py conforms to PEP8."""
+        pep8s = pycodestyle.StyleGuide(quiet=True)
+        result = pep8s.check_files(['models/engine/geo.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_geo_docstrings(self):
+        """Test for the presence of docstrings in the geo module"""
+        self.assertTrue(len(geo.__doc__) >= 1)
+        self.assertTrue(len(Grid.__doc__) >= 1)
+        for name, func in inspect.getmembers(geo, inspect.isfunction) + \
+                inspect.getmembers(Grid, inspect.isfunction):
+            self.assertTrue(func.__doc__, "{:s} needs a docstring".format(
+                name))
+
+
+class TestGeo(unittest.TestCase):
+    """Test the geometry helpers"""
+    def test_distance(self):
+        """Test great-circle distances, across the antimeridian too"""
+        self.assertAlmostEqual(geo.distance(48.8566, 2.3522,
+                                            51.5074, -0.1278), 343.5, 0)
+        self.assertAlmostEqual(geo.distance(0, 179.5, 0, -179.5),
+                               geo.KM_PER_DEGREE, 6)
+
+    def test_around(self):
+        """Test the boxes around a circle"""
+        [(south, west, north, east)] = geo.around(0, 0, geo.KM_PER_DEGREE)
+        self.assertAlmostEqual(south, -1)
+        self.assertAlmostEqual(east, 1)
+        self.assertEqual(len(geo.around(10, 179.9, 100)), 2)
+        [box] = geo.around(89.5, 0, 100)
+        self.assertEqual(box[1:], (-180.0, 90.0, 180.0))
+
+    def test_centre(self):
+        """Test the centre of a box, across the antimeridian too"""
+        self.assertEqual(geo.centre(0, 10, 20, 30), (10, 20))
+        self.assertEqual(geo.centre(0, 170, 20, -170), (10, -180))
+
+    def test_coordinates(self):
+        """Test that invalid coordinates are rejected"""
+        self.assertEqual(geo.coordinates(1, 2), (1.0, 2.0))
+        self.assertIsNone(geo.coordinates(91, 0))
+        self.assertIsNone(geo.coordinates(0, "1"))
+        self.assertIsNone(geo.coordinates(None, 1))
+
+
+class TestGrid(unittest.TestCase):
+    """Test the Grid spatial index"""
+    def setUp(self):
+        """Index a few cities"""
+        self.grid = Grid()
+        self.points = {"paris": (48.8566, 2.3522),
+                       "london": (51.5074, -0.1278),
+                       "fiji": (-17.7, 178.1),
+                       "samoa": (-13.8, -172.1)}
+        for key, point in self.points.items():
+            self.grid.add(key, key, *point)
+
+    def test_within(self):
+        """Test box queries, across the antimeridian too"""
+        self.assertEqual(set(self.grid.within(40, -5, 55, 5)),
+                         {"paris", "london"})
+        self.assertEqual(set(self.grid.within(-20, 170, -10, -170)),
+                         {"fiji", "samoa"})
+        self.assertEqual(set(self.grid.within(-90, -180, 90, 180)),
+                         set(self.points))
+
+    def test_near(self):
+        """Test that near() sorts by distance and honours the radius"""
+        found = self.grid.near(50, 1, 400)
+        self.assertEqual([key for d, key, obj in found], ["paris", "london"])
+        self.assertEqual(self.grid.near(50, 1, 10), [])
+
+    def test_move_and_remove(self):
+        """Test that adding a key again moves it, bad coordinates drop it"""
+        self.grid.add("paris", "paris", -17.6, 178.0)
+        self.assertEqual(set(self.grid.within(40, -5, 55, 5)), {"london"})
+        self.grid.add("london", "london", None, None)
+        self.grid.remove("fiji")
+        self.assertEqual(len(self.grid), 2)
+        self.assertEqual(self.grid.point("paris"), (-17.6, 178.0))
@@ -0,0 +1,153 @@
+#!/usr/bin/python3
+"""
+Contains the TestSearchDocs and TestSearchPlaces classes
+"""
+
+import inspect
+import models
+from models.engine import search
+from models.amenity import Amenity
+from models.city import City
+from models.place import Place
+from models.state import State
+from models.user import User
+import pycodestyle
+import unittest
+from unittest import mock
+
+
+class TestSearchDocs(unittest.TestCase):
+    """Tests to check the documentation and style of the search module"""
+    def test_pep8_conformance_search(self):
+        """Test that models/engine/search.py conforms to PEP8."""
+        pep8s = pycodestyle.StyleGuide(quiet=True)
+        result = pep8s.check_files(['models/engine/search.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_search_func_docstrings(self):
+        """Test for the presence of docstrings in search functions"""
+        self.assertTrue(len(search.__doc__) >= 1)
+        for name, func in inspect.getmembers(search, inspect.isfunction):
+            self.assertTrue(func.__doc__, "{:s} needs a docstring".format(
+                name))
+
+
+@unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+class TestSearchPlaces(unittest.TestCase):
+    """Test search_places against the file storage indexes"""
+    def setUp(self):
+        """Create two states with a city and a place each"""
+        self.objs = []
+        self.user = self.add(User())
+        self.wifi = self.add(Amenity(name="Wifi"))
+        self.pool = self.add(Amenity(name="Pool"))
+        self.ca = self.add(State(name="California"))
+        self.ny = self.add(State(name="New York"))
+        self.sf = self.add(City(name="San Francisco", state_id=self.ca.id))
+        self.nyc = self.add(City(name="New York", state_id=self.ny.id))
+        self.loft = self.add(Place(city_id=self.sf.id, user_id=self.user.id,
+                                   name="Zyxwv loft",
+                                   amenity_ids=[self.wifi.id, self.pool.id],
+                                   price_by_night=150, max_guest=4,
+                                   latitude=37.77, longitude=-122.42))
+        self.flat = self.add(Place(city_id=self.nyc.id, user_id=self.user.id,
+                                   name="Zyxwv flat",
+                                   description="Zyxwv zyxwv view",
+                                   amenity_ids=[self.wifi.id],
+                                   price_by_night=90, max_guest=2,
+                                   latitude=40.71, longitude=-74.01))
+
+    def tearDown(self):
+        """Remove the objects of the test from storage"""
+        for obj in self.objs:
+            models.storage.delete(obj)
+
+    def add(self, obj):
+        """Put obj in storage and remember it for tearDown"""
+        models.storage.new(obj)
+        self.objs.append(obj)
+        return obj
+
+    def test_states_and_cities(self):
+        """Test that states and cities select the places of their cities"""
+        self.assertEqual(search.search_places(states=[self.ca.id]),
+                         [self.loft])
+        found = search.search_places(states=[self.ca.id],
+                                     cities=[self.nyc.id])
+        self.assertEqual(sorted(p.id for p in found),
+                         sorted([self.loft.id, self.flat.id]))
+
+    def test_amenities(self):
+        """Test that places must offer every amenity asked for"""
+        found = search.search_places(amenities=[self.wifi.id])
+        self.assertIn(self.loft, found)
+        self.assertIn(self.flat, found)
+        self.assertEqual(search.search_places(
+            cities=[self.nyc.id], amenities=[self.wifi.id, self.pool.id]), [])
+        self.assertEqual(search.search_places(
+            states=[self.ca.id, self.ny.id], amenities=[self.pool.id]),
+            [self.loft])
+
+    def test_amenity_link_changes(self):
+        """Test that relinking amenities is seen by the next search"""
+        self.flat.amenity_ids = self.flat.amenity_ids + [self.pool.id]
+        self.assertEqual(len(search.search_places(
+            states=[self.ca.id, self.ny.id], amenities=[self.pool.id])), 2)
+
+    def test_unknown_ids(self):
+        """Test that unknown locations are ignored, unknown amenities not"""
+        self.assertEqual(search.search_places(amenities=["nope"]), [])
+        self.assertEqual(search.search_places(
+            states=["nope"], amenities=[self.pool.id]), [self.loft])
+
+    def test_ranges(self):
+        """Test that ranges narrow the places down with or without ids"""
+        cheap = {"price_by_night": (None, 100)}
+        self.assertEqual(search.search_places(
+            states=[self.ca.id, self.ny.id], ranges=cheap), [self.flat])
+        self.assertEqual(search.search_places(
+            amenities=[self.wifi.id], ranges={"max_guest": (3, None)}),
+            [self.loft])
+        found = search.search_places(ranges={"price_by_night": (90, 150)})
+        self.assertIn(self.loft, found)
+        self.assertIn(self.flat, found)
+        self.assertEqual(search.search_places(
+            cities=[self.sf.id], ranges=dict(cheap, max_guest=(3, 3))), [])
+
+    def test_near_and_bbox(self):
+        """Test that areas keep their places, nearest first"""
+        self.assertEqual(search.search_places(near=(38, -100, 3000)),
+                         [self.loft, self.flat])
+        self.assertEqual(search.search_places(
+            amenities=[self.pool.id], near=(38, -100, 3000)), [self.loft])
+        self.assertEqual(search.search_places(near=(38, -100, 100)), [])
+        self.assertEqual(search.search_places(bbox=(30, -125, 45, -80)),
+                         [self.loft])
+        self.assertEqual(search.search_places(
+            states=[self.ca.id, self.ny.id], bbox=(30, -125, 45, -70)),
+            [self.flat, self.loft])
+
+    def test_q(self):
+        """Test that words keep places, the most relevant first"""
+        self.assertEqual(search.search_places(q="zyxwv"),
+                         [self.flat, self.loft])
+        self.assertEqual(search.search_places(q="zyxwv loft"),
+                         [self.loft, self.flat])
+        self.assertEqual(search.search_places(
+            amenities=[self.pool.id], q="zyxwv"), [self.loft])
+        self.assertEqual(search.search_places(
+            near=(38, -100, 3000), q="view"), [self.flat])
+        self.assertEqual(search.search_places(
+            q="zyxwv", ranges={"price_by_night": (None, 100)}), [self.flat])
+
+    def test_ranges_not_numbers(self):
+        """Test that values that are not numbers match no range, whether
+        the places are checked one by one or by where()"""
+        self.flat.price_by_night = "90"
+        cheap = {"price_by_night": (None, 100)}
+        for count in (1, 1000):
+            with self.subTest(count=count), mock.patch.object(
+                    models.storage, "count", return_value=count):
+                self.assertEqual(search.search_places(
+                    states=[self.ca.id, self.ny.id], ranges=cheap), [])
@@ -0,0 +1,85 @@
+#!/usr/bin/python3
+"""
+Contains the TestTextDocs, TestText and TestTextIndex classes
+"""
+
+import inspect
+from models.engine import text
+from models.engine.text import TextIndex
+import pycodestyle
+import unittest
+
+
+class TestTextDocs(unittest.TestCase):
+    """Tests to check the documentation and style of the text module"""
+    def test_pep8_conformance_text(self):
+        """Test that models/engine/text.py conforms to PEP8."""
+        pep8s = pycodestyle.StyleGuide(quiet=True)
+        result = pep8s.check_files(['models/engine/text.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_text_docstrings(self):
+        """Test for the presence of docstrings in the text module"""
+        self.assertTrue(len(text.__doc__) >= 1)
+        self.assertTrue(len(TextIndex.__doc__) >= 1)
+        for name, func in inspect.getmembers(text, inspect.isfunction) + \
+                inspect.getmembers(TextIndex, inspect.isfunction):
+            self.assertTrue(func.__doc__, "{:s} needs a docstring".format(
+                name))
+
+
+class TestText(unittest.TestCase):
+    """Test the tokenizer and the ranking helpers"""
+    def test_tokenize(self):
+        """Test that words are split on punctuation and case-folded"""
+        self.assertEqual(text.tokenize("Sunny, QUIET loft!"),
+                         ["sunny", "quiet", "loft"])
+        self.assertEqual(text.tokenize(None), [])
+
+    def test_document(self):
+        """Test that empty values do not show in a document"""
+        self.assertEqual(text.document(["Loft", None, "view"]),
+                         "Loft\n\nview")
+
+    def test_bm25(self):
+        """Test that rare terms and short documents score higher"""
+        self.assertGreater(text.bm25(1, 1, 100, 10, 10),
+                           text.bm25(1, 50, 100, 10, 10))
+        self.assertGreater(text.bm25(1, 1, 100, 5, 10),
+                           text.bm25(1, 1, 100, 20, 10))
+        self.assertGreater(text.bm25(3, 1, 100, 10, 10),
+                           text.bm25(1, 1, 100, 10, 10))
+
+    def test_rank(self):
+        """Test that rank() sorts best first and honours limit"""
+        scores = {"a": 1.0, "b": 3.0, "c": 2.0}
+        self.assertEqual(text.rank(scores), ["b", "c", "a"])
+        self.assertEqual(text.rank(scores, 2), ["b", "c"])
+
+
+class TestTextIndex(unittest.TestCase):
+    """Test the TextIndex inverted index"""
+    def setUp(self):
+        """Index three documents"""
+        self.index = TextIndex()
+        self.index.add("1", "loft", "Sunny loft near the park")
+        self.index.add("2", "cave", "Dark cave, no sun")
+        self.index.add("3", "flat", "Sunny sunny flat")
+
+    def test_search(self):
+        """Test that any word matches and the best match comes first"""
+        found = self.index.search("sunny park")
+        self.assertEqual([obj for key, obj in found], ["loft", "flat"])
+        self.assertEqual(self.index.search("SUN"), [("2", "cave")])
+        self.assertEqual(self.index.search("nothing"), [])
+        self.assertEqual(len(self.index.search("sunny", limit=1)), 1)
+
+    def test_replace_and_remove(self):
+        """Test that adding a key again replaces its text"""
+        self.index.add("1", "loft", "Quiet loft")
+        self.assertEqual(self.index.search("park"), [])
+        self.index.remove("3")
+        self.index.remove("missing")
+        self.assertEqual(self.index.search("sunny"), [])
+        self.assertEqual(len(self.index), 2)